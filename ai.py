@@ -1,6 +1,7 @@
 import time
 import random
 import requests
+import http_pool
 import json
 import os
 import math
@@ -235,7 +236,9 @@ def generate_image(greeting: str, persona: str, max_retries: int = 3) -> str | N
             download_attempts = 2
             for dl_attempt in range(download_attempts):
                 try:
-                    image_response = requests.get(image_url, timeout=20)
+                    image_response = http_pool.get(
+                        image_url, timeout=20, headers={"Accept": "image/*"}
+                    )
                     image_response.raise_for_status()
                     break
                 except requests.exceptions.Timeout:
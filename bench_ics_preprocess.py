@@ -0,0 +1,89 @@
+"""Benchmark the single-pass ICS preprocessor against the old regex passes.
+
+Builds synthetic feeds of a few sizes (CRLF line endings, a share of naive
+and empty DTSTART/DTEND values), runs both implementations on each and
+prints wall time and peak traced memory (on top of the input). The
+"bytes" row is the engine on a raw response body, with no decode/encode
+around it. Run with::
+
+    python bench_ics_preprocess.py [size_mb ...]
+
+Defaults to 5, 20 and 50 MB.
+"""
+
+import re
+import sys
+import time
+import tracemalloc
+
+from ics_preprocess import preprocess_ics_bytes
+
+
+def legacy_preprocess(content: str) -> str:
+    """The previous events.preprocess_ics_content(), minus logging."""
+    content = re.sub(r'DTSTART:(\d{8}T\d{6})$', r'DTSTART:\1Z', content, flags=re.MULTILINE)
+    content = re.sub(r'DTEND:(\d{8}T\d{6})$', r'DTEND:\1Z', content, flags=re.MULTILINE)
+    content = re.sub(r'DTSTART:\s*$', 'DTSTART:19700101T000000Z', content, flags=re.MULTILINE)
+    content = re.sub(r'DTEND:\s*$', 'DTEND:19700101T010000Z', content, flags=re.MULTILINE)
+    content = re.sub(r'[\x00]', '', content)
+    if 'BEGIN:VCALENDAR' not in content and 'BEGIN:VEVENT' in content:
+        content = 'BEGIN:VCALENDAR\r\nVERSION:2.0\r\n' + content + '\r\nEND:VCALENDAR\r\n'
+    return content.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def single_pass(content: str) -> str:
+    """What events.preprocess_ics_content() does now for a decoded feed."""
+    return preprocess_ics_bytes(content.encode("utf-8")).decode("utf-8", errors="replace")
+
+
+def synthetic_feed(size_mb: float) -> str:
+    events = []
+    total = 0
+    i = 0
+    while total < size_mb * 1_000_000:
+        day = (i % 28) + 1
+        dtstart = f"DTSTART:202501{day:02d}T090000" + ("" if i % 10 == 0 else "Z")
+        dtend = "DTEND:" if i % 50 == 0 else f"DTEND:202501{day:02d}T100000Z"
+        block = (
+            f"BEGIN:VEVENT\r\nUID:event-{i}@example.test\r\nSUMMARY:Lesson {i} – Mathematics\r\n"
+            f"{dtstart}\r\n{dtend}\r\nLOCATION:Room {i % 40}\r\n"
+            f"DESCRIPTION:Teacher: Example Person\\nGroup {i % 7}\r\nEND:VEVENT\r\n"
+        )
+        events.append(block)
+        total += len(block)
+        i += 1
+    return "BEGIN:VCALENDAR\r\nVERSION:2.0\r\n" + "".join(events) + "END:VCALENDAR\r\n"
+
+
+def measure(func, content) -> tuple[float, float]:
+    """Best-of-three wall time, then peak traced memory of one more run."""
+    elapsed = min(_timed(func, content) for _ in range(3))
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1_000_000
+
+
+def _timed(func, content) -> float:
+    started = time.perf_counter()
+    func(content)
+    return time.perf_counter() - started
+
+
+def main(sizes: list[float]) -> None:
+    print(f"{'feed':>8}  {'implementation':<24} {'time s':>7} {'peak MB':>8}")
+    for size_mb in sizes:
+        content = synthetic_feed(size_mb)
+        raw = content.encode("utf-8")
+        for name, func, arg in (
+            ("legacy regex passes", legacy_preprocess, content),
+            ("single pass (str)", single_pass, content),
+            ("single pass (bytes)", preprocess_ics_bytes, raw),
+        ):
+            elapsed, peak = measure(func, arg)
+            print(f"{len(raw) / 1_000_000:>6.1f}MB  {name:<24} {elapsed:>7.3f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main([float(arg) for arg in sys.argv[1:]] or [5.0, 20.0, 50.0])
@@ -8,12 +8,16 @@ import random
 
 from log import logger
 from events import (
-    load_calendar_sources,
+    start_calendar_source_loading,
+    sources_warming_up,
+    get_source_load_status,
     GROUPED_CALENDARS,
     USER_TAG_MAP,
     TAG_NAMES,
     TAG_COLORS,
-    get_events
+    get_events,
+    invalidate_event_cache,
+    flush_host_profiles,
 )
 from ai import generate_greeting, generate_image
 from commands import (
@@ -32,15 +36,39 @@ from tasks import (
 )
 from utils import get_today, get_monday_of_week, resolve_input_to_tags
 from environ import AI_TOGGLE
+from http_pool import close_async_session
+from quota_governor import INTERACTIVE, set_api_priority
 from views import PaginatedEmbedView
 
 # ╔═════════════════════════════════════════════════════════════╗
 # ║ 🤖 Discord Bot Initialization                               ║
 # ║ Configures the bot with necessary intents and slash system ║
 # ╚═════════════════════════════════════════════════════════════╝
+class CalendarCommandTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Someone is waiting on this reply: Google API calls made while
+        # handling it skip ahead of background polling in the quota queue
+        set_api_priority(INTERACTIVE)
+        return True
+
+
+class CalendarBot(commands.Bot):
+    async def setup_hook(self):
+        # Probe calendar sources in the background so the Discord login isn't
+        # held up by slow hosts; on_ready waits for them before starting tasks
+        start_calendar_source_loading()
+
+    async def close(self):
+        # Release the shared aiohttp session used for async calendar fetches
+        await close_async_session()
+        # Keep the per-host transfer counters gathered since the last periodic save
+        await asyncio.to_thread(flush_host_profiles)
+        await super().close()
+
+
 intents = discord.Intents.default()
 intents.members = True
-bot = commands.Bot(command_prefix="/", intents=intents)
+bot = CalendarBot(command_prefix="/", intents=intents, tree_cls=CalendarCommandTree)
 
 # Track initialization state to avoid duplicate startups
 bot.is_initialized = False
@@ -73,7 +101,9 @@ async def on_ready():
             synced = await bot.tree.sync()
             logger.info(f"Synced {len(synced)} commands.")
             
-            # Step 4: Initialize event snapshots
+            # Step 4: Wait for the background source load (commands answer
+            # "warming up" meanwhile), then initialize event snapshots
+            await start_calendar_source_loading()
             await initialize_event_snapshots()
             
             # Step 5: Start recurring tasks
@@ -121,6 +151,24 @@ async def on_resumed():
     logger.info("Bot connection resumed")
 
 
+# ╔═════════════════════════════════════════════════════════════╗
+# ║ ⏳ Warm-up replies                                          ║
+# ║ Answer commands that need calendars while sources load      ║
+# ╚═════════════════════════════════════════════════════════════╝
+def warming_up_message() -> str:
+    status = get_source_load_status()
+    total = status["ready_tags"] + len(status["pending_tags"])
+    progress = f" ({status['ready_tags']}/{total} tags ready)" if total else ""
+    return f"⏳ Still loading calendars{progress} — please try again in a moment."
+
+
+async def reply_warming_up(interaction: discord.Interaction) -> None:
+    if interaction.response.is_done():
+        await interaction.followup.send(warming_up_message(), ephemeral=True)
+    else:
+        await interaction.response.send_message(warming_up_message(), ephemeral=True)
+
+
 # ╔═════════════════════════════════════════════════════════════╗
 # ║ 📜 /herald                                                   ║
 # ║ Posts the weekly + daily event summaries for all tags       ║
@@ -131,6 +179,9 @@ async def on_resumed():
 )
 async def herald_command(interaction: discord.Interaction):
     try:
+        if sources_warming_up():
+            await reply_warming_up(interaction)
+            return
         await interaction.response.defer()
         today = get_today()
         monday = get_monday_of_week(today)
@@ -166,6 +217,11 @@ async def agenda_command(interaction: discord.Interaction, input: str, target: s
         today = get_today()
         tags = resolve_input_to_tags(target, TAG_NAMES, GROUPED_CALENDARS) if target.strip() else list(GROUPED_CALENDARS.keys())
 
+        # Without a target every tag is needed; with one, only an unresolved name waits
+        if sources_warming_up() and (not target.strip() or not tags):
+            await reply_warming_up(interaction)
+            return
+
         if not tags:
             await interaction.followup.send("No matching tags or names found.")
             return
@@ -221,6 +277,9 @@ async def search_command(
     tag: str = "",
 ):
     try:
+        if sources_warming_up() and tag not in GROUPED_CALENDARS:
+            await reply_warming_up(interaction)
+            return
         await interaction.response.defer()
         pages, epp = await search_events(query, days_ahead, tag or None)
 
@@ -315,7 +374,8 @@ async def greet_command(interaction: discord.Interaction):
 async def reload_command(interaction: discord.Interaction):
     try:
         await interaction.response.defer()
-        load_calendar_sources()
+        await start_calendar_source_loading(reload=True)
+        invalidate_event_cache()
         await resolve_tag_mappings()
         await interaction.followup.send("Reloaded calendar sources and tag mappings.")
     except Exception as e:
@@ -330,6 +390,9 @@ async def reload_command(interaction: discord.Interaction):
 @bot.tree.command(name="who", description="List calendar tags and their assigned users")
 async def who_command(interaction: discord.Interaction):
     try:
+        if sources_warming_up():
+            await reply_warming_up(interaction)
+            return
         await interaction.response.defer()
         lines = [f"**{tag}** → {TAG_NAMES.get(tag, tag)}" for tag in sorted(GROUPED_CALENDARS)]
         await interaction.followup.send("**Calendar Tags:**\n" + "\n".join(lines))
@@ -442,6 +505,28 @@ async def health_command(interaction: discord.Interaction, detailed: bool = Fals
                 ),
                 inline=True
             )
+
+            embed.add_field(
+                name="🗃️ Event Cache",
+                value=(
+                    f"**Hits:** {metrics['cache_hits']}\n"
+                    f"**Misses:** {metrics['cache_misses']}\n"
+                    f"**Hit Rate:** {metrics['cache_hit_rate_percent']}%\n"
+                    f"**Cached Windows:** {metrics['cache_entries']}"
+                ),
+                inline=True
+            )
+
+            embed.add_field(
+                name="🔌 HTTP Connections",
+                value=(
+                    f"**Requests:** {metrics['http_requests']}\n"
+                    f"**Opened:** {metrics['http_connections_opened']}\n"
+                    f"**Reused:** {metrics['http_connections_reused']} "
+                    f"({metrics['http_reuse_rate_percent']}%)"
+                ),
+                inline=True
+            )
             
             # Error breakdown
             if metrics['parsing_errors'] + metrics['network_errors'] + metrics['auth_errors'] > 0:
@@ -577,6 +662,15 @@ async def log_health_command(interaction: discord.Interaction):
         await interaction.followup.send("❌ An error occurred while logging health status.")
 
 
+def _format_interval(seconds: float) -> str:
+    """Compact duration for embeds, e.g. 5m, 1h, 1h30m."""
+    minutes = int(round(seconds / 60))
+    if minutes < 60:
+        return f"{max(minutes, 1)}m"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if minutes else f"{hours}h"
+
+
 # ╔═════════════════════════════════════════════════════════════╗
 # ║ 📋 /calendars                                               ║
 # ║ Shows status of all configured calendar sources            ║
@@ -584,6 +678,9 @@ async def log_health_command(interaction: discord.Interaction):
 @bot.tree.command(name="calendars", description="Show status of all configured calendar sources")
 async def calendars_command(interaction: discord.Interaction):
     try:
+        if sources_warming_up():
+            await reply_warming_up(interaction)
+            return
         await interaction.response.defer()
         
         # Import here to avoid circular imports
@@ -632,7 +729,8 @@ async def calendars_command(interaction: discord.Interaction):
                     else:
                         error_text = f" ({error_type})"
                 
-                calendar_lines.append(f"{cal_emoji} `{cal['name'][:20]}{'...' if len(cal['name']) > 20 else ''}`{error_text}")
+                poll_text = f" · ⏱ {_format_interval(cal['poll_interval'])}" if cal.get('poll_interval') else ""
+                calendar_lines.append(f"{cal_emoji} `{cal['name'][:20]}{'...' if len(cal['name']) > 20 else ''}`{error_text}{poll_text}")
             
             if len(tag_info['calendars']) > 5:
                 calendar_lines.append(f"... and {len(tag_info['calendars']) - 5} more")
@@ -644,7 +742,7 @@ async def calendars_command(interaction: discord.Interaction):
             )
         
         # Add footer with legend
-        embed.set_footer(text="CB = Circuit Breaker active | Use /health for detailed metrics")
+        embed.set_footer(text="CB = Circuit Breaker active | ⏱ = change check interval | Use /health for detailed metrics")
         
         await interaction.followup.send(embed=embed)
         logger.info(f"Calendars command executed by {interaction.user}")
@@ -666,7 +764,7 @@ async def debug_calendar_command(interaction: discord.Interaction, query: str):
         
         # Import here to avoid circular imports
         from events import GROUPED_CALENDARS
-        import requests
+        import http_pool
         
         # Find matching calendars
         matches = []
@@ -677,6 +775,10 @@ async def debug_calendar_command(interaction: discord.Interaction, query: str):
                 if query.lower() in cal_id.lower() or query.lower() in cal_name.lower():
                     matches.append((tag, cal))
         
+        if not matches and sources_warming_up():
+            await reply_warming_up(interaction)
+            return
+
         if not matches:
             await interaction.followup.send(f"❌ No calendar found matching '{query}'")
             return
@@ -734,7 +836,7 @@ async def debug_calendar_command(interaction: discord.Interaction, query: str):
         if cal_type == "ics" and not cal.get("error"):
             try:
                 logger.info(f"Debug fetch requested for calendar {cal_id} by {interaction.user}")
-                response = requests.get(cal_id, timeout=10)
+                response = http_pool.get(cal_id, timeout=10)
                 
                 content_info = f"**HTTP Status:** {response.status_code}\n"
                 content_info += f"**Content Length:** {len(response.text)} chars\n"
@@ -32,6 +32,22 @@ def print_health_status():
     print(f"   Parsing errors: {metrics['parsing_errors']}")
     print(f"   Network errors: {metrics['network_errors']}")
     print(f"   Auth errors: {metrics['auth_errors']}")
+
+    print(f"\n🔁 Google Sync:")
+    print(f"   Full syncs: {metrics['google_full_syncs']}")
+    print(f"   Incremental syncs: {metrics['google_incremental_syncs']}")
+    print(f"   Token resets (410): {metrics['google_token_resets']}")
+
+    print(f"\n🗃️  Event Cache:")
+    print(f"   Hits: {metrics['cache_hits']}")
+    print(f"   Misses: {metrics['cache_misses']}")
+    print(f"   Hit rate: {metrics['cache_hit_rate_percent']}%")
+    print(f"   Cached windows: {metrics['cache_entries']}")
+
+    print(f"\n🔌 HTTP Connections:")
+    print(f"   Requests: {metrics['http_requests']}")
+    print(f"   Opened: {metrics['http_connections_opened']}")
+    print(f"   Reused: {metrics['http_connections_reused']} ({metrics['http_reuse_rate_percent']}%)")
     
     # Get circuit breaker status
     breakers = get_circuit_breaker_status()
@@ -141,7 +157,7 @@ def log_health_status():
 def get_calendar_summary() -> dict:
     """Get a summary of all configured calendars and their status."""
     try:
-        from events import GROUPED_CALENDARS, _calendar_breakers, _calendar_metadata_cache
+        from events import GROUPED_CALENDARS, _calendar_breakers, _calendar_metadata_cache, get_source_poll_interval
         from datetime import datetime
         
         summary = {
@@ -205,7 +221,8 @@ def get_calendar_summary() -> dict:
                     "name": cal_name,
                     "type": cal.get("type", "unknown"),
                     "status": "failed" if is_failed else "healthy",
-                    "error": error_info
+                    "error": error_info,
+                    "poll_interval": get_source_poll_interval(cal_id),
                 })
             
             summary["calendars_by_tag"][tag] = tag_summary
@@ -9,11 +9,12 @@ from collections import defaultdict
 
 from events import (
     GROUPED_CALENDARS,
-    get_events,
+    gather_events_async,
     get_name_for_tag,
     get_color_for_tag,
     TAG_NAMES
 )
+from event_model import event_day, event_start_key, to_event
 from log import logger
 from utils import format_event, resolve_input_to_tags
 from resilience import async_retry_with_backoff
@@ -192,19 +193,12 @@ async def post_tagged_events(bot, tag: str, day: datetime.date) -> bool:
 
         events_by_source = defaultdict(list)
         all_events = []
-        
-        for meta in calendars:
-            try:
-                events = get_events(meta, day, day)
-                all_events.extend([(meta["name"], e) for e in events])
-            except Exception as e:
-                logger.exception(f"Error getting events for {meta['name']}: {e}")
+        results = await gather_events_async(calendars, day, day)
+        for meta, events in zip(calendars, results):
+            all_events.extend([(meta["name"], e) for e in events or []])
 
         for source_name, event in all_events:
-            start_str = event["start"].get("dateTime", event["start"].get("date"))
-            dt = datetime.fromisoformat(start_str.replace("Z", "+00:00")) if "T" in start_str else datetime.fromisoformat(start_str)
-            event_date = dt.date()
-            if event_date == day:
+            if event_day(event) == day:
                 events_by_source[source_name].append(event)
 
         if not events_by_source:
@@ -238,9 +232,7 @@ async def post_tagged_week(bot, tag: str, monday: datetime.date):
             return
 
         end = monday + timedelta(days=6)
-        all_events = []
-        for meta in calendars:
-            all_events += get_events(meta, monday, end)
+        all_events = [e for events in await gather_events_async(calendars, monday, end) for e in events or []]
 
         if not all_events:
             logger.debug(f"Skipping {tag} — no weekly events from {monday} to {end}")
@@ -248,9 +240,7 @@ async def post_tagged_week(bot, tag: str, monday: datetime.date):
 
         events_by_day = defaultdict(list)
         for e in all_events:
-            start_str = e["start"].get("dateTime", e["start"].get("date"))
-            dt = datetime.fromisoformat(start_str.replace("Z", "+00:00")) if "T" in start_str else datetime.fromisoformat(start_str)
-            events_by_day[dt.date()].append(e)
+            events_by_day[event_day(e)].append(e)
 
         pages, epp = build_week_pages(
             events_by_day,
@@ -314,7 +304,7 @@ async def search_events(
     tag: str | None = None,
 ) -> tuple[list[discord.Embed], list[list[dict]]]:
     """Search upcoming events matching *query*. Returns paginated pages."""
-    from utils import get_today, parse_date_string, get_local_timezone
+    from utils import get_today, event_start, get_local_timezone
 
     today = get_today()
     end = today + timedelta(days=days_ahead)
@@ -323,21 +313,22 @@ async def search_events(
 
     tags = [tag] if tag and tag in GROUPED_CALENDARS else list(GROUPED_CALENDARS.keys())
 
-    for t in tags:
-        for meta in GROUPED_CALENDARS.get(t, []):
-            try:
-                events = await asyncio.to_thread(get_events, meta, today, end)
-                for ev in events:
-                    title = (ev.get("summary") or "").lower()
-                    orig = (ev.get("original_summary") or "").lower()
-                    desc = (ev.get("description") or "").lower()
-                    if q in title or q in orig or q in desc:
-                        ev["_search_tag"] = t
-                        matches.append(ev)
-            except Exception as e:
-                logger.debug(f"Search: error fetching {meta.get('name')}: {e}")
-
-    matches.sort(key=lambda e: e["start"].get("dateTime", e["start"].get("date", "")))
+    # Every source of every searched tag at once; results keep config order
+    sources = [(t, meta) for t in tags for meta in GROUPED_CALENDARS.get(t, [])]
+    results = await gather_events_async([meta for _, meta in sources], today, end)
+    for (t, meta), events in zip(sources, results):
+        if events is None:
+            logger.debug(f"Search: error fetching {meta.get('name')}")
+            continue
+        for ev in events:
+            title = (ev.get("summary") or "").lower()
+            orig = (ev.get("original_summary") or "").lower()
+            desc = (ev.get("description") or "").lower()
+            if q in title or q in orig or q in desc:
+                # Events are shared with the caches, so tag a copy
+                matches.append(to_event(ev).with_tag(t))
+
+    matches.sort(key=event_start_key)
 
     if not matches:
         embed = discord.Embed(
@@ -351,8 +342,7 @@ async def search_events(
     local_tz = get_local_timezone()
     events_by_day: dict = defaultdict(list)
     for ev in matches:
-        start_str = ev["start"].get("dateTime", ev["start"].get("date", ""))
-        dt = parse_date_string(start_str, local_tz)
+        dt = event_start(ev, local_tz)
         if dt:
             events_by_day[dt.date()].append(ev)
 
@@ -31,3 +31,71 @@ AI_TOGGLE = os.getenv("AI_TOGGLE", "true").lower() == "true"
 
 # Log format: "text" (default, colored console + plain file) or "json" (JSON-lines file output)
 LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+
+# Event cache — seconds a fetched calendar window stays fresh (0 disables) and max cached windows
+EVENT_CACHE_TTL = float(os.getenv("EVENT_CACHE_TTL", "240"))
+EVENT_CACHE_MAX_ENTRIES = int(os.getenv("EVENT_CACHE_MAX_ENTRIES", "256"))
+
+# Directory for persistent bot state (event snapshots, reminders, HTTP caches)
+DATA_DIR = os.getenv("DATA_DIR", "/data")
+
+# Pooled HTTP sessions — max idle keep-alive connections kept per host
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "8"))
+
+# Google incremental sync — use syncTokens, the full-sync horizon around today, and max age before a full resync
+GOOGLE_INCREMENTAL_SYNC = os.getenv("GOOGLE_INCREMENTAL_SYNC", "true").lower() == "true"
+GOOGLE_SYNC_PAST_DAYS = int(os.getenv("GOOGLE_SYNC_PAST_DAYS", "30"))
+GOOGLE_SYNC_FUTURE_DAYS = int(os.getenv("GOOGLE_SYNC_FUTURE_DAYS", "90"))
+GOOGLE_FULL_SYNC_HOURS = float(os.getenv("GOOGLE_FULL_SYNC_HOURS", "24"))
+
+# Events per page requested from the Google Calendar API (maxResults, API max 2500)
+GOOGLE_EVENTS_PAGE_SIZE = max(1, min(2500, int(os.getenv("GOOGLE_EVENTS_PAGE_SIZE", "250"))))
+
+# Parse ICS feeds with the streaming VEVENT tokenizer (the ics library remains the fallback)
+ICS_STREAM_PARSER = os.getenv("ICS_STREAM_PARSER", "true").lower() == "true"
+
+# ICS parse pool — worker processes for large feeds (0 keeps parsing in-process), min feed size, and per-feed time/memory budgets
+ICS_PARSE_WORKERS = int(os.getenv("ICS_PARSE_WORKERS", "0"))
+ICS_PARSE_POOL_MIN_BYTES = int(os.getenv("ICS_PARSE_POOL_MIN_BYTES", "2000000"))
+ICS_PARSE_TIMEOUT = float(os.getenv("ICS_PARSE_TIMEOUT", "60"))
+ICS_PARSE_WORKER_MAX_MB = float(os.getenv("ICS_PARSE_WORKER_MAX_MB", "512"))
+
+# Parsed ICS feed cache — max cached (body, window) results and their approximate memory cap in MB
+ICS_PARSE_CACHE_MAX_ENTRIES = int(os.getenv("ICS_PARSE_CACHE_MAX_ENTRIES", "128"))
+ICS_PARSE_CACHE_MAX_MB = float(os.getenv("ICS_PARSE_CACHE_MAX_MB", "64"))
+
+# ICS downloads — largest accepted feed body in bytes, and the size above which a download is spooled to a temp file
+ICS_MAX_BYTES = int(os.getenv("ICS_MAX_BYTES", "50000000"))
+ICS_SPOOL_THRESHOLD = int(os.getenv("ICS_SPOOL_THRESHOLD", "5000000"))
+
+# Request gzip/deflate for ICS feeds (hosts that mishandle it fall back to identity automatically)
+ICS_COMPRESSION = os.getenv("ICS_COMPRESSION", "true").lower() == "true"
+
+# Per-host fetch politeness — concurrent requests per host, min seconds between request starts, and the longest Retry-After a fetch waits out (longer ones skip the host until it expires)
+ICS_HOST_MAX_CONCURRENCY = int(os.getenv("ICS_HOST_MAX_CONCURRENCY", "2"))
+ICS_HOST_MIN_INTERVAL = float(os.getenv("ICS_HOST_MIN_INTERVAL", "0.5"))
+ICS_RETRY_AFTER_MAX_WAIT = float(os.getenv("ICS_RETRY_AFTER_MAX_WAIT", "60"))
+
+# Concurrent source fetches when a task or command reads many calendars at once — overall and per host
+FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", "8"))
+FETCH_HOST_CONCURRENCY = int(os.getenv("FETCH_HOST_CONCURRENCY", "4"))
+
+# Seconds successfully probed calendar metadata (names, validation) is reused, across restarts, before it is re-probed
+CALENDAR_METADATA_TTL = float(os.getenv("CALENDAR_METADATA_TTL", "43200"))
+
+# Change-detection polling — shortest and longest seconds between polls of one source (intervals adapt between them)
+POLL_MIN_INTERVAL = float(os.getenv("POLL_MIN_INTERVAL", "300"))
+POLL_MAX_INTERVAL = float(os.getenv("POLL_MAX_INTERVAL", "3600"))
+
+# Change-detection cycle budget — max source fetches and seconds spent fetching per watcher cycle (unchecked tags go first next cycle)
+WATCH_CYCLE_FETCHES = int(os.getenv("WATCH_CYCLE_FETCHES", "24"))
+WATCH_CYCLE_SECONDS = float(os.getenv("WATCH_CYCLE_SECONDS", "45"))
+
+# Google Calendar API quotas — queries per minute for the project and per user (the service account), and the share of each kept for slash commands
+GOOGLE_QUOTA_PROJECT_PER_MINUTE = float(os.getenv("GOOGLE_QUOTA_PROJECT_PER_MINUTE", "10000"))
+GOOGLE_QUOTA_USER_PER_MINUTE = float(os.getenv("GOOGLE_QUOTA_USER_PER_MINUTE", "600"))
+GOOGLE_QUOTA_INTERACTIVE_RESERVE = float(os.getenv("GOOGLE_QUOTA_INTERACTIVE_RESERVE", "0.2"))
+
+# Async Google client — list Google calendars over aiohttp with self-minted service-account tokens (false keeps googleapiclient in worker threads), and how many Google sources a fan-out fetches at once
+GOOGLE_ASYNC_CLIENT = os.getenv("GOOGLE_ASYNC_CLIENT", "true").lower() == "true"
+GOOGLE_FETCH_CONCURRENCY = int(os.getenv("GOOGLE_FETCH_CONCURRENCY", "16"))
@@ -0,0 +1,265 @@
+"""Normalized, immutable calendar events.
+
+Google returns events as nested API dicts and the ICS parsers build
+similar dicts. Consumers re-parsed the ISO ``start``/``end`` strings every
+time they sorted, formatted, bucketed or fingerprinted an event.
+:class:`Event` is built once, when a fetch result enters the bot (the
+Google listing merge and the ICS parse). It keeps:
+
+* the UTC epoch start/end, the start's own calendar day and the UTC
+  offsets as written, so times can be shown exactly as before without
+  parsing anything;
+* the all-day flag;
+* interned source/tag strings, and interned text fields, which recurring
+  occurrences repeat;
+* a lazily computed, cached change-detection fingerprint.
+
+It is a read-only :class:`~collections.abc.Mapping` over the original keys
+(``event["start"]["dateTime"]``, ``event.get("summary")`` ...), so code
+that treats events as dicts keeps working. Use :func:`event_to_dict` before
+JSON-serializing. Snapshots loaded from disk stay plain dicts; the helpers
+here accept both.
+"""
+
+import hashlib
+import json
+import sys
+from collections.abc import Mapping
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Iterator
+
+
+def _clean(text: str) -> str:
+    return " ".join(text.strip().split())
+
+
+def _normalize_time(value: str) -> str:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).isoformat(timespec="minutes")
+
+
+def event_fingerprint(summary: str, start_raw: str, end_raw: str, location: str, description: str) -> str:
+    """MD5 over the normalized summary, start, end, location and description.
+
+    Raises ValueError for unparseable times.
+    """
+    trimmed = {
+        "summary": _clean(summary),
+        "start": _normalize_time(start_raw),
+        "end": _normalize_time(end_raw),
+        "location": _clean(location),
+        "description": _clean(description),
+    }
+    return hashlib.md5(json.dumps(trimmed, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _fixed_tz(offset: int) -> timezone:
+    return timezone(timedelta(seconds=offset))
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _parse_when(when: Any) -> tuple:
+    """``(raw, epoch, utc_offset, all_day, day)`` for a start/end dict.
+
+    Naive date-times are taken as UTC (offset None). Unparseable or
+    missing values give ``(raw or None, None, None, False, None)``.
+    """
+    if not isinstance(when, Mapping):
+        return None, None, None, False, None
+    raw = when.get("dateTime")
+    try:
+        if raw:
+            dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+            if dt.tzinfo is None:
+                return raw, dt.replace(tzinfo=timezone.utc).timestamp(), None, False, dt.date()
+            return raw, dt.timestamp(), int(dt.utcoffset().total_seconds()), False, dt.date()
+        raw = when.get("date")
+        if raw:
+            day = date.fromisoformat(raw)
+            return _intern(raw), datetime.combine(day, dt_time.min, timezone.utc).timestamp(), None, True, day
+    except (TypeError, ValueError, AttributeError):
+        pass
+    return raw or None, None, None, False, None
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 📌 Event                                                           ║
+# ║ Slotted, immutable event with precomputed times                    ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class Event(Mapping):
+    """One calendar event occurrence.
+
+    ``start_ts``/``end_ts`` are UTC epoch seconds (None if unparseable),
+    ``start_offset``/``end_offset`` the UTC offsets in seconds as written
+    (None for all-day and naive times) and ``day`` the start's date as
+    written. Missing optional fields are None and absent from the mapping
+    view.
+    """
+
+    __slots__ = (
+        "id", "summary", "original_summary", "location", "description",
+        "start_raw", "end_raw", "start_ts", "end_ts", "start_offset", "end_offset",
+        "all_day", "day", "source", "tag", "_fingerprint",
+    )
+
+    _FIELDS = ("id", "summary", "original_summary", "location", "description")
+
+    def __init__(self, **fields: Any):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields.get(name))
+        object.__setattr__(self, "all_day", bool(fields.get("all_day")))
+
+    @classmethod
+    def from_dict(cls, raw: Mapping, source: str | None = None, tag: str | None = None) -> "Event":
+        """Normalize a Google API or ICS-derived event dict."""
+        if isinstance(raw, Event):
+            return raw
+        start_raw, start_ts, start_offset, all_day, day = _parse_when(raw.get("start"))
+        end_raw, end_ts, end_offset, _, _ = _parse_when(raw.get("end"))
+        return cls(
+            id=raw.get("id"),
+            summary=_intern(raw.get("summary")),
+            original_summary=_intern(raw.get("original_summary")),
+            location=_intern(raw.get("location")),
+            description=_intern(raw.get("description")),
+            start_raw=start_raw, end_raw=end_raw,
+            start_ts=start_ts, end_ts=end_ts,
+            start_offset=start_offset, end_offset=end_offset,
+            all_day=all_day, day=day,
+            source=_intern(source), tag=_intern(tag),
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Event is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Event is immutable")
+
+    def with_tag(self, tag: str | None) -> "Event":
+        """Copy of this event attributed to *tag* (all other fields shared)."""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields["tag"] = _intern(tag)
+        return Event(**fields)
+
+    # -- derived values --
+
+    @property
+    def fingerprint(self) -> str:
+        """Change-detection fingerprint ("" if the times are unusable), computed once."""
+        if self._fingerprint is None:
+            try:
+                fp = event_fingerprint(
+                    self.summary or "", self.start_raw or "", self.end_raw or "",
+                    self.location or "", self.description or "",
+                )
+            except (TypeError, ValueError):
+                fp = ""
+            object.__setattr__(self, "_fingerprint", fp)
+        return self._fingerprint
+
+    def _as_datetime(self, ts: float | None, offset: int | None, default_tz) -> datetime | None:
+        if ts is None:
+            return None
+        if offset is None:
+            return datetime.fromtimestamp(ts, default_tz)
+        return datetime.fromtimestamp(ts, _fixed_tz(offset))
+
+    def start_datetime(self, default_tz) -> datetime | None:
+        """Start as ``utils.parse_date_string`` reads it: in its own offset,
+        naive times converted from UTC to *default_tz*, all-day events at
+        noon in *default_tz*."""
+        if self.all_day:
+            return datetime.combine(self.day, dt_time(12), default_tz)
+        return self._as_datetime(self.start_ts, self.start_offset, default_tz)
+
+    def end_datetime(self, default_tz) -> datetime | None:
+        """End, with the same rules as :meth:`start_datetime`."""
+        if self.all_day and self.end_ts is not None:
+            end_day = datetime.fromtimestamp(self.end_ts, timezone.utc).date()
+            return datetime.combine(end_day, dt_time(12), default_tz)
+        return self._as_datetime(self.end_ts, self.end_offset, default_tz)
+
+    # -- compatibility Mapping view --
+
+    def _when(self, raw: str | None) -> dict | None:
+        if raw is None:
+            return None
+        return {"date": raw} if self.all_day else {"dateTime": raw}
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "start":
+            value = self._when(self.start_raw)
+        elif key == "end":
+            value = self._when(self.end_raw)
+        elif key in self._FIELDS:
+            value = getattr(self, key)
+        else:
+            value = None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._FIELDS:
+            if getattr(self, key) is not None:
+                yield key
+        if self.start_raw is not None:
+            yield "start"
+        if self.end_raw is not None:
+            yield "end"
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Event):
+            return all(getattr(self, k) == getattr(other, k)
+                       for k in self._FIELDS + ("start_raw", "end_raw", "all_day"))
+        return super().__eq__(other)
+
+    __hash__ = None  # equal to the equivalent dict, which is unhashable
+
+    def __reduce__(self):
+        return _restore_event, (tuple(getattr(self, name) for name in self.__slots__),)
+
+    def __repr__(self) -> str:
+        return f"Event({self.summary!r}, {self.start_raw!r})"
+
+
+def _restore_event(values: tuple) -> Event:
+    return Event(**dict(zip(Event.__slots__, values)))
+
+
+def to_event(event: Mapping, source: str | None = None) -> Event:
+    """*event* as an :class:`Event` (returned unchanged if it already is one)."""
+    return event if isinstance(event, Event) else Event.from_dict(event, source)
+
+
+def copy_event(event: Mapping) -> Mapping:
+    """Defensive copy for caches: dicts are copied, immutable Events shared."""
+    return dict(event) if isinstance(event, dict) else event
+
+
+def event_to_dict(event: Mapping) -> dict:
+    """Plain (JSON-serializable) dict for *event*."""
+    return {k: dict(v) if isinstance(v, Mapping) else v for k, v in event.items()}
+
+
+def event_start_key(event: Mapping) -> str:
+    """Sort key: the start as written (dateTime, else date)."""
+    if isinstance(event, Event):
+        return event.start_raw or ""
+    start = event.get("start", {})
+    return start.get("dateTime", start.get("date", ""))
+
+
+def event_day(event: Mapping) -> date:
+    """Calendar day the event starts on, as written in its own offset."""
+    if isinstance(event, Event) and event.day is not None:
+        return event.day
+    raw = event_start_key(event)
+    return datetime.fromisoformat(raw.replace("Z", "+00:00")).date()
@@ -1,20 +1,74 @@
 import os
 import json
+import asyncio
+import codecs
 import hashlib
+import aiohttp
 import requests
+import http_pool
 import time
 import random
 import ssl
-from datetime import datetime, timedelta
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone, time as dt_time
 from typing import Dict, List, Tuple, Optional, Any
 from ics import Calendar as ICS_Calendar # type: ignore
 from google.oauth2 import service_account # type: ignore
 from googleapiclient.discovery import build # type: ignore
 from googleapiclient.errors import HttpError # type: ignore
-from environ import GOOGLE_APPLICATION_CREDENTIALS, CALENDAR_SOURCES, USER_TAG_MAPPING
+from environ import (
+    GOOGLE_APPLICATION_CREDENTIALS,
+    CALENDAR_SOURCES,
+    USER_TAG_MAPPING,
+    EVENT_CACHE_TTL,
+    EVENT_CACHE_MAX_ENTRIES,
+    GOOGLE_INCREMENTAL_SYNC,
+    GOOGLE_SYNC_PAST_DAYS,
+    GOOGLE_SYNC_FUTURE_DAYS,
+    GOOGLE_FULL_SYNC_HOURS,
+    GOOGLE_EVENTS_PAGE_SIZE,
+    ICS_STREAM_PARSER,
+    ICS_PARSE_WORKERS,
+    ICS_PARSE_POOL_MIN_BYTES,
+    ICS_PARSE_TIMEOUT,
+    ICS_PARSE_WORKER_MAX_MB,
+    ICS_PARSE_CACHE_MAX_ENTRIES,
+    ICS_PARSE_CACHE_MAX_MB,
+    ICS_MAX_BYTES,
+    ICS_SPOOL_THRESHOLD,
+    ICS_COMPRESSION,
+    ICS_HOST_MAX_CONCURRENCY,
+    ICS_HOST_MIN_INTERVAL,
+    ICS_RETRY_AFTER_MAX_WAIT,
+    FETCH_CONCURRENCY,
+    FETCH_HOST_CONCURRENCY,
+    CALENDAR_METADATA_TTL,
+    POLL_MIN_INTERVAL,
+    POLL_MAX_INTERVAL,
+    GOOGLE_QUOTA_PROJECT_PER_MINUTE,
+    GOOGLE_QUOTA_USER_PER_MINUTE,
+    GOOGLE_QUOTA_INTERACTIVE_RESERVE,
+    GOOGLE_ASYNC_CLIENT,
+    GOOGLE_FETCH_CONCURRENCY,
+)
 from log import logger
+from feed_cache import FeedValidatorCache, ParsedFeedCache
+from google_sync import GoogleSyncStore
+from ics_stream import IcsStreamError, extract_window_occurrences, get_recurrence_cache_stats, prefilter_ics_window
+from ics_parse_pool import IcsParsePool, ParseBudgetExceeded
+from ics_preprocess import preprocess_ics_bytes
+from ics_download import CHUNK_SIZE, FeedRejected, UndecodedBody, read_feed_body, read_feed_body_async, wide_charset
+from host_profiles import IDENTITY_ENCODING, HostProfileStore
+from host_scheduler import HostDeferred, HostScheduler, parse_retry_after
+from fetch_fanout import GOOGLE_HOST, FetchFanout
+from google_async import AsyncGoogleCalendar, GoogleApiError, ServiceAccountTokenSource
+from metadata_cache import CalendarMetadataCache
+from event_model import Event, copy_event, event_fingerprint, event_start_key, event_to_dict, to_event
+from poll_scheduler import PollScheduler, cache_control_max_age, feed_refresh_hint
+from quota_governor import QuotaGovernor
 from ai_title_parser import simplify_event_title
-from resilience import CalendarCircuitBreakers, retry_with_backoff
+from resilience import CalendarCircuitBreakers, retry_with_backoff, async_retry_with_backoff
 
 # Import TatSu exceptions for proper ICS parsing error handling
 try:
@@ -39,12 +93,18 @@ SERVICE_ACCOUNT_FILE = GOOGLE_APPLICATION_CREDENTIALS
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 EVENTS_FILE = "/data/events.json"
 
-# In-memory cache and error tracking
-_calendar_metadata_cache = {}
-_api_last_error_time = None
-_api_error_count = 0
-_API_BACKOFF_RESET = timedelta(minutes=30)
-_MAX_API_ERRORS = 10
+# Source metadata (persisted, per-entry TTLs)
+_calendar_metadata_cache = CalendarMetadataCache(success_ttl=CALENDAR_METADATA_TTL)
+
+# Token buckets for the Google API quotas, shared by metadata and event calls
+_google_quota = QuotaGovernor(
+    project_per_minute=GOOGLE_QUOTA_PROJECT_PER_MINUTE,
+    user_per_minute=GOOGLE_QUOTA_USER_PER_MINUTE,
+    background_reserve=GOOGLE_QUOTA_INTERACTIVE_RESERVE,
+)
+
+# Sync tokens and locally merged events for incremental Google sync
+_google_sync = GoogleSyncStore(max_age=GOOGLE_FULL_SYNC_HOURS * 3600)
 
 # Per-calendar circuit breakers (replaces manual _failed_calendars dict)
 _calendar_breakers = CalendarCircuitBreakers(
@@ -52,60 +112,53 @@ _calendar_breakers = CalendarCircuitBreakers(
 )
 
 # Metrics tracking
-_calendar_metrics = {
-    "requests_total": 0,
-    "requests_successful": 0,
-    "requests_failed": 0,
-    "parsing_errors": 0,
-    "network_errors": 0,
-    "auth_errors": 0,
-    "events_processed": 0,
-    "last_reset": datetime.now()
-}
+def _new_metrics() -> Dict[str, Any]:
+    """Fresh metrics counters; used at import time and by reset_metrics()."""
+    return {
+        "requests_total": 0,
+        "requests_successful": 0,
+        "requests_failed": 0,
+        "parsing_errors": 0,
+        "network_errors": 0,
+        "auth_errors": 0,
+        "events_processed": 0,
+        "not_modified": 0,
+        "google_full_syncs": 0,
+        "google_incremental_syncs": 0,
+        "google_token_resets": 0,
+        "google_batches": 0,
+        "ics_stream_fallbacks": 0,
+        "downloads_rejected": 0,
+        "downloads_spooled": 0,
+        "compression_fallbacks": 0,
+        "requests_deferred": 0,
+        "metadata_refreshes": 0,
+        "last_reset": datetime.now()
+    }
+
+_calendar_metrics = _new_metrics()
 
 # ╔════════════════════════════════════════════════════════════════════╗
 # ║ 🧹 ICS Content Preprocessing                                       ║
 # ║ Cleans up common malformed patterns before parsing                 ║
 # ╚════════════════════════════════════════════════════════════════════╝
-def preprocess_ics_content(content: str, url: str) -> str:
+def preprocess_ics_content(content: str | bytes, url: str) -> str:
     """
     Preprocess ICS content to fix common malformed patterns that cause parser errors.
+
+    Thin wrapper over ics_preprocess.preprocess_ics_bytes(), which applies
+    every fix and normalizes line endings in a single scan.
     """
-    import re
-    
     original_length = len(content)
     logger.debug(f"Preprocessing ICS content from {url} ({original_length} chars)")
-    
-    # Apply only minimal, safe fixes to avoid breaking valid content
-    # Only fix obviously broken patterns, be very conservative
-    
-    # Pattern 1: Only fix completely missing timezone on datetime formats that clearly need it
-    # Only apply if the datetime is clearly malformed (has T but no timezone)
-    content = re.sub(r'DTSTART:(\d{8}T\d{6})$', r'DTSTART:\1Z', content, flags=re.MULTILINE)
-    content = re.sub(r'DTEND:(\d{8}T\d{6})$', r'DTEND:\1Z', content, flags=re.MULTILINE)
-    
-    # Pattern 2: Only fix empty values that would definitely break parsing
-    content = re.sub(r'DTSTART:\s*$', 'DTSTART:19700101T000000Z', content, flags=re.MULTILINE)
-    content = re.sub(r'DTEND:\s*$', 'DTEND:19700101T010000Z', content, flags=re.MULTILINE)
-    
-    # Only apply the most essential fixes
-    
-    # Remove only null bytes which definitely break parsing
-    content = re.sub(r'[\x00]', '', content)
-    
-    # Only add missing VCALENDAR wrapper if completely missing
-    if 'BEGIN:VCALENDAR' not in content and 'BEGIN:VEVENT' in content:
-        logger.debug(f"ICS from {url} missing VCALENDAR wrapper, adding minimal wrapper")
-        content = 'BEGIN:VCALENDAR\r\nVERSION:2.0\r\n' + content + '\r\nEND:VCALENDAR\r\n'
-    
-    # Skip the cleanup section for now - it might be too aggressive
-    # Just ensure proper line endings
-    content = content.replace('\r\n', '\n').replace('\r', '\n')
-    
+
+    raw = content.encode("utf-8") if isinstance(content, str) else content
+    content = preprocess_ics_bytes(raw, url).decode("utf-8", errors="replace")
+
     processed_length = len(content)
     if processed_length != original_length:
         logger.debug(f"ICS preprocessing for {url}: {original_length} -> {processed_length} chars")
-    
+
     return content
 
 # ╔════════════════════════════════════════════════════════════════════╗
@@ -160,7 +213,17 @@ def get_metrics_summary() -> Dict[str, Any]:
     success_rate = 0
     if _calendar_metrics["requests_total"] > 0:
         success_rate = (_calendar_metrics["requests_successful"] / _calendar_metrics["requests_total"]) * 100
-    
+
+    cache_stats = _event_cache.get_stats()
+    pool_stats = http_pool.get_pool_stats()
+    recurrence_stats = get_recurrence_cache_stats()
+    parsed_stats = _parsed_feed_cache.get_stats()
+    transfer_stats = _host_profiles.get_stats()
+    scheduler_stats = _host_scheduler.get_stats()
+    fanout_stats = _fetch_fanout.get_stats()
+    metadata_stats = _calendar_metadata_cache.get_stats()
+    poll_stats = _poll_scheduler.get_stats()
+    quota_stats = _google_quota.get_stats()
     return {
         "duration_minutes": duration.total_seconds() / 60,
         "requests_total": _calendar_metrics["requests_total"],
@@ -171,7 +234,55 @@ def get_metrics_summary() -> Dict[str, Any]:
         "network_errors": _calendar_metrics["network_errors"],
         "auth_errors": _calendar_metrics["auth_errors"],
         "events_processed": _calendar_metrics["events_processed"],
-        "circuit_breakers_active": len(_calendar_breakers)
+        "not_modified": _calendar_metrics["not_modified"],
+        "google_full_syncs": _calendar_metrics["google_full_syncs"],
+        "google_incremental_syncs": _calendar_metrics["google_incremental_syncs"],
+        "google_token_resets": _calendar_metrics["google_token_resets"],
+        "google_batches": _calendar_metrics["google_batches"],
+        "ics_stream_fallbacks": _calendar_metrics["ics_stream_fallbacks"],
+        "downloads_rejected": _calendar_metrics["downloads_rejected"],
+        "downloads_spooled": _calendar_metrics["downloads_spooled"],
+        "compression_fallbacks": _calendar_metrics["compression_fallbacks"],
+        "ics_identity_hosts": transfer_stats["identity_hosts"],
+        "ics_wire_bytes": transfer_stats["wire_bytes"],
+        "ics_decoded_bytes": transfer_stats["decoded_bytes"],
+        "ics_transfer_savings_percent": transfer_stats["savings_percent"],
+        "requests_deferred": _calendar_metrics["requests_deferred"],
+        "host_deferrals": scheduler_stats["deferrals"],
+        "hosts_deferred_now": scheduler_stats["deferred_hosts"],
+        "host_throttle_waits": scheduler_stats["waits"],
+        "host_throttle_wait_seconds": scheduler_stats["wait_seconds"],
+        "fanout_sources": fanout_stats["sources"],
+        "fanout_peak_concurrency": fanout_stats["peak"],
+        "fanout_failures": fanout_stats["failures"],
+        "metadata_cache_entries": metadata_stats["entries"],
+        "metadata_refreshes": _calendar_metrics["metadata_refreshes"],
+        "poll_mean_interval_seconds": poll_stats["mean_interval"],
+        "poll_sources_at_ceiling": poll_stats["at_ceiling"],
+        "google_quota_project_tokens": quota_stats["tokens"]["project"],
+        "google_quota_user_tokens": quota_stats["tokens"]["user"],
+        "google_quota_waits": quota_stats["waits"],
+        "google_quota_wait_seconds": quota_stats["wait_seconds"],
+        "google_quota_throttles": quota_stats["throttles"],
+        "google_token_refreshes": _google_async.tokens.get_stats()["refreshes"] if _google_async else 0,
+        "ics_parse_offloaded": _ics_parse_pool.get_stats()["offloaded"] if _ics_parse_pool else 0,
+        "ics_parse_timeouts": _ics_parse_pool.get_stats()["timeouts"] if _ics_parse_pool else 0,
+        "circuit_breakers_active": len(_calendar_breakers),
+        "cache_hits": cache_stats["hits"],
+        "cache_misses": cache_stats["misses"],
+        "cache_hit_rate_percent": cache_stats["hit_rate_percent"],
+        "cache_entries": cache_stats["entries"],
+        "parse_cache_hits": parsed_stats["hits"],
+        "parse_cache_misses": parsed_stats["misses"],
+        "parse_cache_hit_rate_percent": parsed_stats["hit_rate_percent"],
+        "parse_cache_entries": parsed_stats["entries"],
+        "parse_cache_bytes": parsed_stats["bytes"],
+        "recurrence_cache_hit_rate_percent": recurrence_stats["hit_rate_percent"],
+        "recurrence_cache_entries": recurrence_stats["entries"],
+        "http_requests": pool_stats["requests_sent"],
+        "http_connections_opened": pool_stats["connections_opened"],
+        "http_connections_reused": pool_stats["connections_reused"],
+        "http_reuse_rate_percent": pool_stats["reuse_rate_percent"],
     }
 
 def log_metrics_summary():
@@ -186,27 +297,200 @@ def log_metrics_summary():
             f"{summary['parsing_errors']} parse errors, "
             f"{summary['network_errors']} network errors, "
             f"{summary['auth_errors']} auth errors, "
-            f"{summary['circuit_breakers_active']} circuits open"
+            f"{summary['not_modified']} not modified, "
+            f"{summary['circuit_breakers_active']} circuits open, "
+            f"cache hit rate {summary['cache_hit_rate_percent']}% "
+            f"({summary['cache_hits']}/{summary['cache_hits'] + summary['cache_misses']}), "
+            f"parse cache hit rate {summary['parse_cache_hit_rate_percent']}%, "
+            f"ICS transfer {summary['ics_transfer_savings_percent']}% smaller on the wire, "
+            f"{summary['http_connections_reused']}/{summary['http_requests']} HTTP connections reused"
         )
 
 def reset_metrics():
     """Reset metrics counters."""
     global _calendar_metrics
-    _calendar_metrics = {
-        "requests_total": 0,
-        "requests_successful": 0,
-        "requests_failed": 0,
-        "parsing_errors": 0,
-        "network_errors": 0,
-        "auth_errors": 0,
-        "events_processed": 0,
-        "last_reset": datetime.now()
-    }
+    _calendar_metrics = _new_metrics()
+    _event_cache.reset_stats()
+    _parsed_feed_cache.reset_stats()
 
 def get_circuit_breaker_status() -> Dict[str, Any]:
     """Get current status of circuit breakers for monitoring."""
     return _calendar_breakers.get_status()
 
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🗃️ Event Cache                                                     ║
+# ║ Process-wide TTL cache shared by every get_events consumer         ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def _event_in_window(event: dict, source_type: str, start_date, end_date) -> bool:
+    """Check whether an event belongs to a date window, using the same rules
+    the fetchers apply: ICS events by their start date, Google events by
+    overlap with the UTC day bounds. Unparseable events are kept."""
+    if isinstance(event, Event):
+        if event.start_ts is None:
+            return True
+        if source_type == "ics":
+            return event.all_day or start_date <= event.day <= end_date
+        window_start = datetime.combine(start_date, dt_time.min, tzinfo=timezone.utc).timestamp()
+        if event.all_day:
+            # End date is exclusive: the last day's midnight must be past the window start
+            last = event.end_ts if event.end_ts is not None else event.start_ts
+            window_end = datetime.combine(end_date, dt_time.min, tzinfo=timezone.utc).timestamp()
+            return event.start_ts <= window_end and last > window_start
+        window_end = datetime.combine(end_date, dt_time(23, 59, 59), tzinfo=timezone.utc).timestamp()
+        finish = event.end_ts if event.end_ts is not None else event.start_ts
+        return event.start_ts < window_end and finish > window_start
+    try:
+        start = event.get("start", {})
+        end = event.get("end", {})
+        if source_type == "ics":
+            begin = datetime.fromisoformat(start["dateTime"].replace("Z", "+00:00"))
+            return start_date <= begin.date() <= end_date
+
+        if "date" in start and "dateTime" not in start:
+            # All-day event: end date is exclusive
+            first = datetime.fromisoformat(start["date"]).date()
+            last = datetime.fromisoformat(end.get("date", start["date"])).date()
+            return first <= end_date and last > start_date
+
+        begin = datetime.fromisoformat(start["dateTime"].replace("Z", "+00:00"))
+        finish = datetime.fromisoformat(end.get("dateTime", start["dateTime"]).replace("Z", "+00:00"))
+        window_start = datetime.combine(start_date, dt_time.min, tzinfo=timezone.utc)
+        window_end = datetime.combine(end_date, dt_time(23, 59, 59), tzinfo=timezone.utc)
+        return begin < window_end and finish > window_start
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return True
+
+
+class EventCache:
+    """TTL cache of fetched events keyed by source and date window.
+
+    A lookup is served from any unexpired entry of the same source whose
+    window covers the requested one, filtered down to the requested dates.
+    Entries are evicted least-recently-used once ``max_entries`` is reached.
+    Thread-safe: get_events runs in worker threads via asyncio.to_thread.
+    """
+
+    def __init__(self, ttl: float = 240.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        # (source_type, source_id, start_date, end_date) -> (stored_at, events)
+        self._entries: "OrderedDict[tuple, tuple[float, list]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, source_type: str, source_id: str, start_date, end_date) -> list | None:
+        """Return cached events for the window, or None on a miss."""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            for key in list(self._entries):
+                ctype, cid, cached_start, cached_end = key
+                if ctype != source_type or cid != source_id:
+                    continue
+                stored_at, events = self._entries[key]
+                if now - stored_at > self.ttl:
+                    del self._entries[key]
+                    continue
+                if cached_start <= start_date and end_date <= cached_end:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    if (cached_start, cached_end) == (start_date, end_date):
+                        return [copy_event(e) for e in events]
+                    return [
+                        copy_event(e) for e in events
+                        if _event_in_window(e, source_type, start_date, end_date)
+                    ]
+            self.misses += 1
+            return None
+
+    def covers(self, source_type: str, source_id: str, start_date, end_date) -> bool:
+        """True if a fresh entry covers the window (no effect on hit/miss stats)."""
+        if not self.enabled:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            return any(
+                ctype == source_type and cid == source_id
+                and cached_start <= start_date and end_date <= cached_end
+                and now - stored_at <= self.ttl
+                for (ctype, cid, cached_start, cached_end), (stored_at, _) in self._entries.items()
+            )
+
+    def put(self, source_type: str, source_id: str, start_date, end_date, events: list) -> None:
+        """Store events for a window, dropping narrower windows it supersedes."""
+        if not self.enabled:
+            return
+        with self._lock:
+            for key in list(self._entries):
+                ctype, cid, cached_start, cached_end = key
+                if (ctype == source_type and cid == source_id
+                        and start_date <= cached_start and cached_end <= end_date):
+                    del self._entries[key]
+            self._entries[(source_type, source_id, start_date, end_date)] = (
+                time.monotonic(), [copy_event(e) for e in events]
+            )
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, source_id: str | None = None) -> int:
+        """Drop all entries (or only those of one source). Returns the count."""
+        with self._lock:
+            if source_id is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            stale = [key for key in self._entries if key[1] == source_id]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate_percent": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+                "entries": len(self._entries),
+                "evictions": self.evictions,
+                "ttl_seconds": self.ttl,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_event_cache = EventCache(ttl=EVENT_CACHE_TTL, max_entries=EVENT_CACHE_MAX_ENTRIES)
+if not _event_cache.enabled:
+    logger.warning(
+        "Event cache disabled (EVENT_CACHE_TTL=0): batched Google prefetch is off, "
+        "each Google calendar will be listed with its own request"
+    )
+
+
+def get_event_cache_stats() -> Dict[str, Any]:
+    """Get event cache hit/miss counters for monitoring."""
+    return _event_cache.get_stats()
+
+
+def invalidate_event_cache(source_id: str | None = None) -> int:
+    """Invalidate cached events for one source, or all sources when None."""
+    count = _event_cache.invalidate(source_id)
+    logger.info(f"Invalidated {count} cached event window(s)" + (f" for {source_id}" if source_id else ""))
+    return count
+
 # Fallback directory for events if primary location is unavailable
 FALLBACK_EVENTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
@@ -221,6 +505,18 @@ except Exception as e:
     logger.exception(f"Error initializing Google Calendar service: {e}")
     service = None  # Will trigger fallback behavior in functions
 
+# aiohttp-based client for listing events from the loop (None = threaded client only)
+_google_async: AsyncGoogleCalendar | None = None
+if GOOGLE_ASYNC_CLIENT:
+    try:
+        _google_async = AsyncGoogleCalendar(
+            ServiceAccountTokenSource.from_file(SERVICE_ACCOUNT_FILE, SCOPES),
+            _google_quota,
+            http_pool.get_async_session,
+        )
+    except Exception as e:
+        logger.warning(f"Async Google client unavailable, using the threaded client: {e}")
+
 # ╔════════════════════════════════════════════════════════════════════╗
 # ║ 👥 Tag Mapping (User ID → Tag)                                     ║
 # ╚════════════════════════════════════════════════════════════════════╝
@@ -367,34 +663,34 @@ def parse_calendar_sources() -> List[Tuple[str, str, str]]:
 # ║ 🔁 retry_api_call                                                  ║
 # ║ Helper to retry Google API calls with exponential backoff         ║
 # ╚════════════════════════════════════════════════════════════════════╝
-def retry_api_call(func, *args, max_retries=3, **kwargs):
-    """Retry a Google API call with exponential backoff on transient errors."""
-    global _api_last_error_time, _api_error_count
-    
-    # Check if we've had too many errors recently
-    if _api_last_error_time and _api_error_count >= _MAX_API_ERRORS:
-        # Check if enough time has passed to reset the counter
-        if datetime.now() - _api_last_error_time > _API_BACKOFF_RESET:
-            logger.info("API error count reset after backoff period")
-            _api_error_count = 0
-        else:
-            logger.warning(f"Too many API errors ({_api_error_count}), backing off")
-            return None
-    
+def _is_rate_limit_error(e: HttpError) -> bool:
+    """429, or a 403 whose reason is one of Google's rate-limit reasons."""
+    status_code = e.resp.status
+    return status_code == 429 or (status_code == 403 and "ratelimitexceeded" in str(e).lower())
+
+
+def retry_api_call(func, *args, max_retries=3, quota_cost=1, **kwargs):
+    """Retry a Google API call with exponential backoff on transient errors.
+
+    Every attempt first takes *quota_cost* tokens from the quota governor
+    (one per call; a batch costs one per call inside it), queueing until
+    the buckets allow it.
+    """
     last_exception = None
     
     for attempt in range(max_retries):
+        _google_quota.acquire(quota_cost)
         try:
             return func(*args, **kwargs)
             
         except HttpError as e:
             status_code = e.resp.status
             
-            # Don't retry on client errors except for 429 (rate limit)
-            if status_code < 500 and status_code != 429:
+            # Don't retry on client errors except for rate limits
+            if _is_rate_limit_error(e):
+                _google_quota.throttle()
+            elif status_code < 500:
                 logger.warning(f"Non-retryable Google API error: {status_code} - {str(e)}")
-                _api_error_count += 1
-                _api_last_error_time = datetime.now()
                 raise
                 
             # For rate limits and server errors, retry with backoff (max 30 seconds)
@@ -434,28 +730,80 @@ def retry_api_call(func, *args, max_retries=3, **kwargs):
         except Exception as e:
             # Other errors are not retried - log with full traceback for debugging
             logger.exception(f"Unexpected error in API call: {e}")
-            _api_error_count += 1
-            _api_last_error_time = datetime.now()
             raise
     
-    # If we've exhausted retries, record the error and return None
+    # If we've exhausted retries, log the error and return None
     if last_exception:
-        _api_error_count += 1
-        _api_last_error_time = datetime.now()
         logger.error(f"All {max_retries} retries failed for API call: {last_exception}")
         
     return None
 
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 📦 Batched Google Requests                                         ║
+# ║ Groups per-calendar API calls into batch HTTP round trips          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+# Google recommends at most 50 calls per batch request
+_GOOGLE_BATCH_LIMIT = 50
+
+
+def _execute_google_batch(api_requests: Dict[str, Any]) -> Dict[str, Tuple[Any, Exception | None]]:
+    """Execute request_id -> HttpRequest mappings via new_batch_http_request.
+
+    Returns request_id -> (response, exception) for every request. If a
+    whole batch cannot be sent, each of its items carries that exception.
+    """
+    results: Dict[str, Tuple[Any, Exception | None]] = {}
+
+    def callback(request_id, response, exception):
+        results[request_id] = (response, exception)
+
+    request_ids = list(api_requests)
+    for i in range(0, len(request_ids), _GOOGLE_BATCH_LIMIT):
+        chunk = request_ids[i:i + _GOOGLE_BATCH_LIMIT]
+        batch = service.new_batch_http_request(callback=callback)
+        for request_id in chunk:
+            batch.add(api_requests[request_id], request_id=request_id)
+        error: Exception | None = None
+        try:
+            retry_api_call(batch.execute, quota_cost=len(chunk))
+        except Exception as e:
+            logger.warning(f"Google batch request with {len(chunk)} calls failed: {e}")
+            error = e
+        update_metrics("google_batches")
+        for request_id in chunk:
+            results.setdefault(request_id, (None, error or RuntimeError("no response in batch")))
+    return results
+
+
 # ╔════════════════════════════════════════════════════════════════════╗
 # ║ 📄 Calendar Metadata Fetching                                     ║
 # ╚════════════════════════════════════════════════════════════════════╝
-def fetch_google_calendar_metadata(calendar_id: str) -> Dict[str, Any]:
-    """Fetch Google Calendar metadata with caching and robust error handling."""
+def _google_metadata_from_entry(calendar_id: str, cal: dict) -> Dict[str, Any]:
+    """Build source metadata from a calendarList entry."""
+    # Extract calendar name, preferring the override name if available
+    name = cal.get("summaryOverride") or cal.get("summary") or calendar_id
+    logger.debug(f"Loaded Google calendar metadata: {name}")
+    return {
+        "type": "google",
+        "id": calendar_id,
+        "name": name,
+        "timezone": cal.get("timeZone"),
+        "color": cal.get("backgroundColor", "#95a5a6"),
+    }
+
+
+def fetch_google_calendar_metadata(calendar_id: str, refresh: bool = False) -> Dict[str, Any]:
+    """Fetch Google Calendar metadata with caching and robust error handling.
+
+    *refresh* bypasses the cache and skips the subscribe call, for
+    re-reading a calendar that is already loaded.
+    """
     # Check cache first
     cache_key = f"google_{calendar_id}"
-    if cache_key in _calendar_metadata_cache:
+    cached = None if refresh else _calendar_metadata_cache.get(cache_key)
+    if cached is not None:
         logger.debug(f"Using cached metadata for calendar {calendar_id}")
-        return _calendar_metadata_cache[cache_key]
+        return cached
     
     # Verify service is available
     if not service:
@@ -464,9 +812,10 @@ def fetch_google_calendar_metadata(calendar_id: str) -> Dict[str, Any]:
     
     # First try to add the calendar to the list (might already be there)
     try:
-        retry_api_call(
-            service.calendarList().insert(body={"id": calendar_id}).execute
-        )
+        if not refresh:
+            retry_api_call(
+                service.calendarList().insert(body={"id": calendar_id}).execute
+            )
     except Exception as e:
         # Ignore 'Already Exists' errors
         if "Already Exists" not in str(e):
@@ -482,20 +831,7 @@ def fetch_google_calendar_metadata(calendar_id: str) -> Dict[str, Any]:
             logger.warning(f"Failed to get metadata for calendar {calendar_id} after retries")
             result = {"type": "google", "id": calendar_id, "name": calendar_id, "error": True}
         else:
-            # Extract calendar name, preferring the override name if available
-            name = cal.get("summaryOverride") or cal.get("summary") or calendar_id
-            timezone = cal.get("timeZone")
-            color = cal.get("backgroundColor", "#95a5a6")
-            
-            result = {
-                "type": "google", 
-                "id": calendar_id, 
-                "name": name,
-                "timezone": timezone,
-                "color": color
-            }
-            
-            logger.debug(f"Loaded Google calendar metadata: {name}")
+            result = _google_metadata_from_entry(calendar_id, cal)
             
         # Cache the result
         _calendar_metadata_cache[cache_key] = result
@@ -507,14 +843,68 @@ def fetch_google_calendar_metadata(calendar_id: str) -> Dict[str, Any]:
         _calendar_metadata_cache[cache_key] = result
         return result
     
+def fetch_google_calendar_metadata_batch(calendar_ids: list) -> Dict[str, Dict[str, Any]]:
+    """Subscribe to and describe several Google calendars in batch round trips.
+
+    All calendarList().insert calls go out in one batch, then all
+    calendarList().get calls in another, instead of two requests per
+    calendar. Results are cached exactly like fetch_google_calendar_metadata().
+    """
+    unique_ids = list(dict.fromkeys(calendar_ids))
+    pending = [cid for cid in unique_ids if f"google_{cid}" not in _calendar_metadata_cache]
+    if not service or len(pending) < 2:
+        return {cid: fetch_google_calendar_metadata(cid) for cid in unique_ids}
+
+    inserts = _execute_google_batch({
+        str(i): service.calendarList().insert(body={"id": cid}) for i, cid in enumerate(pending)
+    })
+    for i, cid in enumerate(pending):
+        _, error = inserts[str(i)]
+        # Ignore 'Already Exists' errors
+        if error is not None and "Already Exists" not in str(error):
+            logger.warning(f"Couldn't subscribe to {cid}: {error}")
+
+    entries = _execute_google_batch({
+        str(i): service.calendarList().get(calendarId=cid) for i, cid in enumerate(pending)
+    })
+    for i, cid in enumerate(pending):
+        cal, error = entries[str(i)]
+        if error is not None or not cal:
+            logger.warning(f"Error getting metadata for Google calendar {cid}: {error}")
+            result = {"type": "google", "id": cid, "name": cid, "error": True}
+        else:
+            result = _google_metadata_from_entry(cid, cal)
+        _calendar_metadata_cache[f"google_{cid}"] = result
+
+    return {cid: _calendar_metadata_cache[f"google_{cid}"] for cid in unique_ids}
+
+
 # Browser-like headers shared by the ICS validation probe and the real content
-# fetch. Cloudflare-fronted hosts (e.g. inschool.fi/Wilma) challenge the default
-# python-requests User-Agent, so both paths must look identical to the server.
-_ICS_REQUEST_HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (compatible; Calendar-Bot/1.0)',
-    'Accept': 'text/calendar, text/plain, */*',
-    'Accept-Encoding': 'identity',
-}
+# fetch (also the pooled sessions' defaults, see http_pool.py). Feed downloads
+# override Accept-Encoding per host from _host_profiles.
+_ICS_REQUEST_HEADERS = http_pool.DEFAULT_HEADERS
+
+# Per-host concurrency, spacing and Retry-After deferral for probes and fetches
+_host_scheduler = HostScheduler(
+    max_per_host=ICS_HOST_MAX_CONCURRENCY,
+    min_interval=ICS_HOST_MIN_INTERVAL,
+    max_wait=ICS_RETRY_AFTER_MAX_WAIT,
+)
+
+
+def _defer_for_retry_after(url: str, status: int, headers) -> bool:
+    """Hold back *url*'s host when a 429/503 carries Retry-After. Returns True if deferred.
+
+    The caller should then raise so the retry queues behind the deferral
+    instead of counting the answer as a hard failure.
+    """
+    if status not in (429, 503):
+        return False
+    delay = parse_retry_after(headers.get("Retry-After"))
+    if delay is None:
+        return False
+    _host_scheduler.defer(url, delay)
+    return True
 
 
 def _derive_ics_name_from_url(url: str) -> str:
@@ -530,55 +920,42 @@ def _derive_ics_name_from_url(url: str) -> str:
     return name
 
 
-def fetch_ics_calendar_metadata(url: str) -> Dict[str, Any]:
-    """Fetch ICS Calendar metadata with enhanced validation and error handling."""
-    # Check cache first
+def fetch_ics_calendar_metadata(url: str, refresh: bool = False) -> Dict[str, Any]:
+    """Fetch ICS Calendar metadata with enhanced validation and error handling.
+
+    Results are cached with a TTL that depends on the outcome (see
+    metadata_cache.py); *refresh* bypasses the cache and re-validates.
+    """
+    # Check cache first (expired entries, errors included, are not returned)
     cache_key = f"ics_{url}"
-    if cache_key in _calendar_metadata_cache:
-        cached_result = _calendar_metadata_cache[cache_key]
-        if cached_result.get("error"):
-            # Different cache expiry times based on error type
-            error_type = cached_result.get("error_type", "unknown")
-            if error_type in ["authentication", "forbidden", "not_found"]:
-                # These are likely persistent config issues - cache for 6 hours
-                cache_duration = 6 * 3600  # 6 hours
-            elif error_type in ["method_not_allowed"]:
-                # Server doesn't support HEAD/GET - cache for 24 hours
-                cache_duration = 24 * 3600  # 24 hours
-            else:
-                # Network issues, timeouts - cache for 30 minutes
-                cache_duration = 30 * 60  # 30 minutes
-            
-            if cached_result.get("cached_at", 0) + cache_duration < time.time():
-                logger.debug(f"Cached {error_type} error expired for {url}, retrying validation")
-                del _calendar_metadata_cache[cache_key]
-            else:
-                logger.debug(f"Using cached metadata for ICS calendar {url} (error cached for {cache_duration/3600:.1f}h)")
-                return cached_result
-        else:
-            logger.debug(f"Using cached metadata for ICS calendar {url}")
-            return cached_result
-    
+    cached = None if refresh else _calendar_metadata_cache.get(cache_key)
+    if cached is not None:
+        logger.debug(f"Using cached metadata for ICS calendar {url}")
+        return cached
+
     try:
         # Validate via HEAD (cheap), falling back to a tiny ranged GET when the
         # server rejects HEAD. Both probes carry the same browser headers as the
         # real content fetch, and the whole probe is retried with backoff — so a
         # transient Cloudflare blip can't flip the calendar's name. (a)
         def _probe():
-            response = requests.head(
-                url, timeout=10, headers=_ICS_REQUEST_HEADERS, allow_redirects=True
-            )
+            with _host_scheduler.slot(url):
+                response = http_pool.head(
+                    url, timeout=10, headers=_ICS_REQUEST_HEADERS, allow_redirects=True
+                )
             if response.status_code == 405:
                 logger.debug(f"HEAD not allowed for {url}, validating via ranged GET")
-                response = requests.get(
-                    url,
-                    timeout=10,
-                    headers={**_ICS_REQUEST_HEADERS, "Range": "bytes=0-1023"},
-                    allow_redirects=True,
-                )
+                with _host_scheduler.slot(url):
+                    response = http_pool.get(
+                        url,
+                        timeout=10,
+                        headers={**_ICS_REQUEST_HEADERS, "Range": "bytes=0-1023"},
+                        allow_redirects=True,
+                    )
                 # 200 (range ignored) or 206 (partial) both mean the URL is good.
                 if response.status_code in (200, 206):
                     return "GET-partial"
+            _defer_for_retry_after(url, response.status_code, response.headers)
             response.raise_for_status()
             return "HEAD"
 
@@ -645,6 +1022,17 @@ def fetch_ics_calendar_metadata(url: str) -> Dict[str, Any]:
         _calendar_metadata_cache[cache_key] = result
         return result
         
+    except HostDeferred as hd:
+        # The host asked us to back off; validate on a later load instead
+        logger.info(f"Skipping validation of ICS calendar URL {url}: {hd}")
+        return {
+            "type": "ics",
+            "id": url,
+            "name": _derive_ics_name_from_url(url),
+            "validation_method": "unvalidated",
+            "cached_at": time.time(),
+        }
+
     except requests.exceptions.Timeout as te:
         logger.warning(f"Timeout validating ICS calendar URL {url}: {te}")
         result = {
@@ -701,24 +1089,181 @@ def fetch_ics_calendar_metadata(url: str) -> Dict[str, Any]:
 # ║ 📚 Source Loader                                                   ║
 # ║ Groups calendar sources by tag and loads them into memory         ║
 # ╚════════════════════════════════════════════════════════════════════╝
-def load_calendar_sources():
+# Tag → resolved source metadata. Filled in the background after the bot
+# starts (see start_calendar_source_loading); a tag appears once all of its
+# sources have been probed. Mutated in place so importers see updates.
+GROUPED_CALENDARS: Dict[str, list] = {}
+
+# Tags still resolving, and whether the first load has finished
+_pending_source_tags: set = set()
+_sources_loaded = False
+_source_load_task: asyncio.Task | None = None
+
+
+async def _google_metadata_batch_async(calendar_ids: list) -> Dict[str, Dict[str, Any]]:
+    """fetch_google_calendar_metadata_batch() in a worker thread; {} if it fails."""
+    if not calendar_ids:
+        return {}
     try:
-        logger.info("Loading calendar sources...")
-        grouped = {}
-        for ctype, cid, tag in parse_calendar_sources():
-            try:
-                meta = fetch_google_calendar_metadata(cid) if ctype == "google" else fetch_ics_calendar_metadata(cid)
-                meta["tag"] = tag
-                grouped.setdefault(tag, []).append(meta)
-                logger.debug(f"Calendar loaded: {meta}")
-            except Exception as e:
-                logger.exception(f"Error loading calendar source {cid} for tag {tag}: {e}")
-        return grouped
+        return await asyncio.to_thread(fetch_google_calendar_metadata_batch, calendar_ids)
     except Exception as e:
-        logger.exception(f"Error in load_calendar_sources: {e}")
+        logger.warning(f"Batched Google metadata lookup failed, loading calendars one by one: {e}")
         return {}
 
-GROUPED_CALENDARS = load_calendar_sources()
+
+async def _resolve_source_meta(source: dict, google_batch: asyncio.Task) -> Dict[str, Any]:
+    """Probe one source in a worker thread, reusing the shared Google batch result."""
+    if source["type"] == "google":
+        meta = (await google_batch).get(source["id"])
+        return meta or await asyncio.to_thread(fetch_google_calendar_metadata, source["id"])
+    return await asyncio.to_thread(fetch_ics_calendar_metadata, source["id"])
+
+
+async def load_calendar_sources_async() -> Dict[str, list]:
+    """Resolve every configured source concurrently and fill GROUPED_CALENDARS.
+
+    All tags are probed at once under the shared fan-out limits, Google
+    metadata in one batch. Each tag is published to GROUPED_CALENDARS as
+    soon as its own sources resolve; tags already loaded keep serving their
+    old metadata until then. Never raises.
+    """
+    global _sources_loaded
+    try:
+        logger.info("Loading calendar sources in the background...")
+        started = time.monotonic()
+        by_tag: Dict[str, list] = {}
+        for ctype, cid, tag in parse_calendar_sources():
+            by_tag.setdefault(tag, []).append({"type": ctype, "id": cid, "name": cid, "tag": tag})
+        _pending_source_tags.update(by_tag)
+
+        google_batch = asyncio.ensure_future(_google_metadata_batch_async(
+            [s["id"] for sources in by_tag.values() for s in sources if s["type"] == "google"]
+        ))
+
+        async def resolve_tag(tag: str, sources: list) -> None:
+            results = await _fetch_fanout.gather(
+                sources, lambda s: _resolve_source_meta(s, google_batch), context="source loading"
+            )
+            # Copy so a calendar shared by two tags keeps both tags
+            resolved = [{**meta, "tag": tag} for meta in results if meta]
+            if resolved:
+                GROUPED_CALENDARS[tag] = resolved
+            else:
+                GROUPED_CALENDARS.pop(tag, None)
+            _pending_source_tags.discard(tag)
+            logger.info(f"Tag {tag} ready: {len(resolved)}/{len(sources)} calendar(s) loaded")
+
+        try:
+            await asyncio.gather(*(resolve_tag(tag, sources) for tag, sources in by_tag.items()))
+        finally:
+            google_batch.cancel()
+
+        # Drop tags no longer configured and restore config order
+        ordered = {tag: GROUPED_CALENDARS[tag] for tag in by_tag if tag in GROUPED_CALENDARS}
+        GROUPED_CALENDARS.clear()
+        GROUPED_CALENDARS.update(ordered)
+        logger.info(
+            f"Loaded {sum(len(c) for c in ordered.values())} calendar(s) in {len(ordered)} tag(s) "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.exception(f"Error in load_calendar_sources_async: {e}")
+    finally:
+        _pending_source_tags.clear()
+        _sources_loaded = True
+    return GROUPED_CALENDARS
+
+
+def start_calendar_source_loading(reload: bool = False) -> asyncio.Task:
+    """Start loading calendar sources in the background and return the task.
+
+    A load already started on this event loop is reused (awaiting it waits
+    for every tag); *reload* starts a fresh one once the previous finished.
+    Must be called from the running event loop.
+    """
+    global _source_load_task
+    task = _source_load_task
+    if task is None or task.get_loop() is not asyncio.get_running_loop() or (reload and task.done()):
+        _source_load_task = asyncio.create_task(load_calendar_sources_async())
+    return _source_load_task
+
+
+def sources_warming_up() -> bool:
+    """True until the first background source load has finished."""
+    return not _sources_loaded
+
+
+def get_source_load_status() -> Dict[str, Any]:
+    """Progress of the background source load, for warm-up replies and health output."""
+    return {
+        "loaded": _sources_loaded,
+        "ready_tags": len(GROUPED_CALENDARS),
+        "pending_tags": sorted(_pending_source_tags),
+    }
+
+
+def _metadata_cache_key(meta: dict) -> str:
+    return f"{meta.get('type')}_{meta.get('id')}"
+
+
+def refresh_calendar_metadata(meta: dict) -> Dict[str, Any] | None:
+    """Re-probe one loaded source, bypassing the metadata cache.
+
+    Returns the new metadata, or None when the probe failed; a failure
+    never replaces metadata that was previously fetched successfully, so
+    a blip can't rename a calendar before its cache entry expires.
+    """
+    key = _metadata_cache_key(meta)
+    previous = _calendar_metadata_cache.get(key)
+    if meta.get("type") == "google":
+        fresh = fetch_google_calendar_metadata(meta["id"], refresh=True)
+    else:
+        fresh = fetch_ics_calendar_metadata(meta["id"], refresh=True)
+    if fresh.get("error") and previous is not None and not previous.get("error"):
+        _calendar_metadata_cache[key] = previous
+        logger.debug(f"Metadata refresh failed for {meta.get('name')}, keeping cached metadata")
+        return None
+    return fresh
+
+
+async def refresh_calendar_metadata_async() -> int:
+    """Refresh-ahead pass over loaded sources whose metadata is near expiry.
+
+    Due sources are re-probed concurrently and their GROUPED_CALENDARS
+    entries updated in place, so renamed calendars show up without a
+    restart. Returns the number of sources refreshed.
+    """
+    due: Dict[str, dict] = {}
+    for calendars in list(GROUPED_CALENDARS.values()):
+        for meta in calendars:
+            key = _metadata_cache_key(meta)
+            if key not in due and _calendar_metadata_cache.needs_refresh(key):
+                due[key] = meta
+    if not due:
+        return 0
+
+    results = await _fetch_fanout.gather(
+        list(due.values()), lambda meta: asyncio.to_thread(refresh_calendar_metadata, meta),
+        context="metadata refresh",
+    )
+    fresh_by_key = {key: fresh for key, fresh in zip(due, results) if fresh}
+    for calendars in list(GROUPED_CALENDARS.values()):
+        for meta in calendars:
+            fresh = fresh_by_key.get(_metadata_cache_key(meta))
+            if fresh is None:
+                continue
+            if fresh.get("name") != meta.get("name"):
+                logger.info(f"Calendar renamed: '{meta.get('name')}' → '{fresh.get('name')}' (tag {meta.get('tag')})")
+            tag = meta.get("tag")
+            meta.clear()
+            meta.update(fresh)
+            meta["tag"] = tag
+    update_metrics("metadata_refreshes", len(fresh_by_key))
+    logger.debug(f"Refreshed metadata for {len(fresh_by_key)}/{len(due)} due calendar(s)")
+    return len(fresh_by_key)
+
 
 # ╔════════════════════════════════════════════════════════════════════╗
 # ║ 💾 Event Snapshot Persistence                                      ║
@@ -739,7 +1284,7 @@ def save_current_events_for_key(key, events):
     try:
         logger.debug(f"Saving {len(events)} events under key: {key}")
         all_data = load_previous_events()
-        all_data[key] = events
+        all_data[key] = [event_to_dict(e) for e in events]
         with open(EVENTS_FILE, "w", encoding="utf-8") as f:
             json.dump(all_data, f, ensure_ascii=False)
         logger.info(f"Saved events for key '{key}'.")
@@ -750,59 +1295,285 @@ def save_current_events_for_key(key, events):
 # ║ 📆 Event Fetching                                                  ║
 # ║ Retrieves events from Google or ICS sources                        ║
 # ╚════════════════════════════════════════════════════════════════════╝
-def get_google_events(start_date, end_date, calendar_id):
-    """Fetch events from Google Calendar with robust error handling and retry logic."""
-    if not service:
-        logger.error(f"Google Calendar service not initialized, cannot fetch events for {calendar_id}")
-        return []
-    
-    # Check circuit breaker
+def _prepare_google_event(event: dict) -> dict:
+    """Simplify a Google event's title in place, preserving the original."""
+    original_title = event.get("summary", "")
+    if original_title:
+        simplified_title = simplify_event_title(original_title)
+        event["original_summary"] = original_title  # Preserve original
+        event["summary"] = simplified_title
+        logger.debug(f"Title simplified: '{original_title}' -> '{simplified_title}'")
+    return event
+
+
+# Partial-response mask: only the event fields the bot reads, plus paging/sync tokens
+_GOOGLE_EVENT_FIELDS = (
+    "nextPageToken,nextSyncToken,"
+    "items(id,summary,start,end,location,description,etag,updated,status)"
+)
+
+
+class GoogleListingError(Exception):
+    """A page of an events().list listing could not be fetched after retries."""
+
+
+def iter_google_event_pages(calendar_id: str, page_token: str | None = None, **params):
+    """Yield events().list response pages for *calendar_id* as they arrive.
+
+    Follows nextPageToken until the last page, which carries nextSyncToken
+    when the listing supports it. Only one page is held at a time. Raises
+    GoogleListingError if a page fails after retries; HttpErrors (including
+    410 for expired sync tokens) propagate unchanged.
+    """
+    while True:
+        def api_call():
+            return service.events().list(calendarId=calendar_id, pageToken=page_token, **params).execute()
+
+        page = retry_api_call(api_call, max_retries=3)
+        if page is None:
+            raise GoogleListingError(f"Listing events for {calendar_id} failed after retries")
+        yield page
+        page_token = page.get("nextPageToken")
+        if not page_token:
+            return
+
+
+def _list_google_events(calendar_id: str, page_token: str | None = None,
+                        **params) -> tuple[list, str | None] | None:
+    """Consume a listing page by page, simplifying titles as events arrive.
+
+    Returns ``(events, nextSyncToken)`` or None when a page failed after
+    retries. HttpErrors are raised to the caller. *page_token* resumes a
+    listing mid-way.
+    """
+    items: list = []
+    token = None
+    try:
+        for page in iter_google_event_pages(calendar_id, page_token, **params):
+            items.extend(_prepare_google_event(e) for e in page.get("items", []))
+            token = page.get("nextSyncToken")
+    except GoogleListingError as e:
+        logger.warning(str(e))
+        return None
+    return items, token
+
+
+def _google_time_bounds(start_date, end_date) -> tuple[str, str]:
+    return start_date.isoformat() + "T00:00:00Z", end_date.isoformat() + "T23:59:59Z"
+
+
+def _plan_google_listing(calendar_id: str, start_date, end_date,
+                         force_full: bool = False) -> tuple[str, dict, tuple | None]:
+    """Decide which events().list request answers a window.
+
+    Returns ``(kind, params, horizon)`` where kind is "incremental" (send
+    the stored syncToken), "full" (list the sync horizon around today and
+    keep the token) or "window" (plain ordered listing of the window when
+    incremental sync is disabled).
+    """
+    paging = {"maxResults": GOOGLE_EVENTS_PAGE_SIZE, "fields": _GOOGLE_EVENT_FIELDS}
+    if not GOOGLE_INCREMENTAL_SYNC:
+        start_utc, end_utc = _google_time_bounds(start_date, end_date)
+        params = {"timeMin": start_utc, "timeMax": end_utc, "singleEvents": True, "orderBy": "startTime"}
+        return "window", {**params, **paging}, None
+
+    if not force_full and not _google_sync.needs_full_sync(calendar_id, start_date, end_date):
+        params = {"syncToken": _google_sync.sync_token(calendar_id), "singleEvents": True}
+        return "incremental", {**params, **paging}, None
+
+    today = datetime.now(timezone.utc).date()
+    sync_start = min(start_date, today - timedelta(days=GOOGLE_SYNC_PAST_DAYS))
+    sync_end = max(end_date, today + timedelta(days=GOOGLE_SYNC_FUTURE_DAYS))
+    start_utc, end_utc = _google_time_bounds(sync_start, sync_end)
+    params = {"timeMin": start_utc, "timeMax": end_utc, "singleEvents": True}
+    return "full", {**params, **paging}, (sync_start, sync_end)
+
+
+def _apply_google_listing(calendar_id: str, start_date, end_date, kind: str,
+                          horizon: tuple | None, items: list, token: str | None) -> list:
+    """Fold a completed listing (titles already simplified) into the sync
+    store and return the window's events, normalized to Event."""
+    items = [item if item.get("status") == "cancelled" else to_event(item, calendar_id) for item in items]
+    if kind == "window":
+        return items
+
+    def in_window(event):
+        return _event_in_window(event, "google", start_date, end_date)
+
+    if kind == "incremental" and token:
+        delta = _google_sync.apply_changes(calendar_id, items, token)
+        update_metrics("google_incremental_syncs")
+        logger.debug(
+            f"Incremental sync for {calendar_id}: {len(delta['added'])} added, "
+            f"{len(delta['updated'])} updated, {len(delta['removed'])} removed"
+        )
+        return _google_sync.events_in_window(calendar_id, in_window)
+
+    update_metrics("google_full_syncs")
+    if not token or horizon is None:
+        # Nothing to resume from; answer this window only
+        logger.debug(f"No sync token returned for {calendar_id}, not keeping local state")
+        _google_sync.invalidate(calendar_id)
+        items = [e for e in items if e.get("status") != "cancelled" and in_window(e)]
+        items.sort(key=event_start_key)
+        return items
+
+    _google_sync.replace(calendar_id, items, token, horizon[0], horizon[1])
+    return _google_sync.events_in_window(calendar_id, in_window)
+
+
+def _list_google_window(start_date, end_date, calendar_id: str) -> list | None:
+    """Fetch one calendar's events for a window, incrementally when possible.
+
+    With GOOGLE_INCREMENTAL_SYNC the stored syncToken pulls only changes
+    since the last poll; there is a full sync over the horizon around
+    today when there is no token, the window is outside the synced
+    horizon, the state is older than GOOGLE_FULL_SYNC_HOURS, or Google
+    answers 410 Gone.
+    """
+    kind, params, horizon = _plan_google_listing(calendar_id, start_date, end_date)
+    logger.debug(f"Fetching Google events for calendar {calendar_id} ({kind} listing)")
+    try:
+        listed = _list_google_events(calendar_id, **params)
+    except HttpError as e:
+        if kind != "incremental" or e.resp.status != 410:
+            raise
+        logger.info(f"Sync token expired for Google calendar {calendar_id}, running full resync")
+        update_metrics("google_token_resets")
+        kind, params, horizon = _plan_google_listing(calendar_id, start_date, end_date, force_full=True)
+        listed = _list_google_events(calendar_id, **params)
+
+    if listed is None:
+        return None
+    items, token = listed
+    if kind == "incremental" and not token:
+        # Google always ends a sync with a token; without one, start over
+        kind, params, horizon = _plan_google_listing(calendar_id, start_date, end_date, force_full=True)
+        listed = _list_google_events(calendar_id, **params)
+        if listed is None:
+            return None
+        items, token = listed
+    return _apply_google_listing(calendar_id, start_date, end_date, kind, horizon, items, token)
+
+
+async def _list_google_events_async(calendar_id: str, page_token: str | None = None,
+                                    **params) -> tuple[list, str | None] | None:
+    """Async counterpart of _list_google_events() using the aiohttp client.
+
+    GoogleApiErrors are raised to the caller.
+    """
+    items: list = []
+    while True:
+        page = await _google_async.list_events(calendar_id, page_token, **params)
+        if page is None:
+            logger.warning(f"Listing events for {calendar_id} failed after retries")
+            return None
+        items.extend(_prepare_google_event(e) for e in page.get("items", []))
+        page_token = page.get("nextPageToken")
+        if not page_token:
+            return items, page.get("nextSyncToken")
+
+
+async def _list_google_window_async(start_date, end_date, calendar_id: str) -> list | None:
+    """Async counterpart of _list_google_window(); same sync-token handling."""
+    kind, params, horizon = _plan_google_listing(calendar_id, start_date, end_date)
+    logger.debug(f"Fetching Google events for calendar {calendar_id} ({kind} listing, async)")
+    try:
+        listed = await _list_google_events_async(calendar_id, **params)
+    except GoogleApiError as e:
+        if kind != "incremental" or e.status != 410:
+            raise
+        logger.info(f"Sync token expired for Google calendar {calendar_id}, running full resync")
+        update_metrics("google_token_resets")
+        kind, params, horizon = _plan_google_listing(calendar_id, start_date, end_date, force_full=True)
+        listed = await _list_google_events_async(calendar_id, **params)
+
+    if listed is None:
+        return None
+    items, token = listed
+    if kind == "incremental" and not token:
+        kind, params, horizon = _plan_google_listing(calendar_id, start_date, end_date, force_full=True)
+        listed = await _list_google_events_async(calendar_id, **params)
+        if listed is None:
+            return None
+        items, token = listed
+    return _apply_google_listing(calendar_id, start_date, end_date, kind, horizon, items, token)
+
+
+async def _fetch_google_events_async(start_date, end_date, calendar_id) -> list | None:
+    """Async counterpart of _fetch_google_events(): None on failure, and the
+    same circuit-breaker and metrics accounting."""
     if is_calendar_circuit_open(calendar_id):
         logger.debug(f"Circuit breaker open for Google calendar {calendar_id}, skipping")
-        return []
-    
+        return None
+
     try:
-        start_utc = start_date.isoformat() + "T00:00:00Z"
-        end_utc = end_date.isoformat() + "T23:59:59Z"
-        logger.debug(f"Fetching Google events for calendar {calendar_id} from {start_utc} to {end_utc}")
         update_metrics("requests_total")
-        
-        # Use retry_api_call to handle transient errors
-        def api_call():
-            return service.events().list(
-                calendarId=calendar_id,
-                timeMin=start_utc,
-                timeMax=end_utc,
-                singleEvents=True,
-                orderBy="startTime"
-            ).execute()
-        
-        result = retry_api_call(api_call, max_retries=3)
-        
-        if result is None:
+        items = await _list_google_window_async(start_date, end_date, calendar_id)
+        if items is None:
             logger.warning(f"Failed to fetch events for calendar {calendar_id} after retries")
-            return []
-            
-        items = result.get("items", [])
-        
-        # Process events to simplify titles
-        for event in items:
-            original_title = event.get("summary", "")
-            if original_title:
-                simplified_title = simplify_event_title(original_title)
-                event["original_summary"] = original_title  # Preserve original
-                event["summary"] = simplified_title
-                logger.debug(f"Title simplified: '{original_title}' -> '{simplified_title}'")
-        
+            return None
+
         logger.debug(f"Fetched {len(items)} Google events for {calendar_id}")
-        
-        # Record successful operation and update metrics
         record_calendar_success(calendar_id)
         update_metrics("requests_successful")
         update_metrics("events_processed", len(items))
-        
         return items
-        
+
+    except asyncio.CancelledError:
+        raise
+    except GoogleApiError as e:
+        if e.status in (401, 403, 404):
+            logger.error(f"Access denied or calendar not found for {calendar_id}: {e}")
+            logger.info("Check calendar permissions and ID validity.")
+            record_calendar_failure(calendar_id)
+            update_metrics("requests_failed")
+            update_metrics("auth_errors")
+        else:
+            logger.error(f"Google API error fetching events from calendar {calendar_id}: {e}")
+            update_metrics("requests_failed")
+        return None
+    except Exception as e:
+        logger.exception(f"Unexpected error fetching Google events from calendar {calendar_id}: {e}")
+        record_calendar_failure(calendar_id)
+        update_metrics("requests_failed")
+        return None
+
+
+def get_google_events(start_date, end_date, calendar_id):
+    """Fetch events from Google Calendar with robust error handling and retry logic."""
+    return _fetch_google_events(start_date, end_date, calendar_id) or []
+
+def _fetch_google_events(start_date, end_date, calendar_id) -> list | None:
+    """Fetch Google Calendar events, returning None on failure so callers can
+    tell a failed fetch apart from an empty calendar."""
+    if not service:
+        logger.error(f"Google Calendar service not initialized, cannot fetch events for {calendar_id}")
+        return None
+    
+    # Check circuit breaker
+    if is_calendar_circuit_open(calendar_id):
+        logger.debug(f"Circuit breaker open for Google calendar {calendar_id}, skipping")
+        return None
+    
+    try:
+        update_metrics("requests_total")
+
+        items = _list_google_window(start_date, end_date, calendar_id)
+
+        if items is None:
+            logger.warning(f"Failed to fetch events for calendar {calendar_id} after retries")
+            return None
+
+        logger.debug(f"Fetched {len(items)} Google events for {calendar_id}")
+        
+        # Record successful operation and update metrics
+        record_calendar_success(calendar_id)
+        update_metrics("requests_successful")
+        update_metrics("events_processed", len(items))
+        
+        return items
+        
     except (ssl.SSLError, OSError) as e:
         # Catch both ssl.SSLError and OSError for SSL-related socket errors
         if is_ssl_error(e):
@@ -811,7 +1582,7 @@ def get_google_events(start_date, end_date, calendar_id):
             record_calendar_failure(calendar_id)
             update_metrics("requests_failed")
             update_metrics("network_errors")
-            return []
+            return None
         else:
             # Not an SSL error, re-raise to be handled by the general exception handler
             raise
@@ -821,14 +1592,14 @@ def get_google_events(start_date, end_date, calendar_id):
         record_calendar_failure(calendar_id)
         update_metrics("requests_failed")
         update_metrics("network_errors")
-        return []
+        return None
     except requests.exceptions.Timeout as e:
         logger.error(f"Timeout error fetching Google events from calendar {calendar_id}: {e}")
         logger.info("Request timed out. The calendar will be retried on the next sync.")
         record_calendar_failure(calendar_id)
         update_metrics("requests_failed")
         update_metrics("network_errors")
-        return []
+        return None
     except HttpError as e:
         if e.resp.status in [403, 404]:
             logger.error(f"Access denied or calendar not found for {calendar_id}: {e}")
@@ -840,100 +1611,355 @@ def get_google_events(start_date, end_date, calendar_id):
             logger.error(f"Google API error fetching events from calendar {calendar_id}: {e}")
             update_metrics("requests_failed")
             # Don't record failure for temporary API issues (rate limits, etc)
-        return []
+        return None
     except Exception as e:
         logger.exception(f"Unexpected error fetching Google events from calendar {calendar_id}: {e}")
         record_calendar_failure(calendar_id)
         update_metrics("requests_failed")
-        return []
+        return None
 
-def _fetch_ics_content(url: str) -> str | None:
-    """Fetch raw ICS content from a URL with retry logic and HTTP error handling.
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 📦 prefetch_google_events                                          ║
+# ║ Lists many Google calendars in one batch and fills the event cache ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def prefetch_google_events(sources: list, start_date, end_date) -> set:
+    """Fetch the window for several Google calendars in one batch round trip.
+
+    Results go into the shared event cache, so the per-calendar get_events()
+    calls that follow are served locally. Per-item 403/404 errors are
+    recorded on that calendar's circuit breaker and returned so callers can
+    skip it; any other item failure is left for get_events() to retry on its
+    own. Returns the IDs of calendars that failed permanently.
 
-    Returns the response text on success, or None on failure.
-    Records circuit breaker state and metrics.
+    Batch results are handed over through the event cache, so nothing is
+    prefetched while it is disabled (warned about at startup).
     """
-    def fetch_calendar():
-        response = requests.get(url, timeout=30, headers=_ICS_REQUEST_HEADERS, allow_redirects=True)
-
-        http_error_handlers = {
-            401: ("auth_errors", "Authentication required"),
-            403: ("auth_errors", "Access forbidden"),
-            404: (None, "Calendar not found"),
-            405: (None, "Method not allowed"),
-            429: ("network_errors", "Rate limited"),
-        }
-        if response.status_code in http_error_handlers:
-            extra_metric, msg = http_error_handlers[response.status_code]
-            logger.warning(f"{msg} for ICS calendar {url} (HTTP {response.status_code})")
-            record_calendar_failure(url)
-            update_metrics("requests_failed")
-            if extra_metric:
-                update_metrics(extra_metric)
-            return []
-        if response.status_code >= 500:
-            logger.warning(f"Server error accessing ICS calendar {url} (HTTP {response.status_code})")
-            raise requests.exceptions.HTTPError(f"Server error: {response.status_code}")
+    if not service or not _event_cache.enabled:
+        return set()
+
+    pending: list = []
+    for meta in sources:
+        cid = meta.get("id")
+        if meta.get("type") != "google" or not cid or meta.get("error") or cid in pending:
+            continue
+        if is_calendar_circuit_open(cid) or _event_cache.covers("google", cid, start_date, end_date):
+            continue
+        pending.append(cid)
+    if len(pending) < 2:
+        # A single calendar is one round trip either way
+        return set()
+
+    plans = {
+        str(i): (cid, *_plan_google_listing(cid, start_date, end_date))
+        for i, cid in enumerate(pending)
+    }
+    results = _execute_google_batch({
+        request_id: service.events().list(calendarId=cid, **params)
+        for request_id, (cid, _, params, _) in plans.items()
+    })
+
+    failed = set()
+    for request_id, (cid, kind, params, horizon) in plans.items():
+        response, error = results[request_id]
+        if error is not None:
+            if isinstance(error, HttpError) and error.resp.status in (403, 404):
+                logger.error(f"Access denied or calendar not found for {cid}: {error}")
+                update_metrics("requests_total")
+                record_calendar_failure(cid)
+                update_metrics("requests_failed")
+                update_metrics("auth_errors")
+                failed.add(cid)
+            else:
+                logger.debug(f"Batched listing failed for {cid}, leaving it to a direct fetch: {error}")
+            continue
 
-        response.raise_for_status()
-        return response
+        try:
+            items = [_prepare_google_event(e) for e in response.get("items", [])]
+            token = response.get("nextSyncToken")
+            if response.get("nextPageToken"):
+                rest = _list_google_events(cid, page_token=response["nextPageToken"], **params)
+                if rest is None:
+                    continue
+                items, token = items + rest[0], rest[1]
+            if kind == "incremental" and not token:
+                continue
+            events = _apply_google_listing(cid, start_date, end_date, kind, horizon, items, token)
+        except Exception as e:
+            logger.warning(f"Could not use batched listing for {cid}: {e}")
+            continue
 
-    response = retry_with_backoff(fetch_calendar, max_retries=2, initial_delay=1.0)
+        update_metrics("requests_total")
+        record_calendar_success(cid)
+        update_metrics("requests_successful")
+        update_metrics("events_processed", len(events))
+        _event_cache.put("google", cid, start_date, end_date, events)
 
-    if isinstance(response, list):
-        return None
+    logger.debug(f"Batched Google prefetch: {len(pending)} calendars, {len(failed)} failed")
+    return failed
+
+
+# Validators + raw bodies for conditional ICS requests, and the events parsed
+# from each distinct body per window (a 304 or an unchanged 200 hits the latter)
+_feed_cache = FeedValidatorCache()
+# Per-host Accept-Encoding choice and wire vs decoded byte counts, persisted
+_host_profiles = HostProfileStore(enabled=ICS_COMPRESSION)
+_parsed_feed_cache = ParsedFeedCache(
+    max_entries=ICS_PARSE_CACHE_MAX_ENTRIES,
+    max_bytes=int(ICS_PARSE_CACHE_MAX_MB * 1024 * 1024),
+)
 
-    # Handle encoding issues
+# Worker processes for tokenizing large feeds off the GIL (None = in-process)
+_ics_parse_pool = IcsParsePool(
+    workers=ICS_PARSE_WORKERS,
+    min_bytes=ICS_PARSE_POOL_MIN_BYTES,
+    timeout=ICS_PARSE_TIMEOUT,
+    max_rss_mb=ICS_PARSE_WORKER_MAX_MB,
+) if ICS_PARSE_WORKERS > 0 else None
+
+
+def shutdown_ics_parse_pool() -> None:
+    """Stop the ICS parse worker processes, if any were started."""
+    if _ics_parse_pool is not None:
+        _ics_parse_pool.shutdown()
+
+
+# Statuses that fail an ICS fetch without retrying: status -> (extra metric, message)
+_ICS_HTTP_ERROR_HANDLERS = {
+    401: ("auth_errors", "Authentication required"),
+    403: ("auth_errors", "Access forbidden"),
+    404: (None, "Calendar not found"),
+    405: (None, "Method not allowed"),
+    429: ("network_errors", "Rate limited"),
+}
+
+
+def _handle_ics_http_error(url: str, status: int) -> bool:
+    """Record a non-retryable HTTP failure for an ICS feed. Returns True if handled."""
+    if status not in _ICS_HTTP_ERROR_HANDLERS:
+        return False
+    extra_metric, msg = _ICS_HTTP_ERROR_HANDLERS[status]
+    logger.warning(f"{msg} for ICS calendar {url} (HTTP {status})")
+    record_calendar_failure(url)
+    update_metrics("requests_failed")
+    if extra_metric:
+        update_metrics(extra_metric)
+    return True
+
+
+def _decode_ics_body(body, encoding: str | None, url: str) -> str | None:
+    """Decode a raw ICS body, falling back to latin-1 for unknown charsets.
+
+    *body* may be any buffer (bytes, bytearray, memoryview); it is decoded
+    in place without an intermediate ``bytes`` copy.
+    """
     try:
-        response.encoding = response.encoding or 'utf-8'
-        return response.text
-    except UnicodeDecodeError:
+        return str(body, encoding or 'utf-8', errors='replace')
+    except (LookupError, UnicodeDecodeError):
         logger.warning(f"Encoding error in ICS content from {url}, trying latin-1")
         try:
-            return response.content.decode('latin-1')
+            return str(body, 'latin-1')
         except UnicodeDecodeError:
             logger.warning(f"Failed to decode ICS content from {url}")
             return None
 
 
-def _validate_ics_content(content: str, url: str) -> str | None:
-    """Validate and preprocess ICS content. Returns cleaned content or None."""
-    if not content or len(content) < 50:
+def _note_ics_download(url: str, spooled: bool, size: int, wire_bytes: int | None,
+                       content_encoding: str | None) -> None:
+    if spooled:
+        logger.debug(f"ICS body from {url} spooled to disk ({size / 1_000_000:.1f} MB)")
+        update_metrics("downloads_spooled")
+    _host_profiles.record_transfer(url, wire_bytes, size, content_encoding)
+
+
+def flush_host_profiles() -> bool:
+    """Write pending per-host transfer counters to disk (blocking file I/O)."""
+    return _host_profiles.flush()
+
+
+def _skip_deferred_ics_fetch(url: str, error: HostDeferred) -> None:
+    """Count a fetch skipped because its host is still inside a long Retry-After."""
+    logger.info(f"Skipping ICS calendar {url}: {error}")
+    update_metrics("requests_failed")
+    update_metrics("requests_deferred")
+
+
+def _compression_failed(url: str, accept_encoding: str, error: Exception) -> bool:
+    """Switch *url*'s host to identity after a compressed transfer went wrong.
+
+    Returns True when the caller should refetch uncompressed, False when
+    identity was already in use and the error stands.
+    """
+    if accept_encoding == IDENTITY_ENCODING:
+        return False
+    _host_profiles.mark_identity(url, str(error) or type(error).__name__)
+    update_metrics("compression_fallbacks")
+    return True
+
+
+def _wire_bytes(response) -> int | None:
+    """Bytes read off the socket for a streamed ``requests`` response, before decoding."""
+    try:
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _reject_ics_download(url: str, error: FeedRejected) -> None:
+    logger.warning(f"Rejected ICS download from {url}: {error}")
+    update_metrics("downloads_rejected")
+
+
+# Adaptive change-detection intervals per source (see poll_scheduler.py)
+_poll_scheduler = PollScheduler(floor=POLL_MIN_INTERVAL, ceiling=POLL_MAX_INTERVAL)
+
+
+def _note_poll_hints(url: str, headers, body: bytes | None) -> None:
+    """Pass a feed response's refresh hints to the poll scheduler.
+
+    *body* is None for a 304, which keeps the feed's earlier hint.
+    """
+    _poll_scheduler.note_http_hint(url, cache_control_max_age(headers.get("Cache-Control")))
+    if body is not None:
+        _poll_scheduler.note_feed_hint(url, feed_refresh_hint(body))
+
+
+def _fetch_ics_content(url: str) -> tuple[bytes, str, bool] | None:
+    """Fetch raw ICS content from a URL with retry logic and HTTP error handling.
+
+    Sends If-None-Match / If-Modified-Since when validators are cached and
+    serves the stored body on ``304 Not Modified``. The body is streamed
+    under ICS_MAX_BYTES and sniffed on its first kilobyte, so HTML pages
+    and oversized responses are dropped early.
+
+    Returns ``(body, encoding, not_modified)`` on success, or None on
+    failure. The body is left undecoded; _validate_ics_content() decodes it
+    once it has passed. Records circuit breaker state and metrics.
+    """
+    def fetch_calendar(conditional_headers):
+        accept_encoding = _host_profiles.accept_encoding(url)
+        headers = {**_ICS_REQUEST_HEADERS, "Accept-Encoding": accept_encoding, **conditional_headers}
+        try:
+            with _host_scheduler.slot(url):
+                response = http_pool.get(url, timeout=30, headers=headers, allow_redirects=True, stream=True)
+                try:
+                    if response.status_code == 304:
+                        return response, b""
+                    if _defer_for_retry_after(url, response.status_code, response.headers):
+                        raise requests.exceptions.HTTPError(
+                            f"HTTP {response.status_code} with Retry-After", response=response
+                        )
+                    if _handle_ics_http_error(url, response.status_code):
+                        return []
+                    if response.status_code >= 500:
+                        logger.warning(f"Server error accessing ICS calendar {url} (HTTP {response.status_code})")
+                        raise requests.exceptions.HTTPError(f"Server error: {response.status_code}")
+
+                    response.raise_for_status()
+                    try:
+                        body, spooled = read_feed_body(
+                            response.iter_content(chunk_size=CHUNK_SIZE), ICS_MAX_BYTES, ICS_SPOOL_THRESHOLD,
+                            response.headers.get("Content-Length"), response.encoding,
+                        )
+                    except (UndecodedBody, requests.exceptions.ContentDecodingError) as e:
+                        if not _compression_failed(url, accept_encoding, e):
+                            if not isinstance(e, FeedRejected):
+                                raise
+                            _reject_ics_download(url, e)
+                            return []
+                        body = None
+                    except FeedRejected as e:
+                        _reject_ics_download(url, e)
+                        return []
+                    if body is not None:
+                        _note_ics_download(url, spooled, len(body), _wire_bytes(response),
+                                           response.headers.get("Content-Encoding"))
+                        return response, body
+                finally:
+                    # Releases the connection once the body is read; drops it if we stopped early
+                    response.close()
+        except HostDeferred as e:
+            _skip_deferred_ics_fetch(url, e)
+            return []
+        # The host mishandled compression and is on identity now
+        return fetch_calendar(conditional_headers)
+
+    conditional = _feed_cache.conditional_headers(url)
+    result = retry_with_backoff(lambda: fetch_calendar(conditional), max_retries=2, initial_delay=1.0)
+
+    if isinstance(result, list):
+        return None
+
+    response, body = result
+    if response.status_code == 304:
+        cached = _feed_cache.load_body(url)
+        if cached is not None:
+            logger.debug(f"ICS calendar {url} not modified, using cached body")
+            update_metrics("not_modified")
+            _note_poll_hints(url, response.headers, None)
+            body, encoding = cached
+            return body, encoding or 'utf-8', True
+
+        # Validators without a body are useless; drop them and fetch in full
+        logger.info(f"Cached body missing for {url} after 304, refetching unconditionally")
+        _feed_cache.forget(url)
+        result = retry_with_backoff(lambda: fetch_calendar({}), max_retries=2, initial_delay=1.0)
+        if isinstance(result, list) or result[0].status_code == 304:
+            return None
+        response, body = result
+
+    encoding = response.encoding or 'utf-8'
+    _feed_cache.store(url, response.headers, body, encoding)
+    _note_poll_hints(url, response.headers, body)
+    return body, encoding, False
+
+
+def _validate_ics_content(body: bytes, encoding: str | None, url: str) -> str | None:
+    """Validate raw ICS bytes, then preprocess and decode them once.
+
+    Checks run on the bytes with bounded prefix slices and ``find``, so no
+    lowered or re-encoded copy of the feed is made; only a body that passes
+    is decoded. Returns the cleaned text or None.
+    """
+    if not body or len(body) < 50:
         logger.warning(f"ICS content too small or empty from {url}")
         return None
-    if len(content) > 50_000_000:
-        logger.warning(f"ICS content too large (>{len(content)/1_000_000:.1f}MB) from {url}")
+    if len(body) > ICS_MAX_BYTES:
+        logger.warning(f"ICS content too large (>{len(body)/1_000_000:.1f}MB) from {url}")
         return None
 
-    content_lower = content.lower()
-    if content_lower.startswith('<!doctype') or '<html' in content_lower[:200]:
+    # Sniffing below assumes an ASCII-compatible charset
+    codec = wide_charset(body[:4], encoding)
+    if codec:
+        body = _decode_ics_body(body, codec, url).encode('utf-8')
+        encoding = 'utf-8'
+
+    start = len(codecs.BOM_UTF8) if body.startswith(codecs.BOM_UTF8) else 0
+    head = bytes(memoryview(body)[start:start + 200]).lower()
+    if head.startswith(b'<!doctype') or b'<html' in head:
         logger.warning(f"Received HTML content instead of ICS from {url} - likely an authentication or access issue")
         return None
-    if not content.startswith("BEGIN:VCALENDAR") or "END:VCALENDAR" not in content:
+    if not body.startswith(b"BEGIN:VCALENDAR", start) or body.rfind(b"END:VCALENDAR") < 0:
         logger.warning(f"Invalid ICS format (missing BEGIN/END markers) from {url}")
-        logger.debug(f"Content preview: {content[:200]}...")
+        logger.debug(f"Content preview: {_decode_ics_body(memoryview(body)[:200], encoding, url)}...")
         return None
-    if "BEGIN:VEVENT" not in content:
+    if body.find(b"BEGIN:VEVENT", start) < 0:
         logger.debug(f"No VEVENT blocks found in ICS from {url} - calendar may be empty")
         return None
-
-    content_bytes = content.encode('utf-8', errors='ignore')
-    if b'\x00' in content_bytes or '\x00' in content:
+    if body.find(b"\x00", start) >= 0:
         logger.warning(f"Suspicious content detected in ICS from {url}")
         return None
 
     # Preprocess unless explicitly disabled
     import os
     if os.getenv("DISABLE_ICS_PREPROCESSING", "false").lower() != "true":
-        original = content
         try:
-            content = preprocess_ics_content(content, url)
+            cleaned = preprocess_ics_bytes(body, url, start=start)
             logger.debug(f"ICS preprocessing completed for {url}")
+            return _decode_ics_body(cleaned, encoding, url)
         except Exception as e:
             logger.warning(f"Error preprocessing ICS content from {url}: {e}")
-            content = original
 
-    return content
+    return _decode_ics_body(memoryview(body)[start:], encoding, url)
 
 
 def _parse_ics_calendar(content: str, url: str):
@@ -982,6 +2008,80 @@ def _parse_ics_calendar(content: str, url: str):
     return None
 
 
+def _build_ics_event(original_title: str, begin_iso: str, end_iso: str, location: str, description: str) -> dict:
+    """Build the normalized event dict for one ICS occurrence.
+
+    The ID hashes the ISO begin/end strings, so both parsers (and worker
+    processes) produce the same IDs for the same event.
+    """
+    id_source = f"{original_title}|{begin_iso}|{end_iso}|{location}"
+
+    try:
+        simplified_title = simplify_event_title(original_title) if original_title else "Event"
+    except Exception:
+        simplified_title = original_title or "Event"
+    logger.debug(f"ICS title simplified: '{original_title}' -> '{simplified_title}'")
+
+    return {
+        "summary": simplified_title,
+        "original_summary": original_title,
+        "start": {"dateTime": begin_iso},
+        "end": {"dateTime": end_iso},
+        "location": location,
+        "description": description,
+        "id": hashlib.md5(id_source.encode("utf-8")).hexdigest(),
+    }
+
+
+def _extract_streamed_events(content: str, url: str, start_date, end_date) -> list | None:
+    """Extract events with the streaming tokenizer, one VEVENT at a time.
+
+    VEVENT blocks that cannot overlap the window are dropped by the raw
+    text pre-filter; only the rest are tokenized and resolved. Large feeds
+    go to the ICS parse pool when it is enabled. Raises IcsStreamError
+    when the feed's structure cannot be followed, so the caller can fall
+    back to the ics library; returns None when a worker blew its budget.
+    """
+    if _ics_parse_pool is not None and _ics_parse_pool.should_offload(content):
+        try:
+            rows = _ics_parse_pool.parse(content, start_date, end_date, url)
+        except ParseBudgetExceeded as e:
+            logger.warning(f"Parsing ICS calendar {url} exceeded the worker budget: {e}")
+            update_metrics("parsing_errors")
+            return None
+    else:
+        rows = extract_window_occurrences(content, start_date, end_date, url)
+
+    events = []
+    for original_title, begin_iso, end_iso, location, description in rows:
+        try:
+            events.append(_build_ics_event(original_title, begin_iso, end_iso, location, description))
+        except Exception as err:
+            logger.warning(f"Error creating event object from {url}: {err}")
+    return events
+
+
+def _parse_ics_events(content: str, url: str, start_date, end_date) -> list | None:
+    """Parse validated ICS content into window events.
+
+    Uses the streaming tokenizer and falls back to the ics library for
+    feeds it cannot follow. Returns None when neither can parse the feed.
+    """
+    if ICS_STREAM_PARSER:
+        try:
+            return _extract_streamed_events(content, url, start_date, end_date)
+        except IcsStreamError as e:
+            logger.info(f"Streaming parser could not read {url} ({e}), falling back to ics library")
+            update_metrics("ics_stream_fallbacks")
+
+    # The ics library parses everything it is given, so hand it only the
+    # VEVENT blocks that can fall in the window (VTIMEZONEs are kept)
+    cal = _parse_ics_calendar(prefilter_ics_window(content, start_date, end_date), url)
+    if cal is None:
+        return None
+    return _extract_ics_events(cal, url, start_date, end_date)
+
+
 def _extract_ics_events(cal, url: str, start_date, end_date) -> list:
     """Extract and normalize events from a parsed ICS calendar."""
     if not hasattr(cal, 'events') or cal.events is None:
@@ -1026,25 +2126,8 @@ def _extract_ics_events(cal, url: str, start_date, end_date) -> list:
                 except (UnicodeDecodeError, UnicodeEncodeError, Exception):
                     original_title, location, description = "Event", "", ""
 
-                id_source = f"{original_title}|{e.begin}|{e.end}|{location}"
-
-                try:
-                    simplified_title = simplify_event_title(original_title) if original_title else "Event"
-                except Exception:
-                    simplified_title = original_title or "Event"
-
                 try:
-                    event = {
-                        "summary": simplified_title,
-                        "original_summary": original_title,
-                        "start": {"dateTime": e.begin.isoformat()},
-                        "end": {"dateTime": e.end.isoformat()},
-                        "location": location,
-                        "description": description,
-                        "id": hashlib.md5(id_source.encode("utf-8")).hexdigest(),
-                    }
-                    events.append(event)
-                    logger.debug(f"ICS title simplified: '{original_title}' -> '{simplified_title}'")
+                    events.append(_build_ics_event(original_title, e.begin.isoformat(), e.end.isoformat(), location, description))
                 except Exception as err:
                     logger.warning(f"Error creating event object from {url}: {err}")
 
@@ -1081,35 +2164,62 @@ def _deduplicate_events(events: list, url: str) -> list:
     return deduped
 
 
+def _process_ics_content(body: bytes, encoding: str | None, url: str, start_date, end_date) -> list | None:
+    """Turn a downloaded ICS body into deduplicated events for the window.
+
+    CPU-bound: validates, parses, extracts and deduplicates. A body that
+    was already parsed for the same window (a 304, or a 200 with identical
+    bytes) is answered from the parsed-feed cache instead. Returns None
+    when the content cannot be used.
+    """
+    cache_key = ParsedFeedCache.content_key(body, start_date, end_date, encoding)
+    cached = _parsed_feed_cache.get(cache_key)
+    if cached is not None:
+        logger.debug(f"ICS body from {url} unchanged, reusing {len(cached)} parsed events")
+        return cached
+
+    content = _validate_ics_content(body, encoding, url)
+    if content is None:
+        return None
+
+    events = _parse_ics_events(content, url, start_date, end_date)
+    if events is None:
+        return None
+
+    events = [to_event(e, url) for e in events]
+    deduped = _deduplicate_events(events, url)
+    _parsed_feed_cache.put(cache_key, deduped)
+    return deduped
+
+
 def get_ics_events(start_date, end_date, url):
     """Fetch events from ICS calendar with robust error handling and circuit breaker."""
+    return _fetch_ics_events(start_date, end_date, url) or []
+
+def _fetch_ics_events(start_date, end_date, url) -> list | None:
+    """Fetch ICS events, returning None on failure so callers can tell a
+    failed fetch apart from an empty calendar."""
     if is_calendar_circuit_open(url):
         logger.debug(f"Circuit breaker open for ICS calendar {url}, skipping")
-        return []
+        return None
 
     try:
         logger.debug(f"Fetching ICS events from {url}")
         update_metrics("requests_total")
 
-        content = _fetch_ics_content(url)
-        if content is None:
-            return []
-
-        content = _validate_ics_content(content, url)
-        if content is None:
-            return []
-
-        cal = _parse_ics_calendar(content, url)
-        if cal is None:
-            return []
+        fetched = _fetch_ics_content(url)
+        if fetched is None:
+            return None
+        body, encoding, _ = fetched
 
-        events = _extract_ics_events(cal, url, start_date, end_date)
-        deduped = _deduplicate_events(events, url)
+        events = _process_ics_content(body, encoding, url, start_date, end_date)
+        if events is None:
+            return None
 
         record_calendar_success(url)
         update_metrics("requests_successful")
-        update_metrics("events_processed", len(deduped))
-        return deduped
+        update_metrics("events_processed", len(events))
+        return events
 
     except requests.exceptions.HTTPError as e:
         logger.warning(f"HTTP error fetching ICS calendar {url}: {e}")
@@ -1121,105 +2231,342 @@ def get_ics_events(start_date, end_date, url):
         else:
             update_metrics("requests_failed")
             update_metrics("network_errors")
-        return []
+        return None
     except requests.exceptions.RequestException as e:
         logger.warning(f"Network error fetching ICS calendar {url}: {e}")
         record_calendar_failure(url)
         update_metrics("requests_failed")
         update_metrics("network_errors")
-        return []
+        return None
     except (ssl.SSLError, OSError) as e:
         if is_ssl_error(e):
             logger.warning(f"SSL error fetching ICS calendar {url}: {e}")
             record_calendar_failure(url)
             update_metrics("requests_failed")
             update_metrics("network_errors")
-            return []
+            return None
+        raise
+    except Exception as e:
+        logger.exception(f"Unexpected error fetching/parsing ICS calendar {url}: {e}")
+        record_calendar_failure(url)
+        update_metrics("requests_failed")
+        return None
+
+async def _fetch_ics_content_async(url: str) -> tuple[bytes, str, bool] | None:
+    """Async variant of _fetch_ics_content() using the shared aiohttp session.
+
+    Same conditional-GET, status handling and retry policy; the request is
+    cancelled together with the calling task.
+    """
+    session = await http_pool.get_async_session()
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async def fetch_calendar(conditional_headers):
+        # Host profiles load and save JSON on disk: keep that off the loop too
+        accept_encoding = await asyncio.to_thread(_host_profiles.accept_encoding, url)
+        headers = {"Accept-Encoding": accept_encoding, **conditional_headers}
+        try:
+            async with _host_scheduler.async_slot(url):
+                async with session.get(url, headers=headers, timeout=timeout, allow_redirects=True) as response:
+                    if response.status == 304:
+                        return response.status, response.headers, b"", None
+                    if not _defer_for_retry_after(url, response.status, response.headers):
+                        if _handle_ics_http_error(url, response.status):
+                            return None
+                    if response.status >= 500:
+                        logger.warning(f"Server error accessing ICS calendar {url} (HTTP {response.status})")
+                    response.raise_for_status()
+                    content_encoding = response.headers.get("Content-Encoding")
+                    try:
+                        body, spooled = await read_feed_body_async(
+                            response.content.iter_chunked(CHUNK_SIZE), ICS_MAX_BYTES, ICS_SPOOL_THRESHOLD,
+                            response.content_length, response.charset,
+                        )
+                    except (UndecodedBody, aiohttp.ClientPayloadError) as e:
+                        if not await asyncio.to_thread(_compression_failed, url, accept_encoding, e):
+                            if not isinstance(e, FeedRejected):
+                                raise
+                            _reject_ics_download(url, e)
+                            return None
+                        body = None
+                    except FeedRejected as e:
+                        _reject_ics_download(url, e)
+                        return None
+                    if body is not None:
+                        # aiohttp decodes transparently; Content-Length is the only wire size it exposes
+                        _note_ics_download(url, spooled, len(body), response.content_length, content_encoding)
+                        return response.status, response.headers, body, response.charset
+        except HostDeferred as e:
+            _skip_deferred_ics_fetch(url, e)
+            return None
+        # The host mishandled compression and is on identity now
+        return await fetch_calendar(conditional_headers)
+
+    # The validator index and cached bodies live on disk: keep their I/O off the loop
+    conditional = await asyncio.to_thread(_feed_cache.conditional_headers, url)
+    result = await async_retry_with_backoff(lambda: fetch_calendar(conditional), max_retries=3)
+    if result is None:
+        return None
+
+    status, headers, body, charset = result
+    if status == 304:
+        cached = await asyncio.to_thread(_feed_cache.load_body, url)
+        if cached is not None:
+            logger.debug(f"ICS calendar {url} not modified, using cached body")
+            update_metrics("not_modified")
+            _note_poll_hints(url, headers, None)
+            return cached[0], cached[1] or 'utf-8', True
+
+        logger.info(f"Cached body missing for {url} after 304, refetching unconditionally")
+        await asyncio.to_thread(_feed_cache.forget, url)
+        result = await async_retry_with_backoff(lambda: fetch_calendar({}), max_retries=3)
+        if result is None or result[0] == 304:
+            return None
+        status, headers, body, charset = result
+
+    encoding = charset or 'utf-8'
+    await asyncio.to_thread(_feed_cache.store, url, headers, body, encoding)
+    _note_poll_hints(url, headers, body)
+    return body, encoding, False
+
+
+async def _fetch_ics_events_async(start_date, end_date, url) -> list | None:
+    """Async variant of _fetch_ics_events(); None means the fetch failed."""
+    if is_calendar_circuit_open(url):
+        logger.debug(f"Circuit breaker open for ICS calendar {url}, skipping")
+        return None
+
+    try:
+        logger.debug(f"Fetching ICS events from {url} (async)")
+        update_metrics("requests_total")
+
+        fetched = await _fetch_ics_content_async(url)
+        if fetched is None:
+            return None
+        body, encoding, _ = fetched
+
+        # Parsing is CPU-bound; keep it off the event loop
+        events = await asyncio.to_thread(_process_ics_content, body, encoding, url, start_date, end_date)
+        if events is None:
+            return None
+
+        record_calendar_success(url)
+        update_metrics("requests_successful")
+        update_metrics("events_processed", len(events))
+        return events
+
+    except asyncio.CancelledError:
+        raise
+    except aiohttp.ClientResponseError as e:
+        logger.warning(f"HTTP error fetching ICS calendar {url}: {e.status} {e.message}")
+        update_metrics("requests_failed")
+        update_metrics("network_errors")
+        return None
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning(f"Network error fetching ICS calendar {url}: {type(e).__name__} {e}")
+        record_calendar_failure(url)
+        update_metrics("requests_failed")
+        update_metrics("network_errors")
+        return None
+    except (ssl.SSLError, OSError) as e:
+        if is_ssl_error(e):
+            logger.warning(f"SSL error fetching ICS calendar {url}: {e}")
+            record_calendar_failure(url)
+            update_metrics("requests_failed")
+            update_metrics("network_errors")
+            return None
         raise
     except Exception as e:
         logger.exception(f"Unexpected error fetching/parsing ICS calendar {url}: {e}")
         record_calendar_failure(url)
         update_metrics("requests_failed")
+        return None
+
+
+async def get_ics_events_async(start_date, end_date, url):
+    """Async variant of get_ics_events()."""
+    return await _fetch_ics_events_async(start_date, end_date, url) or []
+
+
+def _resolve_source(source_meta, start_date, end_date) -> list | tuple[str, str]:
+    """Validate source metadata and consult the shared event cache.
+
+    Returns a list when the request is answered without fetching (cache hit,
+    skipped or invalid source), otherwise ``(source_type, source_id)``.
+    """
+    logger.debug(f"Getting events from source: {source_meta['name']} ({source_meta['type']})")
+
+    # Validate source metadata
+    if not isinstance(source_meta, dict):
+        logger.error(f"Invalid source metadata: {source_meta}")
+        return []
+
+    source_type = source_meta.get("type")
+    source_id = source_meta.get("id")
+    source_name = source_meta.get("name", "Unknown")
+
+    if not source_type or not source_id:
+        logger.error(f"Missing required fields in source metadata: {source_meta}")
+        return []
+
+    # Check if this source has validation errors and should be skipped
+    if source_meta.get("error"):
+        error_type = source_meta.get("error_type", "unknown")
+        if error_type in ["authentication", "forbidden", "not_found", "method_not_allowed"]:
+            # Only log this occasionally to avoid spam
+            if source_meta.get("cached_at", 0) + 3600 < time.time():  # Log once per hour
+                logger.info(f"Skipping calendar '{source_name}' - {error_type} error (will retry in {(6 if error_type in ['authentication', 'forbidden', 'not_found'] else 24)}h)")
+                source_meta["cached_at"] = time.time()  # Update to reduce log frequency
+            return []
+        # For other error types (timeout, connection, etc.), still try to fetch
+        # as they might be temporary issues
+
+    if source_type not in ("google", "ics"):
+        logger.warning(f"Unknown calendar source type '{source_type}' for source '{source_name}'")
+        return []
+
+    # Serve from the shared cache when a covering window is still fresh
+    cached = _event_cache.get(source_type, source_id, start_date, end_date)
+    if cached is not None:
+        logger.debug(f"Event cache hit for '{source_name}' ({start_date} to {end_date})")
+        return cached
+
+    return source_type, source_id
+
+
+def _store_fetched(source_type, source_id, start_date, end_date, events: list | None) -> list:
+    # Only successful fetches are cached so failures get retried next time
+    if events is None:
         return []
+    events = [to_event(e, source_id) for e in events]
+    _event_cache.put(source_type, source_id, start_date, end_date, events)
+    return events
+
 
 def get_events(source_meta, start_date, end_date):
     """Fetch events from a calendar source with comprehensive error handling."""
     try:
-        logger.debug(f"Getting events from source: {source_meta['name']} ({source_meta['type']})")
-        
-        # Validate source metadata
-        if not isinstance(source_meta, dict):
-            logger.error(f"Invalid source metadata: {source_meta}")
-            return []
-            
-        source_type = source_meta.get("type")
-        source_id = source_meta.get("id")
-        source_name = source_meta.get("name", "Unknown")
-        
-        if not source_type or not source_id:
-            logger.error(f"Missing required fields in source metadata: {source_meta}")
-            return []
-        
-        # Check if this source has validation errors and should be skipped
-        if source_meta.get("error"):
-            error_type = source_meta.get("error_type", "unknown")
-            if error_type in ["authentication", "forbidden", "not_found", "method_not_allowed"]:
-                # Only log this occasionally to avoid spam
-                if source_meta.get("cached_at", 0) + 3600 < time.time():  # Log once per hour
-                    logger.info(f"Skipping calendar '{source_name}' - {error_type} error (will retry in {(6 if error_type in ['authentication', 'forbidden', 'not_found'] else 24)}h)")
-                    source_meta["cached_at"] = time.time()  # Update to reduce log frequency
-                return []
-            # For other error types (timeout, connection, etc.), still try to fetch
-            # as they might be temporary issues
-        
+        resolved = _resolve_source(source_meta, start_date, end_date)
+        if isinstance(resolved, list):
+            return resolved
+        source_type, source_id = resolved
+
         # Route to appropriate fetcher based on source type
         if source_type == "google":
-            return get_google_events(start_date, end_date, source_id)
-        elif source_type == "ics":
-            return get_ics_events(start_date, end_date, source_id)
+            events = _fetch_google_events(start_date, end_date, source_id)
         else:
-            logger.warning(f"Unknown calendar source type '{source_type}' for source '{source_name}'")
-            return []
-            
+            events = _fetch_ics_events(start_date, end_date, source_id)
+        return _store_fetched(source_type, source_id, start_date, end_date, events)
+
     except Exception as e:
         source_name = source_meta.get("name", "Unknown") if isinstance(source_meta, dict) else "Unknown"
         logger.exception(f"Unexpected error getting events from source '{source_name}': {e}")
         return []
 
-# ╔════════════════════════════════════════════════════════════════════╗
-# ║ 🧬 compute_event_fingerprint                                       ║
-# ║ Generates a stable hash for an event's core details               ║
-# ╚════════════════════════════════════════════════════════════════════╝
-def compute_event_fingerprint(event: dict) -> str:
+
+async def get_events_async(source_meta, start_date, end_date, return_none_on_failure: bool = False):
+    """Async counterpart of get_events() for code running on the event loop.
+
+    ICS feeds are downloaded with aiohttp so cancelling the caller (e.g. an
+    ``asyncio.wait_for`` timeout) aborts the request itself; only parsing is
+    handed to a worker thread. Google sources are listed with the aiohttp
+    client too, unless it is unavailable (GOOGLE_ASYNC_CLIENT off or no
+    readable service-account file), in which case the blocking client runs
+    in a thread.
+
+    A failed fetch (network or HTTP error, open circuit breaker) gives ``[]``,
+    or None with *return_none_on_failure*, for callers such as change
+    detection that must tell a failure from an empty calendar.
+    """
+    failed = None if return_none_on_failure else []
     try:
-        def normalize_time(val: str) -> str:
-            if "Z" in val:
-                val = val.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(val)
-            return dt.isoformat(timespec="minutes")
+        resolved = _resolve_source(source_meta, start_date, end_date)
+        if isinstance(resolved, list):
+            return resolved
+        source_type, source_id = resolved
+
+        if source_type == "google" and _google_async is not None:
+            events = await _fetch_google_events_async(start_date, end_date, source_id)
+        elif source_type == "google":
+            events = await asyncio.to_thread(_fetch_google_events, start_date, end_date, source_id)
+        else:
+            events = await _fetch_ics_events_async(start_date, end_date, source_id)
+        if events is None:
+            return failed
+        return _store_fetched(source_type, source_id, start_date, end_date, events)
 
-        def clean(text: str) -> str:
-            return " ".join(text.strip().split())
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        source_name = source_meta.get("name", "Unknown") if isinstance(source_meta, dict) else "Unknown"
+        logger.exception(f"Unexpected error getting events from source '{source_name}': {e}")
+        return failed
 
-        summary = clean(event.get("summary", ""))
-        location = clean(event.get("location", ""))
-        description = clean(event.get("description", ""))
 
-        start_raw = event["start"].get("dateTime", event["start"].get("date", ""))
-        end_raw = event["end"].get("dateTime", event["end"].get("date", ""))
-        start = normalize_time(start_raw)
-        end = normalize_time(end_raw)
+# Shared limits for reading many sources at once (tasks and slash commands)
+# (Google listings on the async client hold no thread and are paced by the
+# quota governor, so they get their own, wider cap)
+_fetch_fanout = FetchFanout(
+    concurrency=FETCH_CONCURRENCY,
+    per_host=FETCH_HOST_CONCURRENCY,
+    host_limits={GOOGLE_HOST: GOOGLE_FETCH_CONCURRENCY} if _google_async is not None else None,
+)
 
-        trimmed = {
-            "summary": summary,
-            "start": start,
-            "end": end,
-            "location": location,
-            "description": description
-        }
 
-        normalized_json = json.dumps(trimmed, sort_keys=True)
-        return hashlib.md5(normalized_json.encode("utf-8")).hexdigest()
+async def gather_events_async(sources: list, start_date, end_date, fetch=None) -> list:
+    """Fetch events for every source in *sources* concurrently.
+
+    Runs under the shared global and per-host limits. Result ``i`` belongs
+    to ``sources[i]``; it is ``None`` if that source's fetch raised, and one
+    failing source never affects the others. *fetch* replaces
+    ``get_events_async(meta, start_date, end_date)`` for callers that add
+    their own timeout or logging.
+    """
+    if fetch is None:
+        async def fetch(meta):
+            return await get_events_async(meta, start_date, end_date)
+    return await _fetch_fanout.gather(sources, fetch)
+
+def is_source_poll_due(source_id: str) -> bool:
+    """Whether change detection should fetch *source_id* this cycle."""
+    return _poll_scheduler.is_due(source_id)
+
+
+def record_source_poll(source_id: str, events: list | None) -> bool:
+    """Feed a change-detection fetch result into the adaptive poll scheduler.
+
+    *events* None means the fetch failed. Returns True if the source's
+    events changed since its previous poll, which tightens its interval;
+    unchanged polls back it off.
+    """
+    if events is None:
+        _poll_scheduler.record_failure(source_id)
+        return False
+    digest = hashlib.blake2b(digest_size=16)
+    for fingerprint in sorted(compute_event_fingerprint(e) for e in events):
+        digest.update(fingerprint.encode())
+    return _poll_scheduler.record(source_id, digest.hexdigest())
+
+
+def get_source_poll_interval(source_id: str) -> float | None:
+    """Current change-detection interval of *source_id* in seconds, if polled yet."""
+    return _poll_scheduler.interval(source_id)
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🧬 compute_event_fingerprint                                       ║
+# ║ Generates a stable hash for an event's core details               ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def compute_event_fingerprint(event: dict) -> str:
+    if isinstance(event, Event):
+        return event.fingerprint
+    try:
+        return event_fingerprint(
+            event.get("summary", ""),
+            event["start"].get("dateTime", event["start"].get("date", "")),
+            event["end"].get("dateTime", event["end"].get("date", "")),
+            event.get("location", ""),
+            event.get("description", ""),
+        )
     except Exception as e:
         logger.exception(f"Error computing event fingerprint: {e}")
         return ""
@@ -0,0 +1,244 @@
+"""On-disk cache of ICS feed bodies and their HTTP validators.
+
+Stores the ``ETag`` / ``Last-Modified`` of each feed together with the raw
+body, so the next poll can send ``If-None-Match`` / ``If-Modified-Since``
+and reuse the stored body when the server answers ``304 Not Modified``.
+The index and bodies live under ``/data/ics_cache`` and survive restarts.
+
+Also holds the in-memory cache of parsed feeds, keyed by a hash of the
+body, so a byte-identical download skips parsing altogether.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from event_model import Event, copy_event
+from log import logger
+from storage import data_path, load_json, save_json
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🏷️ FeedValidatorCache                                              ║
+# ║ Persists validators + raw bodies for conditional ICS requests      ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class FeedValidatorCache:
+    """Per-URL HTTP validators and raw bodies, persisted to disk.
+
+    The index (``index.json``) maps each URL to its validators, the body
+    file name and the charset the body was decoded with. Bodies are stored
+    verbatim, one file per URL. Thread-safe.
+    """
+
+    def __init__(self, directory: str | None = None):
+        self._directory = directory
+        self._index: dict[str, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    # -- paths --
+
+    def _dir(self) -> str:
+        if self._directory is None:
+            self._directory = os.path.dirname(data_path("ics_cache", "index.json"))
+        else:
+            os.makedirs(self._directory, exist_ok=True)
+        return self._directory
+
+    def _index_path(self) -> str:
+        return os.path.join(self._dir(), "index.json")
+
+    @staticmethod
+    def _body_name(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest() + ".ics"
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        if self._index is None:
+            index = load_json(self._index_path(), {})
+            self._index = index if isinstance(index, dict) else {}
+        return self._index
+
+    # -- public API --
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers for *url*.
+
+        Only returned when the matching body is still on disk, so a 304
+        can always be served.
+        """
+        with self._lock:
+            entry = self._load_index().get(url)
+            if not entry:
+                return {}
+            if not os.path.exists(os.path.join(self._dir(), entry["body_file"])):
+                return {}
+            headers = {}
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            return headers
+
+    def store(self, url: str, response_headers, body: bytes, encoding: str | None) -> bool:
+        """Persist validators and body for *url*. Returns True if stored.
+
+        Feeds without an ETag or Last-Modified are not stored since they
+        can never be revalidated.
+        """
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        with self._lock:
+            index = self._load_index()
+            if not etag and not last_modified:
+                if index.pop(url, None) is not None:
+                    save_json(self._index_path(), index)
+                return False
+
+            body_file = self._body_name(url)
+            try:
+                tmp_path = os.path.join(self._dir(), f".{body_file}.tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(body)
+                os.replace(tmp_path, os.path.join(self._dir(), body_file))
+            except OSError as e:
+                logger.warning(f"Could not cache ICS body for {url}: {e}")
+                return False
+
+            index[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "encoding": encoding,
+                "body_file": body_file,
+                "size": len(body),
+                "stored_at": time.time(),
+            }
+            save_json(self._index_path(), index)
+            return True
+
+    def load_body(self, url: str) -> tuple[bytes, str | None] | None:
+        """Return ``(body, encoding)`` stored for *url*, or None."""
+        with self._lock:
+            entry = self._load_index().get(url)
+            if not entry:
+                return None
+            try:
+                with open(os.path.join(self._dir(), entry["body_file"]), "rb") as f:
+                    return f.read(), entry.get("encoding")
+            except OSError as e:
+                logger.warning(f"Cached ICS body for {url} unreadable: {e}")
+                return None
+
+    def forget(self, url: str) -> None:
+        """Drop validators and body for *url*."""
+        with self._lock:
+            entry = self._load_index().pop(url, None)
+            if entry is None:
+                return
+            save_json(self._index_path(), self._index)
+            try:
+                os.remove(os.path.join(self._dir(), entry["body_file"]))
+            except OSError:
+                pass
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return url in self._load_index()
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🧮 ParsedFeedCache                                                 ║
+# ║ Extracted events keyed by body hash + window, LRU with memory cap  ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def _estimate_events_size(events: list) -> int:
+    """Rough in-memory size of an event list in bytes."""
+    size = 64
+    for event in events:
+        # Slotted Events are smaller than the nested dicts (and share interned text)
+        size += 400 if isinstance(event, Event) else 600
+        for field in ("summary", "original_summary", "description", "location"):
+            value = event.get(field)
+            if isinstance(value, str):
+                size += len(value)
+    return size
+
+
+class ParsedFeedCache:
+    """Deduplicated events per ``(body hash, start_date, end_date)``.
+
+    Most polls return a byte-identical feed, and then validation,
+    parsing, extraction and deduplication would all produce the same list
+    again. Entries are evicted least-recently-used first once either
+    ``max_entries`` or ``max_bytes`` (estimated) is exceeded. Returned
+    lists are copies. Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, tuple[list, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def content_key(content: str | bytes, start_date, end_date, encoding: str | None = None) -> tuple:
+        """Key for *content* (raw body bytes, hashed in place) and the window.
+
+        The charset the body will be decoded with is part of the digest.
+        """
+        data = content.encode("utf-8", "surrogatepass") if isinstance(content, str) else content
+        hasher = hashlib.blake2b(data, digest_size=16)
+        if encoding:
+            hasher.update(b"\x00" + encoding.lower().encode("ascii", "replace"))
+        return hasher.digest(), start_date, end_date
+
+    def get(self, key: tuple) -> list | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return [copy_event(e) for e in entry[0]]
+
+    def put(self, key: tuple, events: list) -> None:
+        size = _estimate_events_size(events)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = ([copy_event(e) for e in events], size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate_percent": round(self._hits / total * 100, 1) if total else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
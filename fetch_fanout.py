@@ -0,0 +1,117 @@
+"""Bounded-concurrency fan-out for fetching many calendar sources at once.
+
+The background tasks and slash commands read every source of a tag (or of
+all tags) in one go. :class:`FetchFanout` runs those fetches concurrently
+while capping how many run in total and how many target the same host, so
+a large config finishes in roughly the time of its slowest source without
+flooding one server. Results come back in input order, and a source that
+raises only loses its own slot.
+
+One instance is shared by every caller on the event loop, so a slash
+command and a background task fetching at the same moment share the
+limits too. ICS requests are additionally paced per host by
+:class:`host_scheduler.HostScheduler`.
+
+Hosts listed in ``host_limits`` get their own cap and do not count against
+the overall one. This is meant for Google API listings on the async client,
+which hold no worker thread and are paced by the quota governor instead.
+"""
+
+import asyncio
+from contextlib import nullcontext
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+from host_scheduler import HostScheduler
+from log import logger
+
+# All Google calendars are served by the same API host
+GOOGLE_HOST = "www.googleapis.com"
+
+
+def source_host(meta: dict) -> str:
+    """Host a source is fetched from, used for the per-host limit."""
+    if meta.get("type") == "google":
+        return GOOGLE_HOST
+    return HostScheduler.host_key(str(meta.get("id", "")))
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🪭 FetchFanout                                                      ║
+# ║ Runs source fetches concurrently under global and per-host caps   ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class FetchFanout:
+    """Runs ``fetch(meta)`` for many sources with at most ``concurrency``
+    in flight overall and ``per_host`` per host (``host_limits[host]`` for
+    hosts exempt from the overall cap).
+    """
+
+    def __init__(self, concurrency: int = 6, per_host: int = 2, host_limits: Dict[str, int] | None = None):
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.host_limits = {host: max(1, limit) for host, limit in (host_limits or {}).items()}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._global: asyncio.Semaphore | None = None
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self._running = 0
+        self._peak = 0
+        self._fanouts = 0
+        self._sources = 0
+        self._failures = 0
+
+    def _bind(self) -> None:
+        # Semaphores belong to one event loop; start fresh if the loop changed
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._global = asyncio.Semaphore(self.concurrency)
+            self._hosts = {}
+
+    async def _run_one(self, meta: dict, fetch: Callable[[dict], Awaitable[Any]], context: str):
+        host = source_host(meta)
+        if host in self.host_limits:
+            host_limit = self._hosts.setdefault(host, asyncio.Semaphore(self.host_limits[host]))
+            global_limit = nullcontext()
+        else:
+            host_limit = self._hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+            global_limit = self._global
+        async with host_limit, global_limit:
+            self._running += 1
+            self._peak = max(self._peak, self._running)
+            try:
+                return await fetch(meta)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._failures += 1
+                logger.warning(
+                    f"Fetch failed for source '{meta.get('name', 'Unknown')}'"
+                    f"{' during ' + context if context else ''}: {e}"
+                )
+                return None
+            finally:
+                self._running -= 1
+
+    async def gather(self, sources: Sequence[dict], fetch: Callable[[dict], Awaitable[Any]],
+                     context: str = "") -> List[Any]:
+        """Fetch every source concurrently and return the results in input order.
+
+        A source whose ``fetch`` raises gets ``None``. Cancelling the caller
+        cancels every fetch still running.
+        """
+        if not sources:
+            return []
+        self._bind()
+        self._fanouts += 1
+        self._sources += len(sources)
+        return await asyncio.gather(*(self._run_one(meta, fetch, context) for meta in sources))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "per_host": self.per_host,
+            "running": self._running,
+            "peak": self._peak,
+            "fanouts": self._fanouts,
+            "sources": self._sources,
+            "failures": self._failures,
+        }
@@ -0,0 +1,219 @@
+"""Asyncio-native Google Calendar API access on aiohttp.
+
+The googleapiclient path ties up a worker thread per call and sleeps in
+that thread between retries. :class:`AsyncGoogleCalendar` sends the same
+REST requests over the shared aiohttp session instead, so many calendars
+can be listed concurrently from the event loop. Retries and quota waits are
+awaited, so they never block a thread.
+
+Access tokens come from :class:`ServiceAccountTokenSource`. It signs the
+service account's JWT assertion locally and exchanges it at the token
+endpoint. The token is cached until shortly before it expires. Inside
+:data:`REFRESH_MARGIN` of expiry, a replacement is fetched in the background
+while callers keep using the current token.
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, Callable, Dict
+from urllib.parse import quote
+
+import aiohttp
+from google.auth import crypt, jwt  # type: ignore
+
+from host_scheduler import parse_retry_after
+from log import logger
+from quota_governor import QuotaGovernor
+
+API_BASE = "https://www.googleapis.com/calendar/v3"
+TOKEN_URI = "https://oauth2.googleapis.com/token"
+_JWT_GRANT_TYPE = "urn:ietf:params:oauth:grant-type:jwt-bearer"
+
+# Lifetime requested for each access token (Google's maximum)
+TOKEN_LIFETIME = 3600
+# Seconds before expiry at which a replacement token is fetched in the background
+REFRESH_MARGIN = 300
+# Below this many seconds of validity, callers wait for the new token instead
+_MIN_VALIDITY = 30
+
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+
+class GoogleApiError(Exception):
+    """A Google API request failed with a non-retryable status or bad response."""
+
+    def __init__(self, status: int, message: str = ""):
+        self.status = status
+        super().__init__(f"Google API error {status}: {message}" if message else f"Google API error {status}")
+
+
+def _is_rate_limited(status: int, body: str) -> bool:
+    return status == 429 or (status == 403 and "ratelimitexceeded" in body.lower())
+
+
+def _query_params(params: Dict[str, Any]) -> Dict[str, str]:
+    """Drop unset values and spell booleans the way the REST API expects."""
+    query = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        query[key] = ("true" if value else "false") if isinstance(value, bool) else str(value)
+    return query
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🔑 ServiceAccountTokenSource                                       ║
+# ║ Self-minted OAuth tokens, cached and refreshed ahead of expiry     ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class ServiceAccountTokenSource:
+    """OAuth access tokens for a service account, via the JWT-bearer grant.
+
+    Only one refresh is in flight at a time. Call :meth:`invalidate` after a
+    401 so the next :meth:`token` call fetches a new token.
+    """
+
+    def __init__(self, info: Dict[str, Any], scopes: list, signer: Any = None):
+        self.email = info["client_email"]
+        self.token_uri = info.get("token_uri") or TOKEN_URI
+        self.scopes = list(scopes)
+        self._signer = signer or crypt.RSASigner.from_service_account_info(info)
+        self._token: str | None = None
+        self._expires_at = 0.0
+        self._refreshing: asyncio.Task | None = None
+        self._refreshes = 0
+
+    @classmethod
+    def from_file(cls, path: str, scopes: list) -> "ServiceAccountTokenSource":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f), scopes)
+
+    def _assertion(self, now: float) -> str:
+        payload = {
+            "iss": self.email,
+            "scope": " ".join(self.scopes),
+            "aud": self.token_uri,
+            "iat": int(now),
+            "exp": int(now) + TOKEN_LIFETIME,
+        }
+        return jwt.encode(self._signer, payload).decode("ascii")
+
+    async def _refresh(self, session: aiohttp.ClientSession) -> str:
+        now = time.time()
+        data = {"grant_type": _JWT_GRANT_TYPE, "assertion": self._assertion(now)}
+        async with session.post(self.token_uri, data=data, timeout=_REQUEST_TIMEOUT,
+                                headers={"Accept": "application/json"}) as resp:
+            body = await resp.text()
+            if resp.status != 200:
+                raise GoogleApiError(resp.status, f"token request failed: {body[:200]}")
+            payload = json.loads(body)
+        self._token = payload["access_token"]
+        self._expires_at = now + float(payload.get("expires_in", TOKEN_LIFETIME))
+        self._refreshes += 1
+        logger.debug(f"Minted Google access token for {self.email}, valid {self._expires_at - now:.0f}s")
+        return self._token
+
+    def _start_refresh(self, session: aiohttp.ClientSession) -> asyncio.Task:
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._refresh(session))
+            # Background refreshes may fail unobserved; the next caller retries
+            self._refreshing.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return self._refreshing
+
+    async def token(self, session: aiohttp.ClientSession) -> str:
+        """A valid access token, minting or refreshing it as needed."""
+        remaining = self._expires_at - time.time()
+        if self._token and remaining > _MIN_VALIDITY:
+            if remaining < REFRESH_MARGIN:
+                self._start_refresh(session)
+            return self._token
+        return await asyncio.shield(self._start_refresh(session))
+
+    def invalidate(self) -> None:
+        self._token = None
+        self._expires_at = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "refreshes": self._refreshes,
+            "valid_seconds": max(0, round(self._expires_at - time.time())) if self._token else 0,
+        }
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 📡 AsyncGoogleCalendar                                             ║
+# ║ Calendar v3 REST calls with awaited quota waits and retries        ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class AsyncGoogleCalendar:
+    """Minimal Calendar v3 client for the calls the bot makes from the loop.
+
+    Each attempt first takes a token from *quota*. Rate-limit responses
+    drain the quota buckets and honour ``Retry-After``. Server errors and
+    network failures are retried with backoff, and a 401 refreshes the
+    access token once. Other 4xx responses raise :class:`GoogleApiError`
+    straight away. Once retries are exhausted, :meth:`request` returns
+    None, like ``retry_api_call``.
+    """
+
+    def __init__(self, tokens: ServiceAccountTokenSource, quota: QuotaGovernor,
+                 session_factory: Callable[[], Any], max_retries: int = 3, max_backoff: float = 30.0):
+        self.tokens = tokens
+        self.quota = quota
+        self._session_factory = session_factory
+        self.max_retries = max(1, max_retries)
+        self.max_backoff = max_backoff
+
+    async def request(self, method: str, path: str, params: Dict[str, Any] | None = None) -> Dict[str, Any] | None:
+        session = await self._session_factory()
+        url = API_BASE + path
+        query = _query_params(params or {})
+        reauthorized = False
+        last_error: Exception | None = None
+
+        for attempt in range(self.max_retries):
+            await self.quota.async_acquire()
+            delay = min((2 ** attempt) + random.uniform(0, 1), self.max_backoff)
+            try:
+                headers = {
+                    "Authorization": f"Bearer {await self.tokens.token(session)}",
+                    "Accept": "application/json",
+                    "Accept-Encoding": "gzip",
+                }
+                async with session.request(method, url, params=query, headers=headers,
+                                           timeout=_REQUEST_TIMEOUT) as resp:
+                    body = await resp.text()
+                    if resp.status == 200:
+                        return json.loads(body)
+                    if resp.status == 401 and not reauthorized:
+                        reauthorized = True
+                        self.tokens.invalidate()
+                        last_error = GoogleApiError(401, body[:200])
+                        continue
+                    if _is_rate_limited(resp.status, body):
+                        self.quota.throttle()
+                        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                        if retry_after is not None:
+                            delay = min(max(delay, retry_after), self.max_backoff)
+                    elif resp.status < 500:
+                        raise GoogleApiError(resp.status, body[:200])
+                    last_error = GoogleApiError(resp.status, body[:200])
+            except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+                last_error = e
+
+            logger.debug(
+                f"Retryable Google API error on {path}, attempt {attempt + 1}/{self.max_retries}, "
+                f"backing off for {delay:.2f}s: {last_error}"
+            )
+            if attempt + 1 < self.max_retries:
+                await asyncio.sleep(delay)
+
+        logger.error(f"All {self.max_retries} retries failed for Google API call {path}: {last_error}")
+        return None
+
+    async def list_events(self, calendar_id: str, page_token: str | None = None, **params) -> Dict[str, Any] | None:
+        """One ``events.list`` page (same parameters as googleapiclient)."""
+        return await self.request(
+            "GET", f"/calendars/{quote(calendar_id, safe='')}/events",
+            {**params, "pageToken": page_token},
+        )
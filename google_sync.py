@@ -0,0 +1,134 @@
+"""Per-calendar state for incremental Google Calendar sync.
+
+After a full ``events().list`` over a sync window, the Calendar API hands
+back a ``nextSyncToken``. Later polls send that token and receive only the
+events that changed (including cancellations), which are merged into the
+locally kept event set here. Each merge returns the IDs it added, updated
+and removed, which the fetch path logs.
+"""
+
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Dict, List
+
+from event_model import copy_event, event_start_key
+
+
+class GoogleSyncState:
+    """Locally mirrored events for one calendar plus its sync token."""
+
+    def __init__(self, sync_token: str, window_start: date, window_end: date,
+                 events: Dict[str, dict]):
+        self.sync_token = sync_token
+        self.window_start = window_start
+        self.window_end = window_end
+        self.events = events
+        self.synced_at = time.monotonic()
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🔁 GoogleSyncStore                                                 ║
+# ║ Holds sync tokens and merged event sets per Google calendar        ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class GoogleSyncStore:
+    """Thread-safe registry of :class:`GoogleSyncState` by calendar ID.
+
+    A state only answers requests inside the window it was fully synced
+    for, and is considered stale after ``max_age`` seconds so events that
+    drift into the horizon are picked up by a periodic full resync.
+    """
+
+    def __init__(self, max_age: float = 86400.0):
+        self.max_age = max_age
+        self._states: Dict[str, GoogleSyncState] = {}
+        self._lock = threading.Lock()
+
+    def needs_full_sync(self, calendar_id: str, start_date: date, end_date: date) -> bool:
+        """True when there is no usable token covering ``[start_date, end_date]``."""
+        with self._lock:
+            state = self._states.get(calendar_id)
+            if state is None:
+                return True
+            if time.monotonic() - state.synced_at > self.max_age:
+                return True
+            return not (state.window_start <= start_date and end_date <= state.window_end)
+
+    def sync_token(self, calendar_id: str) -> str | None:
+        with self._lock:
+            state = self._states.get(calendar_id)
+            return state.sync_token if state else None
+
+    def replace(self, calendar_id: str, items: list, sync_token: str,
+                window_start: date, window_end: date) -> Dict[str, List[str]]:
+        """Install the result of a full sync. Returns the delta vs. the old set."""
+        new_events = {e["id"]: e for e in items if e.get("id") and e.get("status") != "cancelled"}
+        with self._lock:
+            old = self._states.get(calendar_id)
+            old_events = old.events if old else {}
+            delta = {
+                "added": [i for i in new_events if i not in old_events],
+                "updated": [i for i in new_events if i in old_events and new_events[i] != old_events[i]],
+                "removed": [i for i in old_events if i not in new_events],
+            }
+            self._states[calendar_id] = GoogleSyncState(
+                sync_token=sync_token,
+                window_start=window_start,
+                window_end=window_end,
+                events=new_events,
+            )
+            return delta
+
+    def apply_changes(self, calendar_id: str, items: list, sync_token: str) -> Dict[str, List[str]]:
+        """Merge an incremental page set into the stored events.
+
+        Cancelled events are removed; everything else is inserted or
+        replaced. Returns the delta that was applied.
+        """
+        with self._lock:
+            state = self._states[calendar_id]
+            delta: Dict[str, List[str]] = {"added": [], "updated": [], "removed": []}
+            for item in items:
+                event_id = item.get("id")
+                if not event_id:
+                    continue
+                if item.get("status") == "cancelled":
+                    if state.events.pop(event_id, None) is not None:
+                        delta["removed"].append(event_id)
+                elif event_id in state.events:
+                    if state.events[event_id] != item:
+                        delta["updated"].append(event_id)
+                    state.events[event_id] = item
+                else:
+                    state.events[event_id] = item
+                    delta["added"].append(event_id)
+            state.sync_token = sync_token
+            return delta
+
+    def events_in_window(self, calendar_id: str, in_window: Callable[[dict], bool]) -> list:
+        """Return copies of stored events accepted by *in_window*, by start time."""
+        with self._lock:
+            state = self._states.get(calendar_id)
+            events = list(state.events.values()) if state else []
+        selected = [copy_event(e) for e in events if in_window(e)]
+        selected.sort(key=event_start_key)
+        return selected
+
+    def invalidate(self, calendar_id: str | None = None) -> None:
+        """Forget the sync state for one calendar, or all of them."""
+        with self._lock:
+            if calendar_id is None:
+                self._states.clear()
+            else:
+                self._states.pop(calendar_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calendars": len(self._states),
+                "events": sum(len(s.events) for s in self._states.values()),
+            }
+
+    def __contains__(self, calendar_id: str) -> bool:
+        with self._lock:
+            return calendar_id in self._states
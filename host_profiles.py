@@ -0,0 +1,155 @@
+"""Persisted per-host transfer profiles for ICS feed downloads.
+
+Each feed host gets a small profile recording whether compressed transfer
+(``Accept-Encoding: gzip, deflate``) works for it, plus how many bytes went
+over the wire versus how many were decoded. Hosts start out compressed; a
+host that sends a body it cannot decode, or a gzip body without the matching
+``Content-Encoding`` header, is switched to ``identity`` and retried after
+:data:`REPROBE_SECONDS`. Profiles live in ``/data/host_profiles.json`` and
+survive restarts. Encoding changes are written at once; the byte counters
+are kept in memory and written by :meth:`HostProfileStore.flush`, which
+the bot calls periodically and on shutdown.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+from log import logger
+from storage import data_path, load_json, save_json
+
+COMPRESSED_ENCODING = "gzip, deflate"
+IDENTITY_ENCODING = "identity"
+
+# How long a host stays on identity before compression is tried again
+REPROBE_SECONDS = 7 * 24 * 3600
+
+
+def host_key(url: str) -> str:
+    """Host part of *url* (``host[:port]``, lower-cased)."""
+    return (urlsplit(url).netloc or "").lower()
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🗜️ HostProfileStore                                                ║
+# ║ Remembers per-host Accept-Encoding and wire vs decoded bytes       ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class HostProfileStore:
+    """Per-host transfer profiles, persisted as JSON. Thread-safe.
+
+    A profile looks like ``{"encoding": "compressed" | "identity",
+    "identity_since": ts, "reason": str, "transfers": n,
+    "compressed_transfers": n, "wire_bytes": n, "decoded_bytes": n}``.
+    """
+
+    def __init__(self, path: str | None = None, enabled: bool = True):
+        self.enabled = enabled
+        self._path = path
+        self._profiles: Dict[str, Dict[str, Any]] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _file(self) -> str:
+        if self._path is None:
+            self._path = data_path("host_profiles.json")
+        return self._path
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._profiles is None:
+            profiles = load_json(self._file(), {})
+            self._profiles = profiles if isinstance(profiles, dict) else {}
+        return self._profiles
+
+    def _save(self) -> None:
+        """Write every profile, pending counters included. Call under the lock."""
+        if save_json(self._file(), self._profiles):
+            self._dirty = False
+
+    def _profile(self, host: str) -> Dict[str, Any]:
+        return self._load().setdefault(host, {
+            "encoding": "compressed",
+            "transfers": 0,
+            "compressed_transfers": 0,
+            "wire_bytes": 0,
+            "decoded_bytes": 0,
+        })
+
+    def accept_encoding(self, url: str) -> str:
+        """Accept-Encoding value to send for *url*'s host."""
+        if not self.enabled:
+            return IDENTITY_ENCODING
+        host = host_key(url)
+        with self._lock:
+            profile = self._load().get(host)
+            if not profile or profile.get("encoding") != "identity":
+                return COMPRESSED_ENCODING
+            if time.time() - profile.get("identity_since", 0) < REPROBE_SECONDS:
+                return IDENTITY_ENCODING
+            profile["encoding"] = "compressed"
+            profile.pop("identity_since", None)
+            self._save()
+        logger.info(f"Retrying compressed transfer for {host}")
+        return COMPRESSED_ENCODING
+
+    def mark_identity(self, url: str, reason: str) -> None:
+        """Stop requesting compression from *url*'s host."""
+        host = host_key(url)
+        with self._lock:
+            profile = self._profile(host)
+            profile["encoding"] = "identity"
+            profile["identity_since"] = time.time()
+            profile["reason"] = reason
+            self._save()
+        logger.warning(f"Compressed transfer from {host} failed ({reason}), falling back to identity")
+
+    def record_transfer(self, url: str, wire_bytes: int | None, decoded_bytes: int,
+                        content_encoding: str | None) -> None:
+        """Account one downloaded body, in memory until the next :meth:`flush`.
+
+        *wire_bytes* may be None when the transfer size is unknown (a
+        compressed chunked response); byte counters are then left alone so
+        the ratio stays honest.
+        """
+        compressed = bool(content_encoding) and content_encoding.lower() != IDENTITY_ENCODING
+        if wire_bytes is None and not compressed:
+            wire_bytes = decoded_bytes
+        with self._lock:
+            profile = self._profile(host_key(url))
+            profile["transfers"] += 1
+            if compressed:
+                profile["compressed_transfers"] += 1
+            if wire_bytes is not None:
+                profile["wire_bytes"] += wire_bytes
+                profile["decoded_bytes"] += decoded_bytes
+            self._dirty = True
+
+    def flush(self) -> bool:
+        """Persist counters recorded since the last write; True if anything was written.
+
+        Does file I/O: call it from a worker thread when on the event loop.
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            self._save()
+            return not self._dirty
+
+    def get_profile(self, url: str) -> Dict[str, Any] | None:
+        with self._lock:
+            profile = self._load().get(host_key(url))
+            return dict(profile) if profile else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            profiles = list(self._load().values())
+        wire = sum(p.get("wire_bytes", 0) for p in profiles)
+        decoded = sum(p.get("decoded_bytes", 0) for p in profiles)
+        return {
+            "hosts": len(profiles),
+            "identity_hosts": sum(1 for p in profiles if p.get("encoding") == "identity"),
+            "compressed_transfers": sum(p.get("compressed_transfers", 0) for p in profiles),
+            "wire_bytes": wire,
+            "decoded_bytes": decoded,
+            "savings_percent": round((1 - wire / decoded) * 100, 1) if decoded else 0.0,
+        }
@@ -0,0 +1,184 @@
+"""Per-host politeness for calendar fetches.
+
+Several ICS sources often live on one host, and some of those hosts rate
+limit. :class:`HostScheduler` caps how many requests run against a host at
+once, keeps a minimum gap between request starts to the same host, and
+holds a host's queue back after it answers ``429``/``503`` with a
+``Retry-After`` header. Requests to other hosts are never delayed.
+
+Sync callers (worker threads) use :meth:`HostScheduler.slot`; code on the
+event loop uses :meth:`HostScheduler.async_slot`. Both share the same
+per-host state, so the two fetch paths throttle each other too.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+from log import logger
+
+# Longest Retry-After honoured; larger values are clamped
+MAX_RETRY_AFTER = 6 * 3600
+
+# How often an async waiter re-checks a host whose slots are all taken
+_ASYNC_POLL_SECONDS = 0.05
+
+
+class HostDeferred(Exception):
+    """The host asked us to back off for longer than a caller may wait."""
+
+    def __init__(self, host: str, remaining: float):
+        self.host = host
+        self.remaining = remaining
+        super().__init__(f"{host} deferred for another {remaining:.0f}s (Retry-After)")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), MAX_RETRY_AFTER)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    delay = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+class _HostState:
+    __slots__ = ("active", "next_start", "blocked_until")
+
+    def __init__(self):
+        self.active = 0
+        self.next_start = 0.0
+        self.blocked_until = 0.0
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🚦 HostScheduler                                                   ║
+# ║ Per-host concurrency, spacing and Retry-After deferral             ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class HostScheduler:
+    """Gatekeeper for requests, keyed by ``host[:port]``. Thread-safe.
+
+    A request may start when fewer than ``max_per_host`` requests to its
+    host are running, at least ``min_interval`` seconds have passed since
+    the previous start, and the host is not deferred. A caller that would
+    have to wait out a deferral longer than ``max_wait`` seconds gets
+    :class:`HostDeferred` instead.
+    """
+
+    def __init__(self, max_per_host: int = 2, min_interval: float = 0.5, max_wait: float = 60.0):
+        self.max_per_host = max(1, max_per_host)
+        self.min_interval = max(0.0, min_interval)
+        self.max_wait = max_wait
+        self._hosts: Dict[str, _HostState] = {}
+        self._cond = threading.Condition()
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._deferrals = 0
+        self._refused = 0
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        return (urlsplit(url).netloc or "").lower()
+
+    def _try_acquire(self, host: str) -> float:
+        """Take a slot and return 0, or return how long to wait. Call under the lock."""
+        state = self._hosts.setdefault(host, _HostState())
+        now = time.monotonic()
+        if state.blocked_until - now > self.max_wait:
+            self._refused += 1
+            raise HostDeferred(host, state.blocked_until - now)
+        ready_at = max(state.next_start, state.blocked_until)
+        if state.active < self.max_per_host and ready_at <= now:
+            state.active += 1
+            state.next_start = now + self.min_interval
+            return 0.0
+        if ready_at > now:
+            return ready_at - now
+        return -1.0  # Full: wait for a release
+
+    def _release(self, host: str) -> None:
+        with self._cond:
+            self._hosts[host].active -= 1
+            self._cond.notify_all()
+
+    def _note_wait(self, started: float) -> None:
+        with self._cond:
+            self._waits += 1
+            self._wait_seconds += time.monotonic() - started
+
+    @contextmanager
+    def slot(self, url: str):
+        """Block until a request to *url*'s host may start; hold the slot while inside."""
+        host = self.host_key(url)
+        started = time.monotonic()
+        waited = False
+        with self._cond:
+            while True:
+                wait = self._try_acquire(host)
+                if wait == 0.0:
+                    break
+                waited = True
+                self._cond.wait(timeout=wait if wait > 0 else None)
+        if waited:
+            self._note_wait(started)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    @asynccontextmanager
+    async def async_slot(self, url: str):
+        """Async counterpart of :meth:`slot`; waits without blocking the loop."""
+        host = self.host_key(url)
+        started = time.monotonic()
+        waited = False
+        while True:
+            with self._cond:
+                wait = self._try_acquire(host)
+            if wait == 0.0:
+                break
+            waited = True
+            await asyncio.sleep(wait if wait > 0 else _ASYNC_POLL_SECONDS)
+        if waited:
+            self._note_wait(started)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Hold back every request to *url*'s host for *seconds*."""
+        host = self.host_key(url)
+        seconds = min(max(seconds, 0.0), MAX_RETRY_AFTER)
+        with self._cond:
+            state = self._hosts.setdefault(host, _HostState())
+            state.blocked_until = max(state.blocked_until, time.monotonic() + seconds)
+            self._deferrals += 1
+            self._cond.notify_all()
+        logger.info(f"Deferring requests to {host} for {seconds:.0f}s (Retry-After)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "hosts": len(self._hosts),
+                "active": sum(s.active for s in self._hosts.values()),
+                "deferred_hosts": sum(1 for s in self._hosts.values() if s.blocked_until > now),
+                "deferrals": self._deferrals,
+                "refused": self._refused,
+                "waits": self._waits,
+                "wait_seconds": round(self._wait_seconds, 1),
+            }
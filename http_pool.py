@@ -0,0 +1,199 @@
+"""Shared pooled HTTP sessions, one keep-alive ``requests.Session`` per host.
+
+ICS feeds, metadata probes, ``/debug_calendar`` and artwork downloads all go
+through :func:`get` / :func:`head`, which mirror ``requests.get`` /
+``requests.head`` but reuse connections to the same host instead of paying a
+fresh TCP+TLS handshake per request. Browser-like default headers are applied
+to every session; per-call ``headers`` are merged on top.
+
+Async callers use :func:`get_async_session`, a shared ``aiohttp`` session
+bound to the running event loop with the same headers and per-host limit.
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from environ import HTTP_POOL_MAXSIZE
+from log import logger
+
+# Browser-like headers shared by the ICS validation probe and the real content
+# fetch. Cloudflare-fronted hosts (e.g. inschool.fi/Wilma) challenge the default
+# python-requests User-Agent, so both paths must look identical to the server.
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; Calendar-Bot/1.0)',
+    'Accept': 'text/calendar, text/plain, */*',
+    'Accept-Encoding': 'identity',
+}
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🔌 SessionPool                                                     ║
+# ║ Thread-safe registry of keep-alive sessions keyed by host          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class SessionPool:
+    """One pooled ``requests.Session`` per ``scheme://host:port``.
+
+    Each session mounts an ``HTTPAdapter`` holding up to ``pool_maxsize``
+    idle connections for its host, so concurrent fetches from worker threads
+    share warm connections. Connection reuse is derived from urllib3's own
+    per-pool counters (requests sent vs. connections opened).
+    """
+
+    def __init__(self, pool_maxsize: int = 8, default_headers: Dict[str, str] | None = None):
+        self.pool_maxsize = max(1, pool_maxsize)
+        self.default_headers = dict(default_headers or {})
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+        # Counters carried over from closed sessions so stats survive close()
+        self._retired = {"connections_opened": 0, "requests_sent": 0}
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme.lower()}://{(parts.netloc or '').lower()}"
+
+    def session_for(self, url: str) -> requests.Session:
+        """Return the shared session for *url*'s host, creating it on first use."""
+        key = self._host_key(url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(self.default_headers)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[key] = session
+                logger.debug(f"Created pooled HTTP session for {key} (maxsize {self.pool_maxsize})")
+            return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.session_for(url).request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("allow_redirects", True)
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("HEAD", url, **kwargs)
+
+    @staticmethod
+    def _session_counters(session: requests.Session) -> tuple[int, int]:
+        opened = sent = 0
+        seen = set()
+        for adapter in session.adapters.values():
+            if id(adapter) in seen:
+                continue
+            seen.add(id(adapter))
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                opened += getattr(pool, "num_connections", 0)
+                sent += getattr(pool, "num_requests", 0)
+        return opened, sent
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return connection reuse counters across all hosts."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            opened = self._retired["connections_opened"]
+            sent = self._retired["requests_sent"]
+        for session in sessions:
+            o, s = self._session_counters(session)
+            opened += o
+            sent += s
+        reused = max(0, sent - opened)
+        return {
+            "hosts": len(sessions),
+            "requests_sent": sent,
+            "connections_opened": opened,
+            "connections_reused": reused,
+            "reuse_rate_percent": round(reused / sent * 100, 1) if sent else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close every session and drop its pooled connections."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            opened, sent = self._session_counters(session)
+            with self._lock:
+                self._retired["connections_opened"] += opened
+                self._retired["requests_sent"] += sent
+            try:
+                session.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled HTTP session: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+
+_pool = SessionPool(pool_maxsize=HTTP_POOL_MAXSIZE, default_headers=DEFAULT_HEADERS)
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🌐 Module-level helpers                                            ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def get(url: str, **kwargs) -> requests.Response:
+    """Pooled drop-in for ``requests.get``."""
+    return _pool.get(url, **kwargs)
+
+
+def head(url: str, **kwargs) -> requests.Response:
+    """Pooled drop-in for ``requests.head``."""
+    return _pool.head(url, **kwargs)
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Connection reuse counters for the shared pool."""
+    return _pool.get_stats()
+
+
+def close_sessions() -> None:
+    """Close all pooled sessions (called on shutdown)."""
+    _pool.close()
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ ⚡ Async session                                                    ║
+# ║ Shared aiohttp session for fetches that run on the event loop      ║
+# ╚════════════════════════════════════════════════════════════════════╝
+_async_session: aiohttp.ClientSession | None = None
+_async_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def get_async_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session for the running loop, creating it lazily.
+
+    A new session is created if the previous one was closed or belongs to a
+    loop that has since been replaced (e.g. after a bot restart).
+    """
+    global _async_session, _async_session_loop
+    loop = asyncio.get_running_loop()
+    if _async_session is None or _async_session.closed or _async_session_loop is not loop:
+        connector = aiohttp.TCPConnector(limit_per_host=HTTP_POOL_MAXSIZE)
+        _async_session = aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS)
+        _async_session_loop = loop
+        logger.debug(f"Created shared aiohttp session (limit per host {HTTP_POOL_MAXSIZE})")
+    return _async_session
+
+
+async def close_async_session() -> None:
+    """Close the shared aiohttp session if it belongs to the running loop."""
+    global _async_session, _async_session_loop
+    session, loop = _async_session, _async_session_loop
+    _async_session = _async_session_loop = None
+    if session is not None and not session.closed and loop is asyncio.get_running_loop():
+        await session.close()
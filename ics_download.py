@@ -0,0 +1,195 @@
+"""Bounded, sniffed downloads of ICS feed bodies.
+
+A misconfigured source can point at a login page, a huge file or an
+endless stream. Feed bodies are therefore read in chunks: the declared
+Content-Length and a running byte count are checked against a cap, and the
+first kilobyte is sniffed for HTML or a missing ``BEGIN:VCALENDAR`` so a
+bad response is dropped after a few KB instead of after the whole body.
+UTF-16/32 feeds, recognised by their BOM or declared charset, are sniffed
+on a transcoded prefix.
+Bodies above a threshold are spooled to a temporary file while downloading
+rather than being grown in memory. Spooling only bounds memory during the
+download: the finished body is read back into one ``bytes`` object, since
+validation, hashing, caching and decoding all work on bytes.
+"""
+
+import asyncio
+import codecs
+import io
+import tempfile
+from typing import IO, AsyncIterable, Iterable
+
+# Bytes of the body inspected before deciding it looks like a calendar
+SNIFF_BYTES = 1024
+
+# Chunk size used when streaming feed bodies
+CHUNK_SIZE = 64 * 1024
+
+
+class FeedRejected(Exception):
+    """The response is not an acceptable ICS feed; stop downloading it."""
+
+
+class UndecodedBody(FeedRejected):
+    """The body is still gzip/zlib-compressed: the server mislabelled its Content-Encoding."""
+
+
+# gzip and the common zlib (deflate) headers; none can start an ICS feed
+_COMPRESSED_MAGIC = (b"\x1f\x8b", b"\x78\x01", b"\x78\x5e", b"\x78\x9c", b"\x78\xda")
+
+# UTF-32 first: its little-endian BOM starts with the UTF-16 one
+_WIDE_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"), (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def wide_charset(prefix: bytes, charset: str | None = None) -> str | None:
+    """Codec for a UTF-16/32 body, from its BOM or else *charset*.
+
+    Returns None for ASCII-compatible bodies, which are sniffed as bytes.
+    """
+    for bom, codec in _WIDE_BOMS:
+        if prefix.startswith(bom):
+            return codec
+    try:
+        name = codecs.lookup(charset).name if charset else ""
+    except LookupError:
+        return None
+    return name if name.startswith(("utf-16", "utf-32")) else None
+
+
+def sniff_ics_prefix(prefix: bytes, charset: str | None = None) -> str | None:
+    """Return why *prefix* cannot start an ICS feed, or None if it can."""
+    codec = wide_charset(prefix, charset)
+    if codec:
+        # A cut-off trailing code unit is dropped
+        prefix = prefix.decode(codec, errors="ignore").encode("utf-8")
+    head = prefix.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if not head:
+        return "empty body"
+    lowered = head[:200].lower()
+    if lowered.startswith(b"<!doctype") or b"<html" in lowered:
+        return "HTML page instead of ICS (likely an authentication or access issue)"
+    marker = b"BEGIN:VCALENDAR"
+    if not (head.startswith(marker) if len(head) >= len(marker) else marker.startswith(head)):
+        return "missing BEGIN:VCALENDAR"
+    return None
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 📥 FeedBodyCollector                                               ║
+# ║ Accumulates chunks under a byte cap, sniffing and spooling         ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class FeedBodyCollector:
+    """Collects a streamed body, raising :class:`FeedRejected` as early as possible.
+
+    Chunks are kept in memory until ``spool_threshold`` bytes, then moved
+    to an anonymous temporary file. This avoids repeatedly growing (and
+    copying) an in-memory buffer while the body streams in. The body is
+    still materialized once by :meth:`finish`. Always call :meth:`finish`
+    or :meth:`close`.
+    """
+
+    def __init__(self, max_bytes: int, spool_threshold: int, declared_length: str | int | None = None,
+                 charset: str | None = None):
+        self.max_bytes = max_bytes
+        self.charset = charset
+        self.spool_threshold = spool_threshold
+        self.size = 0
+        self.spooled = False
+        self._buffer: IO[bytes] = io.BytesIO()
+        self._prefix = b""
+        self._sniffed = False
+
+        try:
+            declared = int(declared_length) if declared_length is not None else None
+        except (TypeError, ValueError):
+            declared = None
+        if declared is not None and declared > max_bytes:
+            raise FeedRejected(f"Content-Length {declared} exceeds the {max_bytes} byte limit")
+
+    def _check_prefix(self) -> None:
+        self._sniffed = True
+        if self._prefix.startswith(_COMPRESSED_MAGIC):
+            raise UndecodedBody("compressed body without a matching Content-Encoding")
+        reason = sniff_ics_prefix(self._prefix, self.charset)
+        if reason:
+            raise FeedRejected(reason)
+
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise FeedRejected(f"body exceeds the {self.max_bytes} byte limit")
+
+        if not self._sniffed:
+            self._prefix += chunk[:SNIFF_BYTES - len(self._prefix)]
+            if len(self._prefix) >= SNIFF_BYTES:
+                self._check_prefix()
+
+        if not self.spooled and self.size > self.spool_threshold:
+            spool = tempfile.TemporaryFile()
+            with self._buffer.getbuffer() as view:
+                spool.write(view)
+            self._buffer.close()
+            self._buffer = spool
+            self.spooled = True
+        self._buffer.write(chunk)
+
+    def finish(self) -> bytes:
+        """Sniff short bodies, then return the whole body and release the buffer.
+
+        For a spooled body this reads the temporary file back (blocking I/O).
+        """
+        try:
+            if not self._sniffed:
+                self._check_prefix()
+            if self.spooled:
+                self._buffer.seek(0)
+                return self._buffer.read()
+            return self._buffer.getvalue()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._buffer.close()
+
+
+def read_feed_body(chunks: Iterable[bytes], max_bytes: int, spool_threshold: int,
+                   declared_length: str | int | None = None, charset: str | None = None) -> tuple[bytes, bool]:
+    """Read a chunk iterator into bytes. Returns ``(body, spooled_to_disk)``.
+
+    *charset* is the declared one from Content-Type, used only for sniffing.
+
+    Raises :class:`FeedRejected` as soon as the body is known to be bad;
+    the caller should then close the response without reading the rest.
+    """
+    collector = FeedBodyCollector(max_bytes, spool_threshold, declared_length, charset)
+    try:
+        for chunk in chunks:
+            collector.feed(chunk)
+    except BaseException:
+        collector.close()
+        raise
+    return collector.finish(), collector.spooled
+
+
+async def read_feed_body_async(chunks: AsyncIterable[bytes], max_bytes: int, spool_threshold: int,
+                               declared_length: str | int | None = None,
+                               charset: str | None = None) -> tuple[bytes, bool]:
+    """Async variant of :func:`read_feed_body` for aiohttp's ``iter_chunked``.
+
+    A spooled body is read back from its temporary file in a worker thread.
+    """
+    collector = FeedBodyCollector(max_bytes, spool_threshold, declared_length, charset)
+    try:
+        async for chunk in chunks:
+            collector.feed(chunk)
+    except BaseException:
+        collector.close()
+        raise
+    if collector.spooled:
+        return await asyncio.to_thread(collector.finish), True
+    return collector.finish(), False
@@ -0,0 +1,241 @@
+"""Optional process pool for parsing large ICS feeds.
+
+Tokenizing a multi-megabyte feed is pure-Python CPU work that holds the
+GIL, so doing it on a ``to_thread`` worker still stalls the Discord
+gateway heartbeat. Feeds above a size threshold are handed to a small
+``ProcessPoolExecutor`` instead; workers send back only the compact
+occurrence rows from :func:`ics_stream.extract_window_occurrences`.
+
+The time budget runs from the moment a worker picks a task up, so time
+spent queued behind other parses does not count. A worker that runs past
+it is terminated and the pool replaced. ``ProcessPoolExecutor`` marks
+the whole pool broken when any worker dies. Parses that were in flight on
+the other workers are resubmitted once to the new pool rather than
+falling back to in-process parsing. A pool whose workers grew by more
+than the memory budget is recycled once the current task finishes.
+"""
+
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+from ics_stream import extract_window_occurrences
+from log import logger
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+class ParseBudgetExceeded(Exception):
+    """A worker ran past the parse time budget and was killed."""
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# Peak RSS of this worker before its first task; forked workers start out
+# sharing the bot's pages, so only growth past this counts
+_baseline_rss_mb: float | None = None
+
+# Worker side of the pool's start-report queue (set by _init_worker)
+_started_queue = None
+
+# How often a waiting caller checks whether its task has started or overrun
+_POLL_SECONDS = 0.1
+
+
+def _init_worker(started_queue) -> None:
+    global _started_queue
+    _started_queue = started_queue
+
+
+def _parse_in_worker(task_id: int, content: str, start_date: date, end_date: date,
+                     label: str) -> Tuple[List[Tuple[str, str, str, str, str]], float]:
+    """Worker entry point: parse one feed and report how much the worker has grown."""
+    global _baseline_rss_mb
+    if _started_queue is not None:
+        # Tell the parent which process runs this task so its budget starts now
+        _started_queue.put((task_id, os.getpid()))
+    if _baseline_rss_mb is None:
+        _baseline_rss_mb = _peak_rss_mb()
+    rows = extract_window_occurrences(content, start_date, end_date, label)
+    return rows, _peak_rss_mb() - _baseline_rss_mb
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🏭 IcsParsePool                                                    ║
+# ║ Size-gated process pool with time and memory budgets               ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class IcsParsePool:
+    """Runs :func:`extract_window_occurrences` in worker processes.
+
+    The executor is created lazily. Workers are forked where possible:
+    ``spawn`` would re-import ``main.py`` (and with it the bot and every
+    calendar source) in each worker. A worker wedged by anything it
+    inherited simply hits the time budget and is replaced; a pool that
+    starts no task for a whole budget is killed outright. The whole pool
+    is also replaced after ``max_tasks`` feeds.
+    """
+
+    def __init__(self, workers: int = 2, min_bytes: int = 2_000_000, timeout: float = 60.0,
+                 max_rss_mb: float = 512.0, max_tasks: int = 200):
+        self.workers = workers
+        self.min_bytes = min_bytes
+        self.timeout = timeout
+        self.max_rss_mb = max_rss_mb
+        self.max_tasks = max_tasks
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_tasks = 0
+        self._lock = threading.Lock()
+        self._task_ids = itertools.count()
+        # Start reports per executor; a fresh queue per pool, as a killed worker may hold its lock
+        self._start_queues: "weakref.WeakKeyDictionary[ProcessPoolExecutor, Any]" = weakref.WeakKeyDictionary()
+        # task id -> (worker pid, monotonic time the parent saw it start)
+        self._started: Dict[int, Tuple[int, float]] = {}
+        # Last time any task started or finished: a pool idle this long with work queued is wedged
+        self._progress_at = time.monotonic()
+        self._offloaded = 0
+        self._timeouts = 0
+        self._recycled = 0
+        self._resubmitted = 0
+
+    def should_offload(self, content: str) -> bool:
+        return len(content) >= self.min_bytes
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+                context = multiprocessing.get_context(method)
+                started_queue = context.Queue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(started_queue,),
+                )
+                self._start_queues[self._executor] = started_queue
+                self._executor_tasks = 0
+                self._progress_at = time.monotonic()
+            return self._executor
+
+    def _task_start(self, executor: ProcessPoolExecutor, task_id: int) -> Tuple[int, float] | None:
+        """``(pid, started_at)`` once a worker of *executor* has picked up *task_id*."""
+        with self._lock:
+            started_queue = self._start_queues.get(executor)
+            while started_queue is not None:
+                try:
+                    started_id, pid = started_queue.get_nowait()
+                except queue.Empty:
+                    break
+                now = time.monotonic()
+                self._started[started_id] = (pid, now)
+                self._progress_at = now
+            return self._started.get(task_id)
+
+    def _recycle(self, executor: ProcessPoolExecutor, kill_pid: int | None = None,
+                 kill_all: bool = False) -> None:
+        """Retire *executor*, optionally terminating one worker (*kill_pid*) or all of them."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+                self._recycled += 1
+        # ProcessPoolExecutor has no public way to stop a running task
+        for process in list((executor._processes or {}).values()):
+            if kill_all or process.pid == kill_pid:
+                process.terminate()
+        executor.shutdown(wait=False)
+
+    def _wait(self, executor: ProcessPoolExecutor, task_id: int, future) -> Tuple[list, float]:
+        """Wait for *future*, enforcing the time budget from when its task started."""
+        try:
+            while True:
+                try:
+                    return future.result(timeout=min(_POLL_SECONDS, self.timeout))
+                except FutureTimeoutError:
+                    pass
+                now = time.monotonic()
+                started = self._task_start(executor, task_id)
+                if started is not None and now - started[1] > self.timeout:
+                    self._recycle(executor, kill_pid=started[0])
+                    raise ParseBudgetExceeded(f"no result {self.timeout:.0f}s after the worker started")
+                if started is None and now - self._progress_at > self.timeout:
+                    # No task has started or finished for a whole budget: the workers are wedged
+                    self._recycle(executor, kill_all=True)
+                    raise ParseBudgetExceeded(f"pool started no task for {self.timeout:.0f}s")
+        finally:
+            with self._lock:
+                self._started.pop(task_id, None)
+                self._progress_at = time.monotonic()
+
+    def parse(self, content: str, start_date: date, end_date: date,
+              label: str = "feed") -> List[Tuple[str, str, str, str, str]]:
+        """Parse *content* in a worker and return its occurrence rows.
+
+        Raises :class:`ParseBudgetExceeded` when the worker runs past the
+        time budget. Parse errors (``IcsStreamError``) are re-raised here.
+        When the pool breaks under a parse (typically because another
+        task's worker was killed), the parse is resubmitted once to a fresh
+        pool, then done in-process.
+        """
+        for attempt in range(2):
+            executor = self._get_executor()
+            task_id = next(self._task_ids)
+            try:
+                future = executor.submit(_parse_in_worker, task_id, content, start_date, end_date, label)
+                rows, grown_mb = self._wait(executor, task_id, future)
+                break
+            except ParseBudgetExceeded:
+                with self._lock:
+                    self._timeouts += 1
+                raise
+            except BrokenProcessPool as e:
+                self._recycle(executor)
+                if attempt == 0:
+                    logger.info(f"ICS parse pool broke while parsing {label} ({e}), resubmitting")
+                    with self._lock:
+                        self._resubmitted += 1
+                    continue
+                logger.warning(f"ICS parse pool broke again while parsing {label} ({e}), parsing in-process")
+                return extract_window_occurrences(content, start_date, end_date, label)
+
+        with self._lock:
+            self._offloaded += 1
+            if self._executor is executor:
+                self._executor_tasks += 1
+            tasks_done = self._executor_tasks
+        if self.max_rss_mb and grown_mb > self.max_rss_mb:
+            logger.info(f"ICS parse worker grew by {grown_mb:.0f} MB after {label}, recycling pool")
+            self._recycle(executor)
+        elif self.max_tasks and tasks_done >= self.max_tasks:
+            self._recycle(executor)
+        return rows
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._executor is not None,
+            "offloaded": self._offloaded,
+            "timeouts": self._timeouts,
+            "recycled": self._recycled,
+            "resubmitted": self._resubmitted,
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,96 @@
+"""Single-pass cleanup of raw ICS feed bytes before parsing.
+
+Fixes the malformed patterns that break the parsers (naive or empty
+DTSTART/DTEND values, null bytes), normalizes CRLF and bare CR line endings
+to LF and adds a missing VCALENDAR wrapper, all in one forward scan.
+
+The feed is walked in line-aligned chunks; each chunk is cleaned while it
+is still small and appended to a single output buffer, so the extra memory
+beyond the output is one chunk (or one line, if a line is longer) instead
+of a fresh copy of the whole feed per fix. ``bench_ics_preprocess.py``
+compares it against the old regex-per-pass implementation.
+"""
+
+import re
+
+from log import logger
+
+# Bytes examined per step; always extended to the next line break
+CHUNK_SIZE = 256 * 1024
+
+# Only DTSTART/DTEND lines without parameters whose value is empty or a
+# date-time lacking a zone designator. Anchored on the preceding newline
+# rather than ``^`` with MULTILINE, which lets ``re`` skip ahead with a
+# literal-prefix search instead of trying every position (4x faster).
+_DATETIME_FIX = re.compile(rb"\n(DTSTART|DTEND):(?:[ \t]*|(\d{8}T\d{6}))(?=\n|\Z)")
+
+_EMPTY_DEFAULTS = {b"DTSTART": b"19700101T000000Z", b"DTEND": b"19700101T010000Z"}
+
+_WRAPPER_HEAD = b"BEGIN:VCALENDAR\nVERSION:2.0\n"
+_WRAPPER_TAIL = b"END:VCALENDAR\n"
+
+
+def _fix_datetime(match: re.Match) -> bytes:
+    name, value = match.group(1), match.group(2)
+    if value is None:
+        return b"\n" + name + b":" + _EMPTY_DEFAULTS[name]
+    return b"\n" + name + b":" + value + b"Z"
+
+
+def _chunk_end(data, start: int, size: int) -> int:
+    """End offset of the chunk starting at *start*: just past a line break."""
+    end = start + size
+    if end >= len(data):
+        return len(data)
+    cut = max(data.rfind(b"\n", start, end), data.rfind(b"\r", start, end))
+    if cut < 0:
+        # A single line longer than the chunk: take all of it
+        lf, cr = data.find(b"\n", end), data.find(b"\r", end)
+        found = [pos for pos in (lf, cr) if pos >= 0]
+        if not found:
+            return len(data)
+        cut = min(found)
+    if data[cut:cut + 1] == b"\r" and data[cut + 1:cut + 2] == b"\n":
+        cut += 1  # Keep CRLF pairs in one chunk
+    return cut + 1
+
+
+def preprocess_ics_bytes(data: bytes | bytearray, label: str = "feed",
+                         chunk_size: int = CHUNK_SIZE, start: int = 0) -> bytearray:
+    """Return a cleaned copy of *data* from offset *start* with LF line endings.
+
+    The input is never modified; the result is a ``bytearray`` so callers
+    can decode it without another intermediate copy. *start* lets callers
+    skip a byte-order mark without slicing the body.
+    """
+    out = bytearray()
+    seen_calendar = seen_event = False
+    ended_with_newline = True
+    pos = start
+    while pos < len(data):
+        end = _chunk_end(data, pos, chunk_size)
+        chunk = data[pos:end]
+        pos = end
+
+        if b"\x00" in chunk:
+            chunk = chunk.replace(b"\x00", b"")
+        if b"\r" in chunk:
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        if b"DTSTART:" in chunk or b"DTEND:" in chunk:
+            # Chunks start on a line boundary; the newline lets the first line match too
+            chunk = _DATETIME_FIX.sub(_fix_datetime, b"\n" + chunk)[1:]
+        if not seen_calendar:
+            seen_calendar = b"BEGIN:VCALENDAR" in chunk
+        if not seen_event:
+            seen_event = b"BEGIN:VEVENT" in chunk
+        if chunk:
+            ended_with_newline = chunk.endswith(b"\n")
+        out += chunk
+
+    if not seen_calendar and seen_event:
+        logger.debug(f"ICS from {label} missing VCALENDAR wrapper, adding minimal wrapper")
+        out[0:0] = _WRAPPER_HEAD
+        if not ended_with_newline:
+            out += b"\n"
+        out += _WRAPPER_TAIL
+    return out
@@ -0,0 +1,744 @@
+"""Streaming iCalendar tokenizer.
+
+Walks an ICS feed one unfolded content line at a time and yields each
+VEVENT as a light :class:`IcsEvent` record, so a large feed is never held
+as a full ``ics.Calendar`` object graph. VTIMEZONE blocks are collected on
+the way and used to resolve TZID parameters that are not IANA names
+(Outlook's "FLE Standard Time" and friends).
+
+Times are resolved the same way ``ics==0.7.2`` does it: a TZID is looked
+up with ``dateutil`` first, then in the feed's own VTIMEZONE blocks;
+floating times and DATE values are taken as UTC. Unlike ``ics``, recurring
+events (RRULE/RDATE/EXDATE with RECURRENCE-ID overrides) are expanded,
+lazily and only inside the requested window.
+"""
+
+import heapq
+import io
+import re
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from dateutil import tz as dateutil_tz
+from dateutil.rrule import rrulestr
+
+from log import logger
+
+
+class IcsStreamError(ValueError):
+    """The feed's component structure could not be followed."""
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 📜 Content Lines                                                   ║
+# ║ Line splitting, unfolding and NAME;PARAM=...:VALUE tokenizing      ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def _iter_text_lines(text: str) -> Iterator[str]:
+    """Yield the lines of *text* without building a list of all of them."""
+    pos = 0
+    length = len(text)
+    while pos < length:
+        end = text.find("\n", pos)
+        if end < 0:
+            end = length
+        line = text[pos:end]
+        pos = end + 1
+        yield line[:-1] if line.endswith("\r") else line
+
+
+def iter_unfolded_lines(source: str | Iterable[str]) -> Iterator[str]:
+    """Yield logical content lines, joining RFC 5545 folded continuations.
+
+    *source* is either the whole feed text or an iterable of raw lines
+    (e.g. an open file). Blank lines are dropped.
+    """
+    if isinstance(source, str):
+        lines = _iter_text_lines(source)
+    else:
+        lines = (line.rstrip("\r\n") for line in source)
+
+    parts: List[str] = []
+    for line in lines:
+        if line[:1] in (" ", "\t"):
+            if parts:
+                parts.append(line[1:])
+            continue
+        if parts:
+            yield parts[0] if len(parts) == 1 else "".join(parts)
+        parts = [line] if line else []
+    if parts:
+        yield "".join(parts)
+
+
+def _split_unquoted(text: str, sep: str) -> List[str]:
+    """Split *text* on *sep* outside double-quoted sections."""
+    if '"' not in text:
+        return text.split(sep)
+    out, current, quoted = [], [], False
+    for ch in text:
+        if ch == '"':
+            quoted = not quoted
+        elif ch == sep and not quoted:
+            out.append("".join(current))
+            current = []
+            continue
+        current.append(ch)
+    out.append("".join(current))
+    return out
+
+
+def split_content_line(line: str) -> Tuple[str, Dict[str, str], str] | None:
+    """Split ``NAME;PARAM=VAL:VALUE`` into ``(NAME, {PARAM: VAL}, VALUE)``.
+
+    Returns None for lines without a value separator.
+    """
+    colon = line.find(":")
+    if colon < 0:
+        return None
+    semi = line.find(";", 0, colon)
+    if semi < 0:
+        return line[:colon].upper(), {}, line[colon + 1:]
+
+    if '"' in line[semi:colon]:
+        # Quoted parameter values may themselves contain ':'
+        quoted = False
+        colon = -1
+        for i in range(semi, len(line)):
+            ch = line[i]
+            if ch == '"':
+                quoted = not quoted
+            elif ch == ":" and not quoted:
+                colon = i
+                break
+        if colon < 0:
+            return None
+
+    params: Dict[str, str] = {}
+    for part in _split_unquoted(line[semi + 1:colon], ";"):
+        key, _, value = part.partition("=")
+        if key:
+            params[key.strip().upper()] = value.strip().strip('"')
+    return line[:semi].upper(), params, line[colon + 1:]
+
+
+_TEXT_ESCAPE = re.compile(r"\\([\\;,nN])")
+
+
+def unescape_text(value: str) -> str:
+    """Undo RFC 5545 TEXT escaping (``\\n``, ``\\,``, ``\\;``, ``\\\\``)."""
+    if "\\" not in value:
+        return value
+    return _TEXT_ESCAPE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🕒 Date-Time Values                                                ║
+# ║ DATE / DATE-TIME / DURATION parsing and TZID resolution            ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class IcsTime:
+    """A raw DATE or DATE-TIME property value plus its TZID, unresolved."""
+
+    __slots__ = ("value", "tzid", "is_date")
+
+    def __init__(self, value: str, params: Dict[str, str]):
+        self.value = value.strip()
+        self.tzid = params.get("TZID")
+        self.is_date = params.get("VALUE", "").upper() == "DATE" or (
+            len(self.value) == 8 and "T" not in self.value
+        )
+
+    def __repr__(self) -> str:
+        return f"IcsTime({self.value!r}, tzid={self.tzid!r})"
+
+
+class IcsTimezones:
+    """Resolves TZIDs to tzinfo objects, caching each lookup.
+
+    IANA names go through ``dateutil.tz.gettz``; anything else is built
+    from the feed's VTIMEZONE block with ``dateutil.tz.tzical``. Unknown
+    zones fall back to UTC, as the ``ics`` library does.
+    """
+
+    def __init__(self):
+        self._blocks: Dict[str, str] = {}
+        self._resolved: Dict[str, tzinfo] = {}
+
+    def add_block(self, tzid: str, block: str) -> None:
+        self._blocks[tzid] = block
+
+    def __contains__(self, tzid: str) -> bool:
+        return tzid in self._blocks
+
+    def get(self, tzid: str) -> tzinfo:
+        resolved = self._resolved.get(tzid)
+        if resolved is not None:
+            return resolved
+
+        resolved = None
+        try:
+            resolved = dateutil_tz.gettz(tzid)
+        except Exception:
+            resolved = None
+        if resolved is None and tzid in self._blocks:
+            try:
+                resolved = dateutil_tz.tzical(io.StringIO(self._blocks[tzid])).get()
+            except Exception as e:
+                logger.debug(f"Could not build timezone {tzid!r} from VTIMEZONE: {e}")
+        if resolved is None:
+            logger.debug(f"Unknown TZID {tzid!r}, treating times as UTC")
+            resolved = timezone.utc
+
+        self._resolved[tzid] = resolved
+        return resolved
+
+
+def to_datetime(time_value: IcsTime, timezones: IcsTimezones | None = None) -> datetime:
+    """Resolve an :class:`IcsTime` to an aware datetime.
+
+    DATE values become midnight UTC; ``Z`` values are UTC; TZID values use
+    *timezones*; floating values are taken as UTC. Raises ValueError on
+    malformed values.
+    """
+    value = time_value.value
+    if "-" in value or "/" in value:
+        # Non-standard ISO 8601 with separators
+        parsed = datetime.fromisoformat(value.replace("/", "-").rstrip("Zz"))
+        naive = parsed.replace(tzinfo=None)
+    else:
+        raw = value.rstrip("Zz")
+        if len(raw) < 8 or not raw[:8].isdigit():
+            raise ValueError(f"malformed date-time {value!r}")
+        year, month, day = int(raw[0:4]), int(raw[4:6]), int(raw[6:8])
+        if time_value.is_date or len(raw) == 8:
+            return datetime(year, month, day, tzinfo=timezone.utc)
+        if raw[8:9] != "T":
+            raise ValueError(f"malformed date-time {value!r}")
+        clock = raw[9:]
+        if not clock.isdigit() or len(clock) not in (2, 4, 6):
+            raise ValueError(f"malformed date-time {value!r}")
+        hour = int(clock[0:2])
+        minute = int(clock[2:4]) if len(clock) >= 4 else 0
+        second = int(clock[4:6]) if len(clock) == 6 else 0
+        naive = datetime(year, month, day, hour, minute, min(second, 59))
+
+    if value[-1:] in ("Z", "z") or not time_value.tzid:
+        return naive.replace(tzinfo=timezone.utc)
+    zone = timezones.get(time_value.tzid) if timezones else (
+        dateutil_tz.gettz(time_value.tzid) or timezone.utc
+    )
+    return naive.replace(tzinfo=zone)
+
+
+_DURATION = re.compile(
+    r"^([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$"
+)
+
+
+def parse_duration(value: str) -> timedelta:
+    """Parse an RFC 5545 DURATION such as ``PT1H30M`` or ``-P1D``."""
+    match = _DURATION.match(value.strip().upper())
+    if not match:
+        raise ValueError(f"malformed duration {value!r}")
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    delta = timedelta(
+        weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0),
+        minutes=int(minutes or 0), seconds=int(seconds or 0),
+    )
+    return -delta if sign == "-" else delta
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 📅 IcsEvent                                                        ║
+# ║ Light per-VEVENT record filled straight from content lines         ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class IcsEvent:
+    """The handful of VEVENT properties the bot uses, unresolved.
+
+    Text properties are unescaped; date-time properties are kept as
+    :class:`IcsTime` so events that are filtered out are never resolved.
+    """
+
+    __slots__ = (
+        "uid", "summary", "location", "description", "status",
+        "dtstart", "dtend", "duration", "sequence", "last_modified",
+        "recurrence_id", "rrule", "rdate", "exdate",
+    )
+
+    def __init__(self):
+        self.uid: str | None = None
+        self.summary: str | None = None
+        self.location: str | None = None
+        self.description: str | None = None
+        self.status: str | None = None
+        self.dtstart: IcsTime | None = None
+        self.dtend: IcsTime | None = None
+        self.duration: str | None = None
+        self.sequence = 0
+        self.last_modified: IcsTime | None = None
+        self.recurrence_id: IcsTime | None = None
+        self.rrule: str | None = None
+        self.rdate: List[IcsTime] = []
+        self.exdate: List[IcsTime] = []
+
+    def add_property(self, name: str, params: Dict[str, str], value: str) -> None:
+        if name == "SUMMARY":
+            self.summary = unescape_text(value)
+        elif name == "DTSTART":
+            self.dtstart = IcsTime(value, params)
+        elif name == "DTEND":
+            self.dtend = IcsTime(value, params)
+        elif name == "LOCATION":
+            self.location = unescape_text(value)
+        elif name == "DESCRIPTION":
+            self.description = unescape_text(value)
+        elif name == "UID":
+            self.uid = value.strip()
+        elif name == "DURATION":
+            self.duration = value.strip()
+        elif name == "SEQUENCE":
+            try:
+                self.sequence = int(value.strip())
+            except ValueError:
+                self.sequence = 0
+        elif name == "LAST-MODIFIED":
+            self.last_modified = IcsTime(value, params)
+        elif name == "STATUS":
+            self.status = value.strip().upper()
+        elif name == "RECURRENCE-ID":
+            self.recurrence_id = IcsTime(value, params)
+        elif name == "RRULE":
+            self.rrule = value.strip()
+        elif name in ("RDATE", "EXDATE"):
+            if params.get("VALUE", "").upper() == "PERIOD":
+                return
+            target = self.rdate if name == "RDATE" else self.exdate
+            target.extend(IcsTime(v, params) for v in value.split(",") if v.strip())
+
+    def span(self, timezones: IcsTimezones | None = None) -> Tuple[datetime, datetime]:
+        """Resolve ``(begin, end)`` with the same rules as ``ics.Event``.
+
+        DURATION wins over DTEND; an all-day event without an end lasts
+        one day, a timed one is instant. Raises ValueError when DTSTART is
+        missing or malformed.
+        """
+        if self.dtstart is None:
+            raise ValueError("VEVENT without DTSTART")
+        begin = to_datetime(self.dtstart, timezones)
+        if self.duration:
+            end = begin + parse_duration(self.duration)
+        elif self.dtend is not None:
+            end = to_datetime(self.dtend, timezones)
+        elif self.dtstart.is_date:
+            end = begin + timedelta(days=1)
+        else:
+            end = begin
+        return begin, max(begin, end)
+
+    def __repr__(self) -> str:
+        return f"<IcsEvent uid={self.uid!r} summary={self.summary!r} dtstart={self.dtstart!r}>"
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🌊 iter_vevents                                                    ║
+# ║ Yields one IcsEvent per VEVENT while walking the feed once         ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def iter_vevents(source: str | Iterable[str],
+                 timezones: IcsTimezones | None = None) -> Iterator[IcsEvent]:
+    """Yield each top-level VEVENT in *source* as an :class:`IcsEvent`.
+
+    Properties of nested components (VALARM) are ignored. VTIMEZONE
+    blocks are registered in *timezones* as they are passed, which is
+    normally before the events that use them. Raises
+    :class:`IcsStreamError` on an END that does not match its BEGIN or a
+    feed that stops inside a component.
+    """
+    stack: List[str] = []
+    event: IcsEvent | None = None
+    tz_lines: List[str] | None = None
+    tz_id: str | None = None
+
+    for line in iter_unfolded_lines(source):
+        parsed = split_content_line(line)
+        if parsed is None:
+            continue
+        name, params, value = parsed
+
+        if name == "BEGIN":
+            component = value.strip().upper()
+            stack.append(component)
+            if component == "VEVENT" and event is None:
+                event = IcsEvent()
+            elif component == "VTIMEZONE" and tz_lines is None:
+                tz_lines, tz_id = [line], None
+            elif tz_lines is not None:
+                tz_lines.append(line)
+            continue
+
+        if name == "END":
+            component = value.strip().upper()
+            if not stack or stack[-1] != component:
+                open_component = stack[-1] if stack else "nothing"
+                raise IcsStreamError(f"END:{component} while inside {open_component}")
+            stack.pop()
+            if component == "VEVENT" and "VEVENT" not in stack and event is not None:
+                yield event
+                event = None
+            elif tz_lines is not None:
+                tz_lines.append(line)
+                if component == "VTIMEZONE":
+                    if tz_id and timezones is not None:
+                        timezones.add_block(tz_id, "\n".join(tz_lines))
+                    tz_lines, tz_id = None, None
+            continue
+
+        if tz_lines is not None:
+            tz_lines.append(line)
+            if name == "TZID" and stack[-1] == "VTIMEZONE":
+                tz_id = value.strip()
+        elif event is not None and stack[-1] == "VEVENT":
+            event.add_property(name, params, value)
+
+    if stack:
+        raise IcsStreamError(f"feed ended inside {stack[-1]}")
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ ✂️ Window Pre-filter                                               ║
+# ║ Drops VEVENT blocks that cannot overlap a date window, unparsed    ║
+# ╚════════════════════════════════════════════════════════════════════╝
+_WINDOW_MARGIN = timedelta(days=1)
+
+
+def _raw_date(value: str) -> date | None:
+    """The calendar date at the start of a raw DATE/DATE-TIME value."""
+    digits = value.strip().replace("-", "")[:8]
+    if len(digits) != 8 or not digits.isdigit():
+        return None
+    try:
+        return date(int(digits[0:4]), int(digits[4:6]), int(digits[6:8]))
+    except ValueError:
+        return None
+
+
+def _block_may_overlap(block: List[str], start_date: date, end_date: date) -> bool:
+    """Cheap check whether a raw VEVENT block can have an occurrence in the window.
+
+    Reads only DTSTART, RECURRENCE-ID and the RRULE UNTIL. Dates are
+    compared with a one-day margin so timezone offsets never drop an
+    event; anything that cannot be read is kept for the real parser.
+    """
+    dtstart = recurrence_id = None
+    recurring = False
+    until: date | None = None
+    for line in iter_unfolded_lines(block):
+        name = line[:line.find(":")].split(";", 1)[0].upper() if ":" in line else ""
+        if name == "DTSTART" and dtstart is None:
+            dtstart = _raw_date(line[line.rfind(":") + 1:])
+            if dtstart is None:
+                return True
+        elif name == "RECURRENCE-ID":
+            recurrence_id = _raw_date(line[line.rfind(":") + 1:])
+        elif name == "RRULE":
+            recurring = True
+            for part in line.split(":", 1)[1].split(";"):
+                if part.upper().startswith("UNTIL="):
+                    until = _raw_date(part[6:])
+        elif name == "RDATE":
+            recurring = True
+
+    if dtstart is None:
+        return True
+    lower, upper = start_date - _WINDOW_MARGIN, end_date + _WINDOW_MARGIN
+    if recurrence_id is not None and lower <= recurrence_id <= upper:
+        return True
+    if dtstart > upper:
+        return False
+    if recurring:
+        return until is None or until >= lower
+    return dtstart >= lower
+
+
+def iter_window_lines(source: str | Iterable[str], start_date: date, end_date: date) -> Iterator[str]:
+    """Yield the raw lines of *source*, minus VEVENT blocks outside the window.
+
+    Everything outside VEVENTs (calendar properties, VTIMEZONE blocks)
+    passes through untouched, so the result is still a valid feed for
+    either parser.
+    """
+    lines = _iter_text_lines(source) if isinstance(source, str) else (l.rstrip("\r\n") for l in source)
+    block: List[str] | None = None
+    depth = 0
+    for line in lines:
+        marker = line.strip().upper()
+        if block is None:
+            if marker == "BEGIN:VEVENT":
+                block, depth = [line], 1
+            else:
+                yield line
+            continue
+
+        block.append(line)
+        if marker == "BEGIN:VEVENT":
+            depth += 1
+        elif marker == "END:VEVENT":
+            depth -= 1
+            if depth == 0:
+                if _block_may_overlap(block, start_date, end_date):
+                    yield from block
+                block = None
+
+    if block is not None:
+        # Unterminated block: hand it on so the parser can report it
+        yield from block
+
+
+def prefilter_ics_window(content: str, start_date: date, end_date: date) -> str:
+    """Return *content* with out-of-window VEVENT blocks removed."""
+    return "\n".join(iter_window_lines(content, start_date, end_date)) + "\n"
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🔂 Recurrence Expansion                                            ║
+# ║ Lazy RRULE/RDATE/EXDATE expansion limited to a date window         ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class RecurrenceCache:
+    """LRU of expanded occurrence starts per recurring event and window.
+
+    Keyed by UID and SEQUENCE plus the raw recurrence properties (feeds
+    often edit a series without bumping SEQUENCE) and the window, so an
+    unchanged series is not re-expanded on every poll. Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Tuple[datetime, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: tuple) -> Tuple[datetime, ...] | None:
+        with self._lock:
+            starts = self._entries.get(key)
+            if starts is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return starts
+
+    def put(self, key: tuple, starts: Tuple[datetime, ...]) -> None:
+        with self._lock:
+            self._entries[key] = starts
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate_percent": round(self._hits / total * 100, 1) if total else 0.0,
+            }
+
+
+_recurrence_cache = RecurrenceCache()
+
+
+def get_recurrence_cache_stats() -> Dict[str, Any]:
+    return _recurrence_cache.get_stats()
+
+
+_UNTIL = re.compile(r"(?i)(UNTIL=)([0-9T]+Z?)")
+
+
+def _utc_until(rule: str, begin: datetime) -> str:
+    """Rewrite a floating or DATE UNTIL as UTC, which dateutil requires
+    once DTSTART is timezone-aware."""
+    match = _UNTIL.search(rule)
+    if not match or match.group(2).upper().endswith("Z"):
+        return rule
+    value = match.group(2)
+    until = to_datetime(IcsTime(value, {}))
+    if len(value) == 8:
+        until = until + timedelta(days=1) - timedelta(seconds=1)
+    local = until.replace(tzinfo=begin.tzinfo)
+    utc_value = local.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return rule[:match.start(2)] + utc_value + rule[match.end(2):]
+
+
+def _window_bounds(start_date: date, end_date: date) -> Tuple[datetime, datetime]:
+    """UTC instants a day either side of the window, to cover any offset."""
+    lower = datetime.combine(start_date, time.min, tzinfo=timezone.utc) - timedelta(days=1)
+    upper = datetime.combine(end_date, time.max, tzinfo=timezone.utc) + timedelta(days=1)
+    return lower, upper
+
+
+def _expand_starts(event: IcsEvent, begin: datetime, timezones: IcsTimezones | None,
+                   start_date: date, end_date: date) -> Iterator[datetime]:
+    """Yield the series' start instants whose date falls in the window, in order."""
+    lower, upper = _window_bounds(start_date, end_date)
+    streams: List[Iterable[datetime]] = [[begin] if lower <= begin <= upper else []]
+
+    if event.rrule:
+        rule = rrulestr(_utc_until(event.rrule, begin), dtstart=begin)
+
+        def bounded(starts: Iterator[datetime]) -> Iterator[datetime]:
+            for start in starts:
+                if start > upper:
+                    return
+                yield start
+
+        streams.append(bounded(rule.xafter(lower, inc=True)))
+
+    rdates = []
+    for value in event.rdate:
+        try:
+            start = to_datetime(value, timezones)
+        except ValueError:
+            continue
+        if lower <= start <= upper:
+            rdates.append(start)
+    streams.append(sorted(rdates))
+
+    excluded, excluded_days = set(), set()
+    for value in event.exdate:
+        try:
+            when = to_datetime(value, timezones)
+        except ValueError:
+            continue
+        if value.is_date:
+            excluded_days.add(when.date())
+        else:
+            excluded.add(when)
+
+    previous = None
+    for start in heapq.merge(*streams):
+        if start == previous:
+            continue
+        previous = start
+        if start in excluded or start.date() in excluded_days:
+            continue
+        if start_date <= start.date() <= end_date:
+            yield start
+
+
+def iter_occurrences(event: IcsEvent, timezones: IcsTimezones | None, start_date: date, end_date: date,
+                     overridden: frozenset = frozenset(),
+                     cache: RecurrenceCache | None = _recurrence_cache) -> Iterator[Tuple[datetime, datetime]]:
+    """Lazily yield ``(begin, end)`` for each occurrence of a recurring event in the window.
+
+    Occurrences whose start is in *overridden* (RECURRENCE-ID instants of
+    the series' override VEVENTs) are skipped; the overrides are separate
+    events. The expansion is stored in *cache* once fully consumed.
+    Raises ValueError for a malformed DTSTART or RRULE.
+    """
+    begin, end = event.span(timezones)
+    duration = end - begin
+
+    key = None
+    cached = None
+    if cache is not None and event.uid:
+        key = (
+            event.uid, event.sequence,
+            event.last_modified.value if event.last_modified else None,
+            event.dtstart.value, event.dtstart.tzid, event.rrule,
+            tuple(v.value for v in event.rdate), tuple(v.value for v in event.exdate),
+            start_date, end_date,
+        )
+        cached = cache.get(key)
+
+    starts = iter(cached) if cached is not None else _expand_starts(event, begin, timezones, start_date, end_date)
+    collected: List[datetime] = []
+    for start in starts:
+        if cached is None:
+            collected.append(start)
+        if start in overridden:
+            continue
+        yield start, start + duration
+
+    if key is not None and cached is None:
+        cache.put(key, tuple(collected))
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 📤 extract_window_occurrences                                      ║
+# ║ Compact, picklable (title, begin, end, location, description) rows ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def extract_window_occurrences(source: str | Iterable[str], start_date: date, end_date: date,
+                               label: str = "feed", limit: int = 1000) -> List[Tuple[str, str, str, str, str]]:
+    """Return the occurrences starting inside ``[start_date, end_date]`` as plain tuples.
+
+    Each row is ``(title, begin_iso, end_iso, location, description)`` with
+    the same length caps the bot applies. Only strings are returned so the
+    rows are cheap to send back from a worker process. Single events are
+    emitted as they stream past; recurring series are expanded once the
+    whole feed (and so every RECURRENCE-ID override) has been seen.
+    Raises :class:`IcsStreamError` when the structure cannot be followed
+    or no VEVENT has a usable DTSTART.
+    """
+    timezones = IcsTimezones()
+    rows: List[Tuple[str, str, str, str, str]] = []
+    series: List[IcsEvent] = []
+    overrides: Dict[str, List[IcsTime]] = {}
+    seen = skipped = 0
+
+    def emit(event: IcsEvent, begin: datetime, end: datetime) -> bool:
+        if len(rows) >= limit:
+            logger.warning(f"ICS calendar {label} has too many events (>{limit}), truncating")
+            return False
+        rows.append((
+            (event.summary or "")[:500],
+            begin.isoformat(),
+            end.isoformat(),
+            (event.location or "")[:200],
+            (event.description or "")[:1000],
+        ))
+        return True
+
+    for event in iter_vevents(iter_window_lines(source, start_date, end_date), timezones):
+        seen += 1
+        if event.recurrence_id is not None:
+            if event.uid:
+                overrides.setdefault(event.uid, []).append(event.recurrence_id)
+            if event.status == "CANCELLED":
+                continue
+        elif event.rrule or event.rdate:
+            series.append(event)
+            continue
+
+        try:
+            begin, end = event.span(timezones)
+        except (ValueError, OverflowError) as e:
+            skipped += 1
+            logger.debug(f"Skipping ICS event {event.uid!r} from {label}: {e}")
+            continue
+        if start_date <= begin.date() <= end_date and not emit(event, begin, end):
+            return rows
+
+    for event in series:
+        overridden = set()
+        for value in overrides.get(event.uid, ()):
+            try:
+                overridden.add(to_datetime(value, timezones))
+            except ValueError:
+                continue
+        try:
+            for begin, end in iter_occurrences(event, timezones, start_date, end_date, frozenset(overridden)):
+                if not emit(event, begin, end):
+                    return rows
+        except (ValueError, OverflowError) as e:
+            skipped += 1
+            logger.debug(f"Skipping recurring ICS event {event.uid!r} from {label}: {e}")
+
+    if seen and skipped == seen:
+        raise IcsStreamError(f"none of {seen} VEVENTs had a usable DTSTART")
+    return rows
@@ -16,6 +16,8 @@ from environ import (
     CALENDAR_SOURCES
 )
 from log import logger, get_log_file_location
+from http_pool import close_sessions
+from events import shutdown_ics_parse_pool
 
 
 # Flag to track if shutdown is in progress
@@ -62,9 +64,12 @@ def cleanup():
     if not shutdown_in_progress:
         logger.info("Running cleanup operations...")
         
-        # Any additional cleanup can be added here
-        # For example, closing database connections, etc.
-        
+        # Drop pooled keep-alive HTTP connections
+        close_sessions()
+
+        # Stop ICS parse worker processes
+        shutdown_ics_parse_pool()
+
         logger.info("Cleanup complete")
 
 # ╔════════════════════════════════════════════════════════════════════╗
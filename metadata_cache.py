@@ -0,0 +1,163 @@
+"""Persisted cache of calendar source metadata.
+
+Holds the result of probing each source (the ICS HEAD/ranged-GET check,
+the Google ``calendarList`` lookup) under ``ics_<url>`` / ``google_<id>``
+keys. Entries live in ``/data/calendar_metadata.json`` so a restart reuses
+them instead of re-probing every source.
+
+Each entry expires on its own clock: successful lookups after
+``success_ttl``, errors after a TTL chosen by their ``error_type`` (config
+problems such as 401/403/404 are kept longer than network blips). Once an
+entry is past :data:`REFRESH_AHEAD` of its TTL, :meth:`needs_refresh`
+reports it so a background task can re-probe it before it expires, which is
+also how renamed calendars are picked up while running.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterator
+
+from log import logger
+from storage import data_path, load_json, save_json
+
+# Error entries by error_type: persistent config issues are cached longer
+ERROR_TTLS = {
+    "authentication": 6 * 3600,
+    "forbidden": 6 * 3600,
+    "not_found": 6 * 3600,
+    # Server doesn't support HEAD/GET
+    "method_not_allowed": 24 * 3600,
+}
+# Network issues, timeouts and anything unclassified
+DEFAULT_ERROR_TTL = 30 * 60
+
+# Fraction of an entry's TTL after which it is due for a background refresh
+REFRESH_AHEAD = 0.8
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🗂️ CalendarMetadataCache                                           ║
+# ║ Source metadata with per-entry TTLs, persisted across restarts     ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class CalendarMetadataCache:
+    """Dict-like metadata cache that hides expired entries. Thread-safe.
+
+    Stored entries are the metadata dicts themselves, stamped with
+    ``cached_at`` when first stored.
+    """
+
+    def __init__(self, path: str | None = None, success_ttl: float = 12 * 3600):
+        self.success_ttl = success_ttl
+        self._path = path
+        self._entries: Dict[str, Dict[str, Any]] | None = None
+        self._lock = threading.RLock()
+
+    def _file(self) -> str:
+        if self._path is None:
+            self._path = data_path("calendar_metadata.json")
+        return self._path
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            entries = load_json(self._file(), {})
+            if not isinstance(entries, dict):
+                entries = {}
+            now = time.time()
+            self._entries = {
+                key: entry for key, entry in entries.items()
+                if isinstance(entry, dict) and not self._expired(entry, now)
+            }
+            if self._entries:
+                logger.info(f"Loaded {len(self._entries)} cached calendar metadata entries")
+        return self._entries
+
+    def _save(self) -> None:
+        save_json(self._file(), self._entries)
+
+    def ttl_for(self, entry: Dict[str, Any]) -> float:
+        """Lifetime of *entry* in seconds, based on its outcome."""
+        if entry.get("error"):
+            return ERROR_TTLS.get(entry.get("error_type", "unknown"), DEFAULT_ERROR_TTL)
+        return self.success_ttl
+
+    def _age(self, entry: Dict[str, Any], now: float) -> float:
+        return now - entry.get("cached_at", 0)
+
+    def _expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return self._age(entry, now) >= self.ttl_for(entry)
+
+    def _live(self, key: str) -> Dict[str, Any] | None:
+        entries = self._load()
+        entry = entries.get(key)
+        if entry is not None and self._expired(entry, time.time()):
+            logger.debug(f"Cached metadata for {key} expired")
+            del entries[key]
+            self._save()
+            return None
+        return entry
+
+    # -- mapping API --
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._live(key)
+        return default if entry is None else entry
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        entry = self.get(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry
+
+    def __setitem__(self, key: str, entry: Dict[str, Any]) -> None:
+        entry.setdefault("cached_at", time.time())
+        with self._lock:
+            self._load()[key] = entry
+            self._save()
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._load()[key]
+            self._save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._load()))
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._load().pop(key, None)
+            if entry is not None:
+                self._save()
+        return default if entry is None else entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._save()
+
+    # -- refresh-ahead --
+
+    def needs_refresh(self, key: str) -> bool:
+        """True if *key* is missing, expired, or past its refresh-ahead point."""
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                return True
+            return self._age(entry, time.time()) >= REFRESH_AHEAD * self.ttl_for(entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = list(self._load().values())
+        return {
+            "entries": len(entries),
+            "errors": sum(1 for e in entries if e.get("error")),
+            "success_ttl": self.success_ttl,
+        }
@@ -0,0 +1,168 @@
+"""Adaptive per-source polling intervals for change detection.
+
+A holiday feed that changes twice a year does not need the same polling as
+a busy team calendar. :class:`PollScheduler` gives every source its own
+interval: it starts at the floor, doubles each time a poll finds the
+source unchanged, and drops back to the floor as soon as a change is seen.
+The interval always stays between the configured floor and ceiling.
+
+Publishers can ask for a slower refresh: the ICS ``X-PUBLISHED-TTL`` /
+``REFRESH-INTERVAL`` properties and HTTP ``Cache-Control: max-age`` are
+collected per source and raise its lower bound (still capped by the
+ceiling).
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict
+
+# How much of a feed is searched for X-PUBLISHED-TTL / REFRESH-INTERVAL
+_HINT_SEARCH_BYTES = 16 * 1024
+
+_DURATION_RE = re.compile(
+    r"^\+?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$"
+)
+_FEED_HINT_RE = re.compile(
+    rb"^(?:X-PUBLISHED-TTL|REFRESH-INTERVAL)(?:;[^:\r\n]*)?:[ \t]*([^\r\n]+)",
+    re.MULTILINE | re.IGNORECASE,
+)
+_MAX_AGE_RE = re.compile(r"(?:^|[,\s])(?:s-)?max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+def parse_ics_duration(value: str) -> float | None:
+    """Seconds in an RFC 5545 DURATION such as ``PT1H`` or ``P1D``, or None."""
+    match = _DURATION_RE.match(value.strip().upper())
+    if not match or not any(match.groups()):
+        return None
+    weeks, days, hours, minutes, seconds = (int(g or 0) for g in match.groups())
+    return float(((weeks * 7 + days) * 24 + hours) * 3600 + minutes * 60 + seconds)
+
+
+def feed_refresh_hint(body: bytes) -> float | None:
+    """Refresh interval a feed asks for via X-PUBLISHED-TTL / REFRESH-INTERVAL.
+
+    Only the calendar header (before the first component) is searched.
+    """
+    head = body[:_HINT_SEARCH_BYTES]
+    calendar = head.find(b"BEGIN:VCALENDAR")
+    first_component = head.find(b"BEGIN:V", calendar + 1 if calendar != -1 else 0)
+    if first_component != -1:
+        head = head[:first_component]
+    hints = [parse_ics_duration(m.group(1).decode("ascii", "ignore")) for m in _FEED_HINT_RE.finditer(head)]
+    hints = [h for h in hints if h]
+    return max(hints) if hints else None
+
+
+def cache_control_max_age(value: str | None) -> float | None:
+    """Positive ``max-age`` from a Cache-Control header, or None."""
+    if not value or "no-store" in value.lower():
+        return None
+    match = _MAX_AGE_RE.search(value)
+    if not match or int(match.group(1)) <= 0:
+        return None
+    return float(match.group(1))
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ ⏱️ PollScheduler                                                   ║
+# ║ Per-source polling intervals that adapt to observed changes        ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class PollScheduler:
+    """Tracks when each source is next due for a change-detection poll.
+
+    Sources are keyed by ID (Google calendar ID or ICS URL). A source never
+    polled is always due. Thread-safe, since hints are noted from the
+    fetch worker threads.
+    """
+
+    def __init__(self, floor: float = 300, ceiling: float = 3600, backoff: float = 2.0):
+        self.floor = max(1.0, floor)
+        self.ceiling = max(self.floor, ceiling)
+        self.backoff = max(1.0, backoff)
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, source_id: str) -> Dict[str, Any]:
+        return self._state.setdefault(source_id, {
+            "interval": self.floor,
+            "next_due": 0.0,
+            "signature": None,
+            "polls": 0,
+            "changes": 0,
+            "last_change": None,
+            "feed_hint": None,
+            "http_hint": None,
+        })
+
+    def _lower_bound(self, entry: Dict[str, Any]) -> float:
+        hints = [h for h in (entry["feed_hint"], entry["http_hint"]) if h]
+        return min(self.ceiling, max([self.floor, *hints]))
+
+    # -- hints --
+
+    def note_feed_hint(self, source_id: str, seconds: float | None) -> None:
+        """Record the feed's X-PUBLISHED-TTL / REFRESH-INTERVAL (None clears it)."""
+        with self._lock:
+            self._entry(source_id)["feed_hint"] = seconds
+
+    def note_http_hint(self, source_id: str, seconds: float | None) -> None:
+        """Record the last response's Cache-Control max-age (None clears it)."""
+        with self._lock:
+            self._entry(source_id)["http_hint"] = seconds
+
+    # -- scheduling --
+
+    def is_due(self, source_id: str, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._state.get(source_id)
+            return entry is None or now >= entry["next_due"]
+
+    def record(self, source_id: str, signature: str, now: float | None = None) -> bool:
+        """Account a successful poll whose content hashes to *signature*.
+
+        Returns True if the content changed since the previous poll. The
+        first poll of a source only sets its baseline.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entry(source_id)
+            lower = self._lower_bound(entry)
+            changed = entry["signature"] is not None and signature != entry["signature"]
+            if entry["signature"] is None or changed:
+                entry["interval"] = lower
+            else:
+                entry["interval"] = min(self.ceiling, max(lower, entry["interval"] * self.backoff))
+            if changed:
+                entry["changes"] += 1
+                entry["last_change"] = now
+            entry["signature"] = signature
+            entry["polls"] += 1
+            entry["next_due"] = now + entry["interval"]
+            return changed
+
+    def record_failure(self, source_id: str, now: float | None = None) -> None:
+        """A poll failed: try again after the current interval, unchanged."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entry(source_id)
+            entry["next_due"] = now + entry["interval"]
+
+    def interval(self, source_id: str) -> float | None:
+        """Current polling interval of *source_id* in seconds (None until first polled)."""
+        with self._lock:
+            entry = self._state.get(source_id)
+            return entry["interval"] if entry and entry["polls"] else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            intervals = [e["interval"] for e in self._state.values() if e["polls"]]
+        return {
+            "sources": len(intervals),
+            "floor": self.floor,
+            "ceiling": self.ceiling,
+            "at_floor": sum(1 for i in intervals if i <= self.floor),
+            "at_ceiling": sum(1 for i in intervals if i >= self.ceiling),
+            "mean_interval": round(sum(intervals) / len(intervals), 1) if intervals else 0.0,
+        }
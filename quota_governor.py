@@ -0,0 +1,217 @@
+"""Token-bucket rate limiting for Google Calendar API calls.
+
+Google meters the Calendar API per project and per user (for us, the
+service account), both as queries per minute. :class:`QuotaGovernor` keeps
+one token bucket per quota, refilled continuously at the quota rate.
+Every API call, metadata or events, takes a token from each bucket first.
+When a bucket is empty the caller queues until the bucket refills; it
+does not fail.
+
+Calls come in two priority classes. :data:`INTERACTIVE` calls (slash
+commands) are served before :data:`BACKGROUND` calls (polling, snapshots,
+metadata refresh). Background calls also leave a reserve in each bucket
+untouched, so a command never waits behind a polling burst. The class is
+held in a context variable: the command tree marks each interaction
+interactive, everything else defaults to background, and
+``asyncio.to_thread`` carries the class into worker threads.
+
+Blocking callers (the googleapiclient path in worker threads) use
+:meth:`QuotaGovernor.acquire`; coroutines use
+:meth:`QuotaGovernor.async_acquire`. Both draw from the same buckets.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict
+
+from log import logger
+
+# Priority classes, highest first
+INTERACTIVE = 0
+BACKGROUND = 1
+
+_PRIORITY_NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+
+_api_priority: ContextVar[int] = ContextVar("google_api_priority", default=BACKGROUND)
+
+
+def current_api_priority() -> int:
+    """Priority class of Google API calls made from the current context."""
+    return _api_priority.get()
+
+
+def set_api_priority(priority: int) -> None:
+    """Mark the rest of the current task (and threads it starts) as *priority*."""
+    _api_priority.set(priority)
+
+
+@contextmanager
+def api_priority(priority: int):
+    """Make Google API calls inside the block with *priority*."""
+    token = _api_priority.set(priority)
+    try:
+        yield
+    finally:
+        _api_priority.reset(token)
+
+
+class TokenBucket:
+    """``capacity`` tokens refilled at ``per_minute`` tokens per minute. Not locked."""
+
+    __slots__ = ("name", "capacity", "rate", "tokens", "updated")
+
+    def __init__(self, name: str, per_minute: float, capacity: float | None = None):
+        self.name = name
+        self.rate = max(per_minute, 1.0) / 60.0
+        self.capacity = max(capacity if capacity is not None else per_minute, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until(self, tokens: float) -> float:
+        """Seconds until the bucket holds *tokens* (0 if it already does)."""
+        return max(0.0, (tokens - self.tokens) / self.rate)
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🪣 QuotaGovernor                                                   ║
+# ║ Per-project and per-user token buckets with priority queueing      ║
+# ╚════════════════════════════════════════════════════════════════════╝
+class QuotaGovernor:
+    """Paces Google API calls to stay inside the project's quotas. Thread-safe.
+
+    :meth:`acquire` blocks until every bucket can pay for the call. A
+    background call may not take a bucket below ``background_reserve`` of
+    its capacity, and it waits while any interactive call is queued.
+    """
+
+    def __init__(self, project_per_minute: float = 10000, user_per_minute: float = 600,
+                 background_reserve: float = 0.2):
+        self._buckets = [
+            TokenBucket("project", project_per_minute),
+            TokenBucket("user", user_per_minute),
+        ]
+        self.background_reserve = min(max(background_reserve, 0.0), 0.9)
+        self._cond = threading.Condition()
+        self._waiting = {INTERACTIVE: 0, BACKGROUND: 0}
+        self._granted = {INTERACTIVE: 0, BACKGROUND: 0}
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._throttles = 0
+
+    @property
+    def max_cost(self) -> float:
+        return min(b.capacity for b in self._buckets)
+
+    def _try_take(self, cost: float, priority: int) -> float:
+        """Take *cost* tokens and return 0, or return how long to wait. Call under the lock."""
+        now = time.monotonic()
+        wait = 0.0
+        for bucket in self._buckets:
+            bucket.refill(now)
+            floor = 0.0
+            if priority != INTERACTIVE:
+                floor = min(self.background_reserve * bucket.capacity, bucket.capacity - cost)
+            wait = max(wait, bucket.time_until(cost + floor))
+        if priority != INTERACTIVE and self._waiting[INTERACTIVE]:
+            # Let queued interactive calls go first; re-check once a token has refilled
+            return max(wait, min(1.0 / b.rate for b in self._buckets))
+        if wait > 0:
+            return wait
+        for bucket in self._buckets:
+            bucket.tokens -= cost
+        return 0.0
+
+    def acquire(self, cost: float = 1, priority: int | None = None) -> float:
+        """Block until *cost* calls may be made; return the seconds spent queued.
+
+        *priority* defaults to the current context's class (see
+        :func:`current_api_priority`).
+        """
+        priority = current_api_priority() if priority is None else priority
+        cost = min(max(cost, 1), self.max_cost)
+        started = time.monotonic()
+        waited = False
+        with self._cond:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    wait = self._try_take(cost, priority)
+                    if wait == 0.0:
+                        break
+                    waited = True
+                    self._cond.wait(timeout=wait)
+            finally:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+            self._granted[priority] += 1
+            elapsed = time.monotonic() - started
+            if waited:
+                self._waits += 1
+                self._wait_seconds += elapsed
+        if waited:
+            logger.debug(f"Google API {_PRIORITY_NAMES.get(priority, priority)} call queued {elapsed:.2f}s for quota")
+        return elapsed if waited else 0.0
+
+    async def async_acquire(self, cost: float = 1, priority: int | None = None) -> float:
+        """Async counterpart of :meth:`acquire`; queues without blocking the loop."""
+        priority = current_api_priority() if priority is None else priority
+        cost = min(max(cost, 1), self.max_cost)
+        started = time.monotonic()
+        waited = False
+        with self._cond:
+            self._waiting[priority] += 1
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_take(cost, priority)
+                if wait == 0.0:
+                    break
+                waited = True
+                await asyncio.sleep(wait)
+        finally:
+            with self._cond:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+        elapsed = time.monotonic() - started
+        with self._cond:
+            self._granted[priority] += 1
+            if waited:
+                self._waits += 1
+                self._wait_seconds += elapsed
+        if waited:
+            logger.debug(f"Google API {_PRIORITY_NAMES.get(priority, priority)} call queued {elapsed:.2f}s for quota")
+        return elapsed if waited else 0.0
+
+    def throttle(self) -> None:
+        """Google answered with a rate-limit error: empty every bucket so callers back off."""
+        with self._cond:
+            now = time.monotonic()
+            for bucket in self._buckets:
+                bucket.refill(now)
+                bucket.tokens = 0.0
+            self._throttles += 1
+        logger.info("Google API rate limited, draining quota buckets")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.monotonic()
+            for bucket in self._buckets:
+                bucket.refill(now)
+            return {
+                "tokens": {b.name: round(b.tokens, 1) for b in self._buckets},
+                "capacity": {b.name: b.capacity for b in self._buckets},
+                "waiting_interactive": self._waiting[INTERACTIVE],
+                "waiting_background": self._waiting[BACKGROUND],
+                "granted_interactive": self._granted[INTERACTIVE],
+                "granted_background": self._granted[BACKGROUND],
+                "waits": self._waits,
+                "wait_seconds": round(self._wait_seconds, 1),
+                "throttles": self._throttles,
+            }
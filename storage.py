@@ -0,0 +1,72 @@
+"""Helpers for persisting bot state as JSON under the data directory.
+
+Mirrors the fallback behaviour used for logs and reminders: prefer
+``DATA_DIR`` (``/data`` in Docker) and fall back to ``./data`` next to the
+source when the primary location is not writable.
+"""
+
+import json
+import os
+import tempfile
+from typing import Any
+
+from environ import DATA_DIR
+from log import logger
+
+_FALLBACK_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 📁 data_path                                                       ║
+# ║ Resolves a writable path under the data directory                  ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def data_path(*parts: str) -> str:
+    """Return a path under the first writable data directory.
+
+    Intermediate directories are created on demand.
+    """
+    for base in (DATA_DIR, _FALLBACK_DATA_DIR):
+        path = os.path.join(base, *parts)
+        parent = os.path.dirname(path)
+        try:
+            os.makedirs(parent, exist_ok=True)
+        except OSError:
+            continue
+        if os.access(parent, os.W_OK):
+            return path
+    return os.path.join(_FALLBACK_DATA_DIR, *parts)
+
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 💾 JSON load/save                                                  ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def load_json(path: str, default: Any) -> Any:
+    """Load JSON from *path*, returning *default* when missing or corrupt."""
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to load {path}, starting fresh: {e}")
+        return default
+
+
+def save_json(path: str, data: Any) -> bool:
+    """Atomically write *data* as JSON to *path*. Returns True on success."""
+    try:
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to save {path}: {e}")
+        return False
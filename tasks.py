@@ -11,6 +11,7 @@ from utils import (
     get_monday_of_week,
     is_in_current_week,
     format_event,
+    event_start,
     get_local_timezone
 )
 from commands import (
@@ -20,18 +21,25 @@ from commands import (
 )
 from events import (
     GROUPED_CALENDARS,
-    get_events,
+    get_events_async,
+    gather_events_async,
+    prefetch_google_events,
+    refresh_calendar_metadata_async,
+    is_source_poll_due,
+    record_source_poll,
     get_name_for_tag,
     get_color_for_tag,
     load_previous_events,
     save_current_events_for_key,
     compute_event_fingerprint,
-    compute_event_core_fingerprint
+    compute_event_core_fingerprint,
+    flush_host_profiles
 )
 from views import format_change_lines
+from event_model import event_start_key
 from log import logger
 from ai import generate_greeting, generate_image
-from environ import AI_TOGGLE
+from environ import AI_TOGGLE, FETCH_CONCURRENCY, WATCH_CYCLE_FETCHES, WATCH_CYCLE_SECONDS
 
 # Task health monitoring
 _task_last_success = {}
@@ -45,20 +53,25 @@ _pending_changes = {}  # tag -> {timestamp, added_events, removed_events, change
 _VERIFICATION_DELAY = timedelta(minutes=6)  # Wait 6 minutes before re-checking (avoid exact minute boundary issues)
 _MAX_VERIFICATION_ATTEMPTS = 3  # Maximum number of verification attempts
 
+# Last events fetched per source by change detection, reused while a source isn't due
+_last_source_events: Dict[str, list] = {}
 
-async def _fetch_calendar_events_safe(meta: dict, start, end, context: str = "", timeout: int = 300) -> list:
+# Monotonic time of each tag's last successful change check; stalest tags go first
+_tag_last_checked: Dict[str, float] = {}
+
+
+async def _fetch_calendar_events(meta: dict, start, end, context: str = "", timeout: int = 300) -> list | None:
     """Fetch events from a single calendar with timeout and comprehensive error handling.
 
-    Returns a list of events (empty on failure). Never raises except for
-    CancelledError and KeyboardInterrupt.
+    Returns a list of events, or None if the fetch failed. Never raises
+    except for CancelledError and KeyboardInterrupt.
     """
     cal_name = meta.get("name", "Unknown")
     try:
-        events = await asyncio.wait_for(
-            asyncio.to_thread(get_events, meta, start, end),
+        return await asyncio.wait_for(
+            get_events_async(meta, start, end, return_none_on_failure=True),
             timeout=timeout,
         )
-        return events or []
     except asyncio.CancelledError:
         logger.info(f"Event fetching was cancelled{' during ' + context if context else ''}")
         raise
@@ -73,7 +86,40 @@ async def _fetch_calendar_events_safe(meta: dict, start, end, context: str = "",
         logger.error(f"Data type error fetching events from calendar {cal_name}: {e}")
     except Exception as e:
         logger.exception(f"Error fetching events from calendar {cal_name}{' during ' + context if context else ''}: {e}")
-    return []
+    return None
+
+async def _fetch_sources(calendars: list, start, end, context: str = "", skip_ids: set = frozenset(),
+                         timeout: int = 300) -> list:
+    """Fetch every calendar in *calendars* concurrently (see events.gather_events_async).
+
+    Returns one entry per calendar in input order: its events, or None if
+    the fetch failed, took longer than *timeout* seconds or its ID is in
+    *skip_ids*.
+    """
+    wanted = [meta for meta in calendars if meta.get("id") not in skip_ids]
+    fetched = iter(await gather_events_async(
+        wanted, start, end,
+        fetch=lambda meta: _fetch_calendar_events(meta, start, end, context=context, timeout=timeout),
+    ))
+    return [None if meta.get("id") in skip_ids else next(fetched) for meta in calendars]
+
+def _merge_events(results: list) -> list:
+    """Concatenate per-calendar results from _fetch_sources(), skipping failures."""
+    return [event for events in results if events for event in events]
+
+async def _prefetch_google_safe(calendars: list, start, end, context: str = "") -> set:
+    """Batch-fetch the Google calendars among *calendars* into the event cache.
+
+    Returns the IDs that failed permanently (403/404) so callers can skip
+    them. Never raises except for CancelledError.
+    """
+    try:
+        return await asyncio.to_thread(prefetch_google_events, calendars, start, end)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning(f"Batched Google prefetch failed{' during ' + context if context else ''}: {e}")
+        return set()
 
 # ╔════════════════════════════════════════════════════════════════════╗
 # ║ 🔒 TaskLock                                                        ║
@@ -164,6 +210,9 @@ def start_all_tasks(bot):
 
         # Start reminder system
         check_reminders.start(bot)
+
+        # Re-probe calendar metadata before it expires
+        refresh_calendar_metadata_ahead.start(bot)
         
         logger.info("All scheduled tasks started successfully")
     except Exception as e:
@@ -176,6 +225,7 @@ def start_all_tasks(bot):
         try_start_task(monitor_task_health, bot)
         try_start_task(calendar_health_monitor, bot)
         try_start_task(check_reminders, bot)
+        try_start_task(refresh_calendar_metadata_ahead, bot)
 
 # ╔════════════════════════════════════════════════════════════════════╗
 # ║ 🔄 try_start_task                                                  ║
@@ -292,6 +342,10 @@ async def schedule_daily_posts(bot):
             if local_now.weekday() == 0 and local_now.hour == 8 and local_now.minute == 0:
                 logger.info("Starting weekly summary posting")
                 monday = get_monday_of_week(today)
+                await _prefetch_google_safe(
+                    [m for cals in GROUPED_CALENDARS.values() for m in cals],
+                    monday, monday + timedelta(days=6), context="weekly posts",
+                )
                 
                 for tag in list(GROUPED_CALENDARS.keys()):  # Use list() to prevent dict changed during iteration
                     try:
@@ -320,7 +374,73 @@ async def schedule_daily_posts(bot):
 # ║ 🕵️ watch_for_event_changes                                        ║
 # ║ Detects new or removed events in the current week and posts diffs ║
 # ╚════════════════════════════════════════════════════════════════════╝
-@tasks.loop(minutes=5)
+async def _poll_due_sources(calendars: list, start, end) -> set:
+    """Fetch the sources among *calendars* that are due and record the results.
+
+    Successful fetches replace the source's entry in _last_source_events
+    and adapt its polling interval; failures keep the previous events.
+    Returns the IDs fetched successfully.
+    """
+    due = list({meta.get("id"): meta for meta in calendars if is_source_poll_due(meta["id"])}.values())
+    if not due:
+        return set()
+    failed_ids = await _prefetch_google_safe(due, start, end, context="change detection")
+    results = await _fetch_sources(due, start, end, context="change detection", skip_ids=failed_ids)
+    fetched = set()
+    for meta, events in zip(due, results):
+        if record_source_poll(meta["id"], events):
+            logger.debug(f"Source '{meta.get('name')}' changed, polling it more often")
+        if events is not None:
+            _last_source_events[meta["id"]] = events
+            fetched.add(meta["id"])
+    return fetched
+
+async def _poll_stalest_tags(start, end) -> list:
+    """Choose and fetch this cycle's tags, least recently checked first.
+
+    Only tags with a source due for polling are candidates. Tags are
+    fetched in waves of up to FETCH_CONCURRENCY sources until the cycle's
+    fetch budget (WATCH_CYCLE_FETCHES) or time budget (WATCH_CYCLE_SECONDS)
+    runs out; tags left over keep their place at the front of the next
+    cycle. Returns the fetched tags as ``(tag, calendars)`` pairs.
+    """
+    candidates = [
+        (tag, cals) for tag, cals in list(GROUPED_CALENDARS.items())
+        if any(is_source_poll_due(m["id"]) for m in cals)
+    ]
+    # Never-checked tags first; ties keep config order
+    queue = sorted(candidates, key=lambda item: _tag_last_checked.get(item[0], 0.0))
+    started = time.monotonic()
+    fetches_left = max(1, WATCH_CYCLE_FETCHES)
+    selected = []
+
+    while queue and fetches_left > 0 and time.monotonic() - started < WATCH_CYCLE_SECONDS:
+        wave, wave_ids = [], set()
+        wave_size = min(fetches_left, max(1, FETCH_CONCURRENCY))
+        while queue:
+            tag, cals = queue[0]
+            due_ids = {m["id"] for m in cals if is_source_poll_due(m["id"])} - wave_ids
+            # A wave always takes at least one tag, however many sources it has
+            if wave and len(wave_ids) + len(due_ids) > wave_size:
+                break
+            queue.pop(0)
+            wave.append((tag, cals))
+            wave_ids |= due_ids
+        fetches_left -= len(wave_ids)
+
+        fetched = await _poll_due_sources([m for _, cals in wave for m in cals], start, end)
+        checked_at = time.monotonic()
+        for tag, cals in wave:
+            if any(m["id"] in fetched for m in cals):
+                _tag_last_checked[tag] = checked_at
+        selected.extend(wave)
+
+    if queue:
+        logger.debug(f"Change detection budget reached, {len(queue)} tag(s) deferred to the next cycle")
+    return selected
+
+# Ticks every minute; each source is only fetched when its adaptive interval is up
+@tasks.loop(minutes=1)
 async def watch_for_event_changes(bot):
     task_name = "watch_for_event_changes"
     
@@ -331,33 +451,22 @@ async def watch_for_event_changes(bot):
         try:
             today = get_today()
             monday = get_monday_of_week(today)
-            processed_tags = set()
 
-            # Process calendars in batches to avoid overloading
-            for tag, calendars in GROUPED_CALENDARS.items():
-                # Skip if we've already processed too many in this cycle
-                if len(processed_tags) >= 3:  # Process max 3 tags per cycle
-                    break
-                    
-                # Add small delay between calendar checks to avoid rate limiting
-                if processed_tags:
-                    await asyncio.sleep(2)
-                
-                earliest = today - timedelta(days=30)
-                latest = today + timedelta(days=90)
-                processed_tags.add(tag)
-
-                # Fetch and fingerprint all events in the date window
-                all_events = []
-                for meta in calendars:
-                    all_events += await _fetch_calendar_events_safe(meta, earliest, latest, context="change detection")
+            # Fetch the stalest tags with due sources, within this cycle's fetch and time budget
+            earliest = today - timedelta(days=30)
+            latest = today + timedelta(days=90)
+            cycle_tags = await _poll_stalest_tags(earliest, latest)
+
+            for tag, calendars in cycle_tags:
+                # Fingerprint all events in the date window, reusing the last fetch of sources not due
+                all_events = _merge_events([_last_source_events.get(m["id"]) for m in calendars])
                         
                 # Skip further processing if we couldn't fetch any events
                 if not all_events:
                     continue
                         
                 # Sort events reliably to ensure consistent fingerprinting
-                all_events.sort(key=lambda e: e["start"].get("dateTime", e["start"].get("date", "")))
+                all_events.sort(key=event_start_key)
 
                 # Compare with previous snapshot
                 key = f"{tag}_full"
@@ -534,6 +643,11 @@ async def post_todays_happenings(bot, include_greeting: bool = False):
         success_count = 0
         error_count = 0
 
+        # Fill the event cache for every tag's Google calendars in one batch
+        await _prefetch_google_safe(
+            [m for cals in GROUPED_CALENDARS.values() for m in cals], today, today, context="daily posts"
+        )
+
         # Post events for each tag
         for tag in GROUPED_CALENDARS:
             tag_count += 1
@@ -547,21 +661,11 @@ async def post_todays_happenings(bot, include_greeting: bool = False):
                 if tag_count > 1:
                     await asyncio.sleep(1)
                     
-                # Get events for greeting generation
-                for meta in GROUPED_CALENDARS[tag]:
-                    try:
-                        # Add timeout to prevent hanging (2 minutes max per calendar for daily events)
-                        events = await asyncio.wait_for(
-                            asyncio.to_thread(get_events, meta, today, today),
-                            timeout=120
-                        )
-                        # Ensure events is a list before extending (get_events should always return list, but this guards against None)
-                        if events:
-                            all_events_for_greeting += events
-                    except asyncio.TimeoutError:
-                        logger.warning(f"Timeout fetching greeting events for {meta.get('name', 'Unknown')}")
-                    except Exception as e:
-                        logger.warning(f"Error fetching greeting events for {meta.get('name', 'Unknown')}: {e}")
+                # Get events for greeting generation (2 minutes max per calendar, all at once)
+                if include_greeting:
+                    all_events_for_greeting += _merge_events(await _fetch_sources(
+                        GROUPED_CALENDARS[tag], today, today, context="greeting", timeout=120
+                    ))
             except Exception as e:
                 error_count += 1
                 logger.exception(f"Error posting events for tag {tag}: {e}")
@@ -659,60 +763,28 @@ async def initialize_event_snapshots():
         processed = 0
         failed = 0
 
-        # Process tags sequentially to avoid overloading APIs
+        # One batched round trip for all Google calendars across tags
+        failed_ids = await _prefetch_google_safe(
+            [m for cals in GROUPED_CALENDARS.values() for m in cals], earliest, latest, context="initialization"
+        )
+
+        # Fetch every calendar of every tag at once under the shared fan-out limits
+        all_calendars = [m for cals in GROUPED_CALENDARS.values() for m in cals]
+        results = iter(await _fetch_sources(
+            all_calendars, earliest, latest, context="initialization", skip_ids=failed_ids
+        ))
+
         for tag, calendars in GROUPED_CALENDARS.items():
             try:
-                # Add a delay between tag processing to avoid rate limits
-                if processed > 0:
-                    await asyncio.sleep(2)
-                    
-                # Gather events from all calendars for this tag
-                all_events = []
-                for meta in calendars:
-                    try:
-                        # Wrap event fetching with comprehensive error handling
-                        try:
-                            # Add timeout to prevent hanging during initialization (5 minutes max)
-                            events = await asyncio.wait_for(
-                                asyncio.to_thread(get_events, meta, earliest, latest),
-                                timeout=300
-                            )
-                            if events:
-                                all_events += events
-                                processed += 1
-                            else:
-                                logger.debug(f"No events returned from calendar {meta.get('name', 'Unknown')} during initialization")
-                                processed += 1  # Still count as processed
-                        except asyncio.TimeoutError:
-                            logger.warning(f"Timeout during initialization for calendar {meta.get('name', 'Unknown')}")
-                            failed += 1
-                        except asyncio.CancelledError:
-                            logger.info("Event fetching was cancelled during initialization")
-                            raise  # Re-raise cancellation
-                        except MemoryError:
-                            logger.error(f"Memory error during initialization for calendar {meta.get('name', 'Unknown')} - calendar may be too large")
-                            failed += 1
-                        except (TypeError, AttributeError, KeyError) as type_error:
-                            logger.error(f"Data type error during initialization for calendar {meta.get('name', 'Unknown')}: {type_error}")
-                            failed += 1
-                        except Exception as calendar_error:
-                            failed += 1
-                            logger.exception(f"Error fetching events for calendar {meta.get('name', 'Unknown')}: {calendar_error}")
-                        
-                        # Small delay between calendar fetches
-                        await asyncio.sleep(0.5)
-                        
-                    except KeyboardInterrupt:
-                        logger.info("Calendar initialization interrupted by user")
-                        raise
-                    except Exception as outer_error:
-                        failed += 1
-                        logger.exception(f"Outer error during initialization for calendar {meta.get('name', 'Unknown')}: {outer_error}")
-                
+                tag_results = [next(results) for _ in calendars]
+                processed += sum(1 for events in tag_results if events is not None)
+                failed += sum(1 for events in tag_results if events is None)
+                all_events = _merge_events(tag_results)
+
                 # Only save if we got events
                 if all_events:
                     # Sort before saving for consistent fingerprinting
-                    all_events.sort(key=lambda e: e["start"].get("dateTime", e["start"].get("date", "")))
+                    all_events.sort(key=event_start_key)
                     save_current_events_for_key(f"{tag}_full", all_events)
                     logger.debug(f"Initial snapshot saved for '{tag}' with {len(all_events)} events")
                 else:
@@ -746,16 +818,19 @@ async def verify_changes(tag: str, calendars: list, original_added: list, origin
         latest = today + timedelta(days=90)
         
         # Re-fetch current events
-        current_events = []
-        for meta in calendars:
-            current_events += await _fetch_calendar_events_safe(meta, earliest, latest, context="verification")
+        results = await _fetch_sources(calendars, earliest, latest, context="verification")
+        if any(events is None for events in results):
+            # A missing source would make its events look removed
+            logger.warning(f"Could not fetch every calendar during verification for tag '{tag}'")
+            return [], [], []
+        current_events = _merge_events(results)
         
         if not current_events:
             logger.warning(f"No events found during verification for tag '{tag}'")
             return [], [], []
             
         # Sort events reliably
-        current_events.sort(key=lambda e: e["start"].get("dateTime", e["start"].get("date", "")))
+        current_events.sort(key=event_start_key)
         
         # Get previous snapshot for comparison
         key = f"{tag}_full"
@@ -923,13 +998,14 @@ async def update_snapshot_after_verification(tag: str, calendars: list):
         today = get_today()
         earliest = today - timedelta(days=30)
         latest = today + timedelta(days=90)
-        all_events = []
-        
-        for meta in calendars:
-            all_events += await _fetch_calendar_events_safe(meta, earliest, latest, context="snapshot update")
+        results = await _fetch_sources(calendars, earliest, latest, context="snapshot update")
+        if any(events is None for events in results):
+            logger.warning(f"Keeping the previous snapshot for '{tag}': not every calendar could be fetched")
+            return
+        all_events = _merge_events(results)
         
         if all_events:
-            all_events.sort(key=lambda e: e["start"].get("dateTime", e["start"].get("date", "")))
+            all_events.sort(key=event_start_key)
             save_current_events_for_key(f"{tag}_full", all_events)
             logger.debug(f"Updated snapshot for '{tag}' after verification with {len(all_events)} events")
     except Exception as e:
@@ -996,6 +1072,9 @@ async def calendar_health_monitor(bot):
                 logger.error(f"Critical calendar health issues detected: {len(critical_alerts)} alerts")
                 for alert in critical_alerts:
                     logger.error(f"Critical alert: {alert['message']}")
+
+            # Persist the per-host transfer counters accumulated since the last run
+            await asyncio.to_thread(flush_host_profiles)
             
             # Update task health status
             update_task_health(task_name, True)
@@ -1005,6 +1084,29 @@ async def calendar_health_monitor(bot):
             update_task_health(task_name, False)
             await asyncio.sleep(5)
 
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🗂️ refresh_calendar_metadata_ahead                                 ║
+# ║ Re-probes calendar metadata that is close to expiring              ║
+# ╚════════════════════════════════════════════════════════════════════╝
+@tasks.loop(minutes=30)
+async def refresh_calendar_metadata_ahead(bot):
+    """Keep cached calendar names/validation fresh so restarts and renames stay cheap."""
+    task_name = "refresh_calendar_metadata_ahead"
+
+    async with TaskLock(task_name) as acquired:
+        if not acquired:
+            return
+
+        try:
+            refreshed = await refresh_calendar_metadata_async()
+            if refreshed:
+                logger.info(f"Refreshed metadata for {refreshed} calendar(s)")
+            update_task_health(task_name, True)
+
+        except Exception as e:
+            logger.exception(f"Error in {task_name}: {e}")
+            update_task_health(task_name, False)
+
 # ╔════════════════════════════════════════════════════════════════════╗
 # ║ 📊 get_pending_changes_status                                      ║
 # ║ Returns status information about pending change verifications      ║
@@ -1171,6 +1273,8 @@ async def check_reminders(bot):
 
             now = datetime.now(tz=get_local_timezone())
             today = now.date()
+            # Each subscribed tag is fetched once per pass, all of its sources at once
+            tag_events = {}
 
             for user_id_str, prefs in reminders.items():
                 if not prefs.get("enabled", True):
@@ -1183,35 +1287,31 @@ async def check_reminders(bot):
                     if tag not in GROUPED_CALENDARS:
                         continue
 
-                    for meta in GROUPED_CALENDARS[tag]:
-                        try:
-                            events = await asyncio.wait_for(
-                                asyncio.to_thread(get_events, meta, today, today),
-                                timeout=30,
-                            )
-                        except Exception:
+                    if tag not in tag_events:
+                        tag_events[tag] = _merge_events(await gather_events_async(
+                            GROUPED_CALENDARS[tag], today, today,
+                            fetch=lambda meta: asyncio.wait_for(get_events_async(meta, today, today), timeout=30),
+                        ))
+
+                    for ev in tag_events[tag]:
+                        start_str = ev.get("start", {}).get("dateTime", "")
+                        if not start_str or "T" not in start_str:
                             continue
 
-                        for ev in (events or []):
-                            start_str = ev.get("start", {}).get("dateTime", "")
-                            if not start_str or "T" not in start_str:
-                                continue
+                        ev_start = event_start(ev, get_local_timezone())
+                        if ev_start is None:
+                            continue
 
-                            from utils import parse_date_string
-                            ev_start = parse_date_string(start_str, get_local_timezone())
-                            if ev_start is None:
+                        delta = (ev_start - now).total_seconds() / 60
+                        if 0 < delta <= minutes_before:
+                            dedup = f"{user_id_str}:{ev.get('id', '')}:{today}"
+                            if dedup in _sent_reminders:
                                 continue
+                            _sent_reminders.add(dedup)
 
-                            delta = (ev_start - now).total_seconds() / 60
-                            if 0 < delta <= minutes_before:
-                                dedup = f"{user_id_str}:{ev.get('id', '')}:{today}"
-                                if dedup in _sent_reminders:
-                                    continue
-                                _sent_reminders.add(dedup)
-
-                                await _send_reminder_dm(
-                                    bot, int(user_id_str), ev, int(delta)
-                                )
+                            await _send_reminder_dm(
+                                bot, int(user_id_str), ev, int(delta)
+                            )
 
             # Prune old dedup keys daily
             today_str = str(today)
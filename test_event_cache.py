@@ -0,0 +1,180 @@
+"""
+Tests for the shared event cache in events.py.
+
+Covers TTL expiry, serving a narrower window from a cached wider one,
+size-bounded LRU eviction, invalidation, and get_events() only caching
+successful fetches.
+
+Uses pytest and imports directly from the source modules.
+"""
+import os
+import sys
+from datetime import date
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+from events import EventCache  # noqa: E402
+
+URL = "https://example.test/calendar.ics"
+
+
+def _ics_event(day: str, title: str = "Lesson") -> dict:
+    return {
+        "summary": title,
+        "start": {"dateTime": f"{day}T09:00:00+02:00"},
+        "end": {"dateTime": f"{day}T10:00:00+02:00"},
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(events.time, "monotonic", fake)
+    return fake
+
+
+class TestEventCache:
+
+    def test_exact_window_hit(self, clock):
+        cache = EventCache(ttl=60)
+        cache.put("ics", URL, date(2026, 1, 1), date(2026, 1, 31), [_ics_event("2026-01-05")])
+
+        result = cache.get("ics", URL, date(2026, 1, 1), date(2026, 1, 31))
+
+        assert len(result) == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_narrower_window_filtered_from_wider(self, clock):
+        cache = EventCache(ttl=60)
+        cache.put("ics", URL, date(2026, 1, 1), date(2026, 1, 31), [
+            _ics_event("2026-01-05", "Before"),
+            _ics_event("2026-01-10", "Inside"),
+            _ics_event("2026-01-20", "After"),
+        ])
+
+        result = cache.get("ics", URL, date(2026, 1, 10), date(2026, 1, 10))
+
+        assert [e["summary"] for e in result] == ["Inside"]
+
+    def test_wider_window_is_a_miss(self, clock):
+        cache = EventCache(ttl=60)
+        cache.put("ics", URL, date(2026, 1, 10), date(2026, 1, 10), [])
+
+        assert cache.get("ics", URL, date(2026, 1, 1), date(2026, 1, 31)) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_entries_expire_after_ttl(self, clock):
+        cache = EventCache(ttl=60)
+        cache.put("ics", URL, date(2026, 1, 1), date(2026, 1, 31), [])
+        clock.now += 61
+
+        assert cache.get("ics", URL, date(2026, 1, 1), date(2026, 1, 31)) is None
+        assert len(cache) == 0
+
+    def test_google_window_uses_overlap(self, clock):
+        cache = EventCache(ttl=60)
+        multi_day = {
+            "summary": "Conference",
+            "start": {"date": "2026-01-08"},
+            "end": {"date": "2026-01-12"},
+        }
+        cache.put("google", "cal", date(2026, 1, 1), date(2026, 1, 31), [multi_day])
+
+        assert len(cache.get("google", "cal", date(2026, 1, 10), date(2026, 1, 10))) == 1
+        assert cache.get("google", "cal", date(2026, 1, 12), date(2026, 1, 12)) == []
+
+    def test_lru_eviction_bounds_size(self, clock):
+        cache = EventCache(ttl=60, max_entries=2)
+        for i in range(3):
+            cache.put("ics", f"{URL}?{i}", date(2026, 1, 1), date(2026, 1, 31), [])
+
+        assert len(cache) == 2
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get("ics", f"{URL}?0", date(2026, 1, 1), date(2026, 1, 31)) is None
+
+    def test_returned_events_are_copies(self, clock):
+        cache = EventCache(ttl=60)
+        cache.put("ics", URL, date(2026, 1, 1), date(2026, 1, 31), [_ics_event("2026-01-05")])
+
+        cache.get("ics", URL, date(2026, 1, 1), date(2026, 1, 31))[0]["_search_tag"] = "T"
+
+        assert "_search_tag" not in cache.get("ics", URL, date(2026, 1, 1), date(2026, 1, 31))[0]
+
+    def test_invalidate_single_source(self, clock):
+        cache = EventCache(ttl=60)
+        cache.put("ics", URL, date(2026, 1, 1), date(2026, 1, 31), [])
+        cache.put("google", "cal", date(2026, 1, 1), date(2026, 1, 31), [])
+
+        assert cache.invalidate(URL) == 1
+        assert len(cache) == 1
+
+
+class TestGetEventsCaching:
+
+    META = {"type": "ics", "id": URL, "name": "Test"}
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch, clock):
+        monkeypatch.setattr(events, "_event_cache", EventCache(ttl=60))
+
+    def test_second_call_served_from_cache(self, monkeypatch):
+        calls = []
+
+        def fake_fetch(start, end, url):
+            calls.append(url)
+            return [_ics_event("2026-01-05")]
+
+        monkeypatch.setattr(events, "_fetch_ics_events", fake_fetch)
+
+        events.get_events(self.META, date(2026, 1, 1), date(2026, 1, 31))
+        result = events.get_events(self.META, date(2026, 1, 5), date(2026, 1, 5))
+
+        assert len(calls) == 1
+        assert len(result) == 1
+
+    def test_failed_fetch_not_cached(self, monkeypatch):
+        calls = []
+
+        def failing_fetch(start, end, url):
+            calls.append(url)
+            return None
+
+        monkeypatch.setattr(events, "_fetch_ics_events", failing_fetch)
+
+        assert events.get_events(self.META, date(2026, 1, 1), date(2026, 1, 31)) == []
+        assert events.get_events(self.META, date(2026, 1, 1), date(2026, 1, 31)) == []
+        assert len(calls) == 2
@@ -0,0 +1,183 @@
+"""
+Tests for the normalized Event model (event_model.py + its consumers).
+
+Covers parsing start/end into epoch times, offsets and the all-day flag,
+the read-only dict-compatible view, immutability and tagged copies, the
+cached fingerprint matching the dict-based one, JSON round-trips for
+snapshots, formatting and window filtering giving the same answers as for
+the original dicts, caches sharing Event instances, and the memory saved
+per event.
+
+Uses pytest and imports directly from the source modules.
+"""
+import json
+import os
+import pickle
+import sys
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+sys.modules.setdefault('googleapiclient.errors', MagicMock())
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+import utils  # noqa: E402
+from event_model import Event, copy_event, event_day, event_start_key, event_to_dict, to_event  # noqa: E402
+
+URL = "https://example.com/cal.ics"
+
+
+def _timed(summary="Standup", start="2026-03-02T09:30:00+01:00", end="2026-03-02T10:00:00+01:00", **extra):
+    return {"id": f"id-{summary}", "summary": summary, "start": {"dateTime": start},
+            "end": {"dateTime": end}, **extra}
+
+
+def _all_day(summary="Holiday", start="2026-03-02", end="2026-03-04"):
+    return {"id": f"id-{summary}", "summary": summary, "start": {"date": start}, "end": {"date": end}}
+
+
+def test_times_parsed_once_at_ingestion():
+    ev = Event.from_dict(_timed(location="Room 1"), source=URL)
+
+    assert ev.start_ts == datetime(2026, 3, 2, 8, 30, tzinfo=timezone.utc).timestamp()
+    assert ev.end_ts - ev.start_ts == 1800
+    assert ev.start_offset == 3600
+    assert ev.day == date(2026, 3, 2)
+    assert not ev.all_day
+    assert ev.source == URL
+
+    holiday = Event.from_dict(_all_day())
+    assert holiday.all_day
+    assert holiday.day == date(2026, 3, 2)
+    assert holiday.start_offset is None
+
+    broken = Event.from_dict(_timed(start="not a date"))
+    assert broken.start_ts is None and broken.start_raw == "not a date"
+
+
+def test_mapping_view_matches_original_dict():
+    raw = _timed(location="Room 1", original_summary="Daily standup (team)")
+    ev = to_event(raw)
+
+    assert ev == raw
+    assert ev["start"] == {"dateTime": "2026-03-02T09:30:00+01:00"}
+    assert ev.get("description") is None
+    assert "description" not in ev
+    assert event_to_dict(ev) == raw
+    assert to_event(_all_day())["end"] == {"date": "2026-03-04"}
+
+
+def test_events_are_immutable_and_tagged_by_copy():
+    ev = to_event(_timed())
+    with pytest.raises(TypeError):
+        ev["summary"] = "changed"
+    with pytest.raises(AttributeError):
+        ev.summary = "changed"
+
+    tagged = ev.with_tag("TEAM")
+    assert tagged.tag == "TEAM" and ev.tag is None
+    assert tagged.summary is ev.summary and tagged.start_ts == ev.start_ts
+
+
+def test_fingerprint_matches_dict_fingerprint():
+    raw = _timed(location="  Room   1 ", description="Agenda\n  items")
+    ev = to_event(raw)
+
+    assert ev.fingerprint == events.compute_event_fingerprint(raw)
+    assert events.compute_event_fingerprint(ev) == ev.fingerprint
+    assert events.compute_event_core_fingerprint(ev) == events.compute_event_core_fingerprint(raw)
+    assert to_event(_all_day()).fingerprint == events.compute_event_fingerprint(_all_day())
+
+
+def test_snapshot_and_pickle_round_trip():
+    ev = to_event(_timed(location="Room 1"), URL)
+
+    assert json.loads(json.dumps(event_to_dict(ev))) == ev
+    restored = pickle.loads(pickle.dumps(ev))
+    assert restored == ev and restored.source == URL and restored.start_ts == ev.start_ts
+
+
+def test_helpers_accept_events_and_dicts():
+    raw = _timed(start="2026-03-02T23:30:00-05:00", end="2026-03-03T00:30:00-05:00")
+    ev = to_event(raw)
+
+    assert event_start_key(ev) == event_start_key(raw)
+    assert event_day(ev) == event_day(raw) == date(2026, 3, 2)
+    assert utils.format_event(ev) == utils.format_event(raw)
+    assert utils.format_event(to_event(_all_day())) == utils.format_event(_all_day())
+    tz = utils.get_local_timezone()
+    assert utils.event_start(ev, tz) == utils.parse_date_string(raw["start"]["dateTime"], tz)
+    naive = _timed(start="2026-03-02T09:30:00", end="2026-03-02T10:00:00")
+    assert utils.format_event(to_event(naive)) == utils.format_event(naive)
+    reference = date(2026, 3, 4)
+    assert utils.is_in_current_week(ev, reference) == utils.is_in_current_week(raw, reference)
+
+
+@pytest.mark.parametrize("source_type", ["google", "ics"])
+def test_window_filter_agrees_with_dict_path(source_type):
+    samples = [
+        _timed(start="2026-03-01T23:30:00Z", end="2026-03-02T00:30:00Z"),
+        _timed(start="2026-03-08T23:59:30Z", end="2026-03-09T01:00:00Z"),
+        _timed(start="2026-03-02T00:30:00+02:00", end="2026-03-02T01:00:00+02:00"),
+        _all_day(start="2026-02-28", end="2026-03-02"),
+        _all_day(start="2026-03-01", end="2026-03-02"),
+        _all_day(start="2026-03-09", end="2026-03-10"),
+    ]
+    start, end = date(2026, 3, 2), date(2026, 3, 8)
+    for raw in samples:
+        assert (events._event_in_window(to_event(raw), source_type, start, end)
+                == events._event_in_window(raw, source_type, start, end)), raw
+
+
+def test_caches_share_events_but_copy_dicts():
+    cache = events.EventCache(ttl=60)
+    ev = to_event(_timed())
+    cache.put("ics", URL, date(2026, 3, 1), date(2026, 3, 31), [ev, _all_day()])
+
+    first, second = cache.get("ics", URL, date(2026, 3, 1), date(2026, 3, 31))
+    assert first is ev
+    assert second == _all_day() and second is not cache.get("ics", URL, date(2026, 3, 1), date(2026, 3, 31))[1]
+    assert copy_event(ev) is ev
+
+
+def test_events_normalized_on_fetch(monkeypatch):
+    monkeypatch.setattr(events, "_event_cache", events.EventCache(ttl=60))
+    stored = events._store_fetched("ics", URL, date(2026, 3, 1), date(2026, 3, 31), [_timed()])
+
+    assert isinstance(stored[0], Event) and stored[0].source == URL
+    assert events._event_cache.get("ics", URL, date(2026, 3, 1), date(2026, 3, 31))[0] is stored[0]
+
+
+def test_event_smaller_than_nested_dict():
+    raws = [_timed(summary=f"Lecture {i % 20}", location="Hall A",
+                   start=(datetime(2026, 3, 2, 9) + timedelta(hours=i)).isoformat() + "+01:00",
+                   end=(datetime(2026, 3, 2, 10) + timedelta(hours=i)).isoformat() + "+01:00")
+            for i in range(500)]
+
+    def allocated(build):
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            kept = build()
+            return tracemalloc.get_traced_memory()[0] - before, kept
+        finally:
+            tracemalloc.stop()
+
+    as_dicts, _ = allocated(lambda: [json.loads(json.dumps(r)) for r in raws])
+    as_events, _ = allocated(lambda: [to_event(json.loads(json.dumps(r))) for r in raws])
+    assert as_events < as_dicts
@@ -0,0 +1,245 @@
+"""
+Tests for the bounded-concurrency source fan-out (fetch_fanout.py + events.py).
+
+Covers the global and per-host concurrency caps, results coming back in
+input order whatever order the fetches finish in, one failing source not
+affecting the others, cancellation reaching every running fetch, events.gather_events_async()
+fetching a tag's sources concurrently, and the daily greeting and reminder
+tasks fetching their sources that way too.
+
+Uses pytest and imports directly from the source modules.
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+import tasks  # noqa: E402
+from fetch_fanout import GOOGLE_HOST, FetchFanout, source_host  # noqa: E402
+
+
+def _ics(host, n):
+    return {"type": "ics", "id": f"https://{host}/{n}.ics", "name": f"{host} {n}"}
+
+
+class _Probe:
+    """Fake fetch that records how many calls run at once, overall and per host."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.active = {}
+        self.peak = {}
+        self.total = 0
+        self.peak_total = 0
+
+    async def __call__(self, meta):
+        host = source_host(meta)
+        self.active[host] = self.active.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        self.total += 1
+        self.peak_total = max(self.peak_total, self.total)
+        try:
+            await asyncio.sleep(self.delays.get(meta["id"], 0.02))
+            return [meta["name"]]
+        finally:
+            self.active[host] -= 1
+            self.total -= 1
+
+
+def test_caps_global_and_per_host_concurrency():
+    sources = [_ics("a.test", i) for i in range(6)] + [_ics("b.test", i) for i in range(6)]
+    probe = _Probe()
+    fanout = FetchFanout(concurrency=3, per_host=2)
+
+    asyncio.run(fanout.gather(sources, probe))
+
+    assert probe.peak_total == 3
+    assert max(probe.peak.values()) == 2
+    assert fanout.get_stats()["peak"] == 3
+    assert fanout.get_stats()["running"] == 0
+
+
+def test_host_limits_bypass_global_cap():
+    google = [{"type": "google", "id": f"cal{i}@group.calendar.google.com", "name": f"G{i}"} for i in range(10)]
+    sources = google + [_ics("a.test", i) for i in range(4)]
+    probe = _Probe()
+    fanout = FetchFanout(concurrency=2, per_host=2, host_limits={GOOGLE_HOST: 6})
+
+    asyncio.run(fanout.gather(sources, probe))
+
+    assert probe.peak[GOOGLE_HOST] == 6
+    assert probe.peak["a.test"] == 2
+    assert probe.peak_total == 8
+
+
+def test_runs_sources_concurrently():
+    sources = [_ics(f"host{i}.test", i) for i in range(8)]
+    fanout = FetchFanout(concurrency=8, per_host=2)
+
+    async def main():
+        started = asyncio.get_running_loop().time()
+        await fanout.gather(sources, _Probe({s["id"]: 0.1 for s in sources}))
+        return asyncio.get_running_loop().time() - started
+
+    assert asyncio.run(main()) < 0.4
+
+
+def test_results_keep_input_order():
+    sources = [_ics("a.test", i) for i in range(5)]
+    # The first source finishes last
+    delays = {s["id"]: 0.05 - i * 0.01 for i, s in enumerate(sources)}
+
+    results = asyncio.run(FetchFanout().gather(sources, _Probe(delays)))
+
+    assert results == [[s["name"]] for s in sources]
+
+
+def test_failing_source_is_isolated():
+    sources = [_ics("a.test", i) for i in range(3)]
+
+    async def fetch(meta):
+        if meta is sources[1]:
+            raise ValueError("broken feed")
+        return [meta["name"]]
+
+    fanout = FetchFanout()
+    results = asyncio.run(fanout.gather(sources, fetch))
+
+    assert results == [[sources[0]["name"]], None, [sources[2]["name"]]]
+    assert fanout.get_stats()["failures"] == 1
+
+
+def test_cancelling_the_caller_cancels_every_fetch():
+    sources = [_ics("a.test", 0), _ics("b.test", 0)]
+    cancelled = []
+
+    async def fetch(meta):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(meta["id"])
+            raise
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(FetchFanout().gather(sources, fetch), timeout=0.05)
+
+    asyncio.run(main())
+    assert sorted(cancelled) == sorted(s["id"] for s in sources)
+
+
+def test_source_host_groups_google_calendars():
+    assert source_host({"type": "google", "id": "a@group.calendar.google.com"}) == \
+        source_host({"type": "google", "id": "b@group.calendar.google.com"})
+    assert source_host(_ics("Feeds.Example.test", 1)) == "feeds.example.test"
+
+
+def test_gather_events_async_fetches_each_source(monkeypatch):
+    sources = [_ics("a.test", 0), _ics("b.test", 0), _ics("c.test", 0)]
+    monkeypatch.setattr(events, "_fetch_fanout", FetchFanout(concurrency=3, per_host=1))
+    running = []
+
+    async def fake_get_events_async(meta, start, end):
+        running.append(meta["id"])
+        await asyncio.sleep(0.02)
+        if meta is sources[2]:
+            raise RuntimeError("boom")
+        return [{"summary": meta["name"], "range": (start, end)}]
+
+    monkeypatch.setattr(events, "get_events_async", fake_get_events_async)
+
+    results = asyncio.run(events.gather_events_async(sources, "mon", "sun"))
+
+    assert [r and r[0]["summary"] for r in results] == [sources[0]["name"], sources[1]["name"], None]
+    assert results[0][0]["range"] == ("mon", "sun")
+    assert events.get_metrics_summary()["fanout_sources"] == 3
+
+
+@pytest.fixture
+def today_sources(monkeypatch):
+    grouped = {"A": [_ics("a.test", 0), _ics("b.test", 0), _ics("c.test", 0)], "B": [_ics("d.test", 0)]}
+    soon = (datetime.now(tz=tasks.get_local_timezone()) + timedelta(minutes=10)).isoformat()
+    probe = _Probe(delays={meta["id"]: 0.05 for cals in grouped.values() for meta in cals})
+    calls = []
+
+    async def fake_get_events_async(meta, start, end, return_none_on_failure=False):
+        calls.append(meta["id"])
+        await probe(meta)
+        return [{"id": meta["id"], "summary": meta["name"], "start": {"dateTime": soon}}]
+
+    monkeypatch.setattr(tasks, "GROUPED_CALENDARS", grouped)
+    monkeypatch.setattr(tasks, "get_events_async", fake_get_events_async)
+    monkeypatch.setattr(events, "_fetch_fanout", FetchFanout(concurrency=8, per_host=4))
+    return grouped, probe, calls
+
+
+def test_greeting_fetches_a_tags_sources_at_once(today_sources, monkeypatch):
+    grouped, probe, _ = today_sources
+    monkeypatch.setitem(grouped, "B", [])
+    titles = []
+
+    async def posted(bot, tag, day):
+        return True
+
+    async def no_prefetch(calendars, start, end, context=""):
+        return set()
+
+    def fake_greeting(event_titles, user_names):
+        titles.extend(event_titles)
+        return None, "Herald"
+
+    monkeypatch.setattr(tasks, "post_tagged_events", posted)
+    monkeypatch.setattr(tasks, "_prefetch_google_safe", no_prefetch)
+    monkeypatch.setattr(tasks, "generate_greeting", fake_greeting)
+    monkeypatch.setattr(tasks, "AI_TOGGLE", True)
+
+    asyncio.run(tasks.post_todays_happenings(MagicMock(guilds=[]), include_greeting=True))
+
+    assert probe.peak_total == 3
+    assert titles == [meta["name"] for meta in grouped["A"]]
+
+
+def test_reminders_fetch_each_tag_once_concurrently(today_sources, monkeypatch):
+    grouped, probe, calls = today_sources
+    sent = []
+
+    async def fake_dm(bot, user_id, event, minutes_left):
+        sent.append((user_id, event["id"]))
+
+    monkeypatch.setattr(tasks, "load_reminders", lambda: {"1": {"tags": ["A", "B"]}, "2": {"tags": ["A"]}})
+    monkeypatch.setattr(tasks, "_send_reminder_dm", fake_dm)
+    monkeypatch.setattr(tasks, "_sent_reminders", set())
+
+    asyncio.run(tasks.check_reminders.coro(MagicMock()))
+
+    assert probe.peak_total == 3
+    assert sorted(calls) == sorted(meta["id"] for cals in grouped.values() for meta in cals)
+    assert len(sent) == 7 and {user for user, _ in sent} == {1, 2}
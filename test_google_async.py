@@ -0,0 +1,279 @@
+"""
+Tests for the asyncio-native Google Calendar client (google_async.py + events.py).
+
+Runs a local HTTP server standing in for both the OAuth token endpoint and
+the Calendar API, and covers minting and caching the service-account token,
+refreshing it ahead of expiry in the background, re-authorizing after a
+401, awaited retries on server errors, rate limits draining the quota, and
+events.get_events_async listing Google calendars (paging, 410 resync) on
+the async client.
+
+Uses pytest and imports directly from the source modules.
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import aiohttp
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+sys.modules.setdefault('googleapiclient.errors', MagicMock())
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+import google_async  # noqa: E402
+from google_async import AsyncGoogleCalendar, GoogleApiError, ServiceAccountTokenSource  # noqa: E402
+from google_sync import GoogleSyncStore  # noqa: E402
+from quota_governor import QuotaGovernor  # noqa: E402
+
+START, END = date(2025, 1, 6), date(2025, 1, 12)
+
+
+class _Signer:
+    key_id = None
+
+    def sign(self, message):
+        return b"signature"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode())
+        server = self.server
+        server.token_requests.append(form)
+        server.minted += 1
+        self._reply(200, {"access_token": f"token-{server.minted}", "expires_in": server.expires_in})
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        server.api_requests.append((parts.path, parse_qs(parts.query), self.headers["Authorization"]))
+        status, payload, headers = server.responses.pop(0) if server.responses else (200, {"items": []}, None)
+        self._reply(status, payload, headers)
+
+
+@pytest.fixture
+def google_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.token_requests = []
+    server.api_requests = []
+    server.responses = []
+    server.minted = 0
+    server.expires_in = 3600
+    server.handle_error = lambda request, address: None  # clients dropping keep-alive sockets
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setattr(google_async, "API_BASE", base + "/calendar/v3")
+    server.info = {"client_email": "bot@project.iam.gserviceaccount.com", "token_uri": base + "/token"}
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, quota=None):
+    tokens = ServiceAccountTokenSource(server.info, events.SCOPES, signer=_Signer())
+    quota = quota or QuotaGovernor(project_per_minute=60000, user_per_minute=6000)
+
+    async def session_factory():
+        return session_factory.session
+
+    client = AsyncGoogleCalendar(tokens, quota, session_factory, max_backoff=0.01)
+    return client, session_factory
+
+
+def _run(client, factory, coro_fn):
+    async def main():
+        async with aiohttp.ClientSession() as session:
+            factory.session = session
+            return await coro_fn()
+    return asyncio.run(main())
+
+
+def test_token_is_minted_once_and_reused(google_server):
+    client, factory = _client(google_server)
+
+    async def calls():
+        return [await client.list_events("team@group.calendar.google.com", maxResults=5, singleEvents=True)
+                for _ in range(3)]
+
+    pages = _run(client, factory, calls)
+
+    assert pages == [{"items": []}] * 3
+    assert len(google_server.token_requests) == 1
+    form = google_server.token_requests[0]
+    assert form["grant_type"] == ["urn:ietf:params:oauth:grant-type:jwt-bearer"]
+    assert form["assertion"][0].count(".") == 2
+    path, query, auth = google_server.api_requests[0]
+    assert unquote(path) == "/calendar/v3/calendars/team@group.calendar.google.com/events"
+    assert query == {"maxResults": ["5"], "singleEvents": ["true"]}
+    assert auth == "Bearer token-1"
+
+
+def test_token_refreshed_ahead_of_expiry_in_background(google_server):
+    google_server.expires_in = 200  # inside REFRESH_MARGIN as soon as it is minted
+    client, factory = _client(google_server)
+
+    async def calls():
+        await client.list_events("cal")
+        await client.list_events("cal")  # still uses token-1, starts a refresh
+        await asyncio.sleep(0.2)
+        await client.list_events("cal")
+
+    _run(client, factory, calls)
+
+    assert [a for _, _, a in google_server.api_requests] == ["Bearer token-1", "Bearer token-1", "Bearer token-2"]
+
+
+def test_unauthorized_refreshes_token_once(google_server):
+    google_server.responses = [(401, {"error": "invalid_credentials"}, None)]
+    client, factory = _client(google_server)
+
+    page = _run(client, factory, lambda: client.list_events("cal"))
+
+    assert page == {"items": []}
+    assert [a for _, _, a in google_server.api_requests] == ["Bearer token-1", "Bearer token-2"]
+
+
+def test_server_errors_retried_without_blocking_loop(google_server):
+    google_server.responses = [(503, {}, None), (500, {}, None), (200, {"items": [{"id": "e1"}]}, None)]
+    client, factory = _client(google_server)
+    ticks = []
+
+    async def calls():
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0.001)
+        task = asyncio.create_task(ticker())
+        try:
+            return await client.list_events("cal")
+        finally:
+            task.cancel()
+
+    assert _run(client, factory, calls) == {"items": [{"id": "e1"}]}
+    assert len(google_server.api_requests) == 3
+    assert ticks  # the loop kept running during back-offs
+
+
+def test_rate_limit_drains_quota_and_client_errors_raise(google_server):
+    quota = QuotaGovernor(project_per_minute=60000, user_per_minute=6000, background_reserve=0)
+    google_server.responses = [
+        (429, {"error": "rateLimitExceeded"}, {"Retry-After": "0"}),
+        (200, {"items": []}, None),
+        (404, {"error": "notFound"}, None),
+    ]
+    client, factory = _client(google_server, quota)
+
+    async def calls():
+        page = await client.list_events("cal")
+        with pytest.raises(GoogleApiError) as err:
+            await client.list_events("missing")
+        return page, err.value.status
+
+    assert _run(client, factory, calls) == ({"items": []}, 404)
+    assert quota.get_stats()["throttles"] == 1
+    assert quota.get_stats()["granted_background"] == 3
+
+
+class _FakeClient:
+    """Stands in for AsyncGoogleCalendar at the events level."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    async def list_events(self, calendar_id, page_token=None, **params):
+        self.calls.append((page_token, params))
+        page = self.pages.pop(0)
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+
+def _event(eid, day):
+    return {"id": eid, "summary": eid, "start": {"dateTime": f"2025-01-{day:02d}T09:00:00Z"},
+            "end": {"dateTime": f"2025-01-{day:02d}T10:00:00Z"}}
+
+
+@pytest.fixture
+def async_events(monkeypatch):
+    monkeypatch.setattr(events, "_google_sync", GoogleSyncStore())
+    monkeypatch.setattr(events, "GOOGLE_INCREMENTAL_SYNC", True)
+    monkeypatch.setattr(events, "simplify_event_title", lambda title: title)
+    events._event_cache.invalidate()
+    events._calendar_breakers.record_success("cal@test")
+
+    def install(pages):
+        client = _FakeClient(pages)
+        monkeypatch.setattr(events, "_google_async", client)
+        return client
+    return install
+
+
+def test_get_events_async_pages_through_google_listing(async_events):
+    client = async_events([
+        {"items": [_event("a", 7)], "nextPageToken": "p2"},
+        {"items": [_event("b", 8)], "nextSyncToken": "sync-1"},
+    ])
+    meta = {"type": "google", "id": "cal@test", "name": "Team"}
+
+    result = asyncio.run(events.get_events_async(meta, START, END))
+
+    assert [e["id"] for e in result] == ["a", "b"]
+    assert [token for token, _ in client.calls] == [None, "p2"]
+    assert events._google_sync.sync_token("cal@test") == "sync-1"
+
+
+def test_get_events_async_resyncs_after_gone(async_events):
+    async_events([
+        {"items": [_event("a", 7)], "nextSyncToken": "sync-1"},
+    ])
+    meta = {"type": "google", "id": "cal@test", "name": "Team"}
+    asyncio.run(events.get_events_async(meta, START, END))
+    events._event_cache.invalidate()
+
+    client = async_events([
+        GoogleApiError(410, "sync token expired"),
+        {"items": [_event("c", 9)], "nextSyncToken": "sync-2"},
+    ])
+    result = asyncio.run(events.get_events_async(meta, START, END))
+
+    assert [e["id"] for e in result] == ["c"]
+    assert "syncToken" in client.calls[0][1]
+    assert "syncToken" not in client.calls[1][1]
+    assert events._google_sync.sync_token("cal@test") == "sync-2"
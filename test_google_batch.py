@@ -0,0 +1,184 @@
+"""
+Tests for batched Google API requests in events.py.
+
+Uses a stub service whose batch object answers each queued request from a
+table, so the per-item mapping can be checked: successful listings land in
+the event cache, 403/404 items trip that calendar's circuit breaker, other
+item errors are left for a direct fetch, and calendar metadata is loaded
+with one insert batch plus one get batch.
+
+Uses pytest and imports directly from the source modules.
+"""
+import os
+import sys
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+from google_sync import GoogleSyncStore  # noqa: E402
+from metadata_cache import CalendarMetadataCache  # noqa: E402
+
+TODAY = date.today()
+START, END = TODAY, TODAY + timedelta(days=7)
+
+
+def _event(event_id):
+    day = (TODAY + timedelta(days=1)).isoformat()
+    return {"id": event_id, "summary": event_id, "start": {"dateTime": f"{day}T09:00:00Z"},
+            "end": {"dateTime": f"{day}T10:00:00Z"}}
+
+
+class StubRequest:
+    def __init__(self, key, answers):
+        self.key = key
+        self.answers = answers
+
+    def execute(self):
+        answer = self.answers[self.key]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+class StubBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.items = []
+
+    def add(self, request, request_id):
+        self.items.append((request_id, request))
+
+    def execute(self):
+        self.service.batches.append([r.key for _, r in self.items])
+        for request_id, request in self.items:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
+class StubService:
+    """Answers events().list / calendarList() calls keyed by (method, calendar)."""
+
+    def __init__(self):
+        self.answers = {}
+        self.batches = []
+        self.direct = []
+
+    def new_batch_http_request(self, callback):
+        return StubBatch(self, callback)
+
+    def events(self):
+        return SimpleNamespace(list=lambda calendarId, **params: StubRequest(("list", calendarId), self.answers))
+
+    def calendarList(self):
+        return SimpleNamespace(
+            insert=lambda body: StubRequest(("insert", body["id"]), self.answers),
+            get=lambda calendarId: StubRequest(("get", calendarId), self.answers),
+        )
+
+
+def _http_error(status):
+    return events.HttpError(SimpleNamespace(status=status), b"")
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    stub = StubService()
+    monkeypatch.setattr(events, "service", stub)
+    monkeypatch.setattr(events, "_google_sync", GoogleSyncStore())
+    monkeypatch.setattr(events, "simplify_event_title", lambda title: title)
+    events.invalidate_event_cache()
+    monkeypatch.setattr(events, "_calendar_metadata_cache", CalendarMetadataCache(str(tmp_path / "meta.json")))
+    for cid in ("a", "b", "c"):
+        events._calendar_breakers.record_success(cid)
+    yield stub
+    events.invalidate_event_cache()
+
+
+def _meta(cid):
+    return {"type": "google", "id": cid, "name": cid}
+
+
+def test_prefetch_lists_all_calendars_in_one_batch(service, monkeypatch):
+    service.answers = {
+        ("list", "a"): {"items": [_event("a1")], "nextSyncToken": "ta"},
+        ("list", "b"): {"items": [_event("b1")], "nextSyncToken": "tb"},
+    }
+
+    failed = events.prefetch_google_events([_meta("a"), _meta("b")], START, END)
+
+    assert failed == set()
+    assert service.batches == [[("list", "a"), ("list", "b")]]
+    monkeypatch.setattr(events, "_fetch_google_events", lambda *a: pytest.fail("should be cached"))
+    assert [e["id"] for e in events.get_events(_meta("a"), START, END)] == ["a1"]
+    assert [e["id"] for e in events.get_events(_meta("b"), START, END)] == ["b1"]
+
+
+def test_prefetch_maps_item_errors(service):
+    service.answers = {
+        ("list", "a"): {"items": [_event("a1")], "nextSyncToken": "ta"},
+        ("list", "b"): _http_error(404),
+        ("list", "c"): _http_error(500),
+    }
+
+    failed = events.prefetch_google_events([_meta("a"), _meta("b"), _meta("c")], START, END)
+
+    assert failed == {"b"}
+    assert events._calendar_breakers.get_failure_info("b")["count"] == 1
+    assert events._calendar_breakers.get_failure_info("c") is None
+    assert events._event_cache.covers("google", "a", START, END)
+    assert not events._event_cache.covers("google", "c", START, END)
+    for cid in ("a", "b", "c"):
+        events._calendar_breakers.record_success(cid)
+
+
+def test_prefetch_skips_cached_and_single_calendars(service):
+    events._event_cache.put("google", "a", START, END, [])
+
+    assert events.prefetch_google_events([_meta("a"), _meta("b")], START, END) == set()
+    assert service.batches == []
+
+
+def test_metadata_loaded_with_two_batches(service):
+    service.answers = {
+        ("insert", "a"): Exception("Already Exists"),
+        ("insert", "b"): {"id": "b"},
+        ("get", "a"): {"summary": "Team A", "timeZone": "Europe/Helsinki"},
+        ("get", "b"): _http_error(404),
+    }
+
+    meta = events.fetch_google_calendar_metadata_batch(["a", "b", "a"])
+
+    assert service.batches == [[("insert", "a"), ("insert", "b")], [("get", "a"), ("get", "b")]]
+    assert meta["a"]["name"] == "Team A" and not meta["a"].get("error")
+    assert meta["b"]["error"] is True
+    assert events._calendar_metadata_cache["google_a"] is meta["a"]
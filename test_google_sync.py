@@ -0,0 +1,227 @@
+"""
+Tests for incremental Google Calendar sync (google_sync.py + events.py).
+
+Covers the first poll doing a full sync and keeping the nextSyncToken,
+later polls sending only the token and merging changes/cancellations,
+exact deltas, a 410 Gone forcing a full resync, windows outside the synced
+horizon, pagination up to the page that carries the token, and the
+field-trimmed, page-sized listing requests.
+
+Uses pytest and imports directly from the source modules.
+"""
+import os
+import sys
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+from google_sync import GoogleSyncStore  # noqa: E402
+
+CAL = "team@group.calendar.google.com"
+TODAY = date.today()
+
+
+def _event(event_id, day_offset=1, summary="Standup", status="confirmed"):
+    day = (TODAY + timedelta(days=day_offset)).isoformat()
+    return {
+        "id": event_id,
+        "status": status,
+        "summary": summary,
+        "start": {"dateTime": f"{day}T09:00:00Z"},
+        "end": {"dateTime": f"{day}T09:30:00Z"},
+    }
+
+
+class FakeEventsApi:
+    """Records events().list() params and replays queued responses."""
+
+    def __init__(self):
+        self.calls = []
+        self.responses = []
+
+    def events(self):
+        return self
+
+    def list(self, **params):
+        self.calls.append(params)
+        response = self.responses.pop(0)
+        return SimpleNamespace(execute=lambda: _raise_or_return(response))
+
+
+def _raise_or_return(response):
+    if isinstance(response, Exception):
+        raise response
+    return response
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake = FakeEventsApi()
+    store = GoogleSyncStore()
+    fake.deltas = []
+
+    def recording(method):
+        def wrapper(*args, **kwargs):
+            delta = method(*args, **kwargs)
+            fake.deltas.append(delta)
+            return delta
+        return wrapper
+
+    # Keep the delta each merge returns (the fetch path only logs it)
+    monkeypatch.setattr(store, "replace", recording(store.replace))
+    monkeypatch.setattr(store, "apply_changes", recording(store.apply_changes))
+    monkeypatch.setattr(events, "service", fake)
+    monkeypatch.setattr(events, "_google_sync", store)
+    monkeypatch.setattr(events, "GOOGLE_INCREMENTAL_SYNC", True)
+    monkeypatch.setattr(events, "simplify_event_title", lambda title: title)
+    events._calendar_breakers.record_success(CAL)
+    return fake
+
+
+def _fetch(start_offset=0, end_offset=7):
+    return events._fetch_google_events(
+        TODAY + timedelta(days=start_offset), TODAY + timedelta(days=end_offset), CAL
+    )
+
+
+def test_first_poll_full_sync_then_incremental(api):
+    api.responses = [
+        {"items": [_event("a"), _event("b", 3)], "nextSyncToken": "tok1"},
+        {"items": [_event("c", 2)], "nextSyncToken": "tok2"},
+    ]
+
+    first = _fetch()
+    second = _fetch()
+
+    full, incremental = api.calls
+    assert "timeMin" in full and "timeMax" in full and "orderBy" not in full
+    assert incremental["syncToken"] == "tok1"
+    assert "timeMin" not in incremental and "timeMax" not in incremental
+    assert [e["id"] for e in first] == ["a", "b"]
+    assert [e["id"] for e in second] == ["a", "c", "b"]
+    assert api.deltas[-1] == {"added": ["c"], "updated": [], "removed": []}
+
+
+def test_incremental_applies_updates_and_cancellations(api):
+    api.responses = [
+        {"items": [_event("a"), _event("b", 3)], "nextSyncToken": "tok1"},
+        {"items": [_event("a", summary="Retro"), {"id": "b", "status": "cancelled"}],
+         "nextSyncToken": "tok2"},
+    ]
+
+    _fetch()
+    result = _fetch()
+
+    assert [(e["id"], e["summary"]) for e in result] == [("a", "Retro")]
+    assert api.deltas[-1] == {"added": [], "updated": ["a"], "removed": ["b"]}
+
+
+def test_gone_triggers_full_resync(api):
+    api.responses = [
+        {"items": [_event("a")], "nextSyncToken": "tok1"},
+        events.HttpError(SimpleNamespace(status=410), b"Gone"),
+        {"items": [_event("z", 2)], "nextSyncToken": "tok9"},
+    ]
+
+    _fetch()
+    result = _fetch()
+
+    assert api.calls[1].get("syncToken") == "tok1"
+    assert "syncToken" not in api.calls[2] and "timeMin" in api.calls[2]
+    assert [e["id"] for e in result] == ["z"]
+    assert api.deltas[-1] == {"added": ["z"], "updated": [], "removed": ["a"]}
+
+
+def test_window_outside_horizon_forces_full_sync(api):
+    api.responses = [
+        {"items": [_event("a")], "nextSyncToken": "tok1"},
+        {"items": [_event("far", 400)], "nextSyncToken": "tok2"},
+    ]
+
+    _fetch()
+    result = _fetch(395, 405)
+
+    assert "timeMin" in api.calls[1]
+    assert [e["id"] for e in result] == ["far"]
+
+
+def test_pages_followed_until_sync_token(api):
+    api.responses = [
+        {"items": [_event("a")], "nextPageToken": "p2"},
+        {"items": [_event("b", 2)], "nextSyncToken": "tok1"},
+        {"items": [], "nextSyncToken": "tok2"},
+    ]
+
+    assert [e["id"] for e in _fetch()] == ["a", "b"]
+    assert api.calls[1]["pageToken"] == "p2"
+    _fetch()
+    assert api.calls[2]["syncToken"] == "tok1"
+
+
+def test_listing_requests_trimmed_fields_and_page_size(api, monkeypatch):
+    monkeypatch.setattr(events, "GOOGLE_EVENTS_PAGE_SIZE", 500)
+    api.responses = [{"items": [], "nextSyncToken": "tok1"}, {"items": [], "nextSyncToken": "tok2"}]
+
+    _fetch()
+    _fetch()
+
+    for call in api.calls:
+        assert call["maxResults"] == 500
+        assert call["fields"].startswith("nextPageToken,nextSyncToken,items(")
+        assert "description" in call["fields"] and "attendees" not in call["fields"]
+
+
+def test_window_listing_follows_all_pages(api, monkeypatch):
+    monkeypatch.setattr(events, "GOOGLE_INCREMENTAL_SYNC", False)
+    api.responses = [
+        {"items": [_event(f"p1-{i}") for i in range(250)], "nextPageToken": "p2"},
+        {"items": [_event("p2-0")]},
+    ]
+
+    result = _fetch()
+
+    assert len(result) == 251
+    assert api.calls[0]["orderBy"] == "startTime"
+    assert api.calls[1]["pageToken"] == "p2"
+
+
+def test_page_iterator_is_lazy(api):
+    api.responses = [
+        {"items": [_event("a")], "nextPageToken": "p2"},
+        {"items": [_event("b")]},
+    ]
+
+    pages = events.iter_google_event_pages(CAL, singleEvents=True)
+    first = next(pages)
+
+    assert [e["id"] for e in first["items"]] == ["a"]
+    assert len(api.calls) == 1
+    assert [e["id"] for e in next(pages)["items"]] == ["b"]
+    assert len(api.calls) == 2
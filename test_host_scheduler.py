@@ -0,0 +1,222 @@
+"""
+Tests for per-host fetch politeness (host_scheduler.py + events.py).
+
+Covers the per-host concurrency cap (other hosts unaffected) on both the
+thread and asyncio paths, minimum spacing between request starts,
+Retry-After parsing and deferral, refusing to wait out long deferrals,
+and the ICS fetch honouring Retry-After on 429 instead of tripping the
+circuit breaker.
+
+Uses pytest and imports directly from the source modules.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import requests  # noqa: E402
+import http_pool  # noqa: E402
+import events  # noqa: E402
+from feed_cache import FeedValidatorCache  # noqa: E402
+from host_profiles import HostProfileStore  # noqa: E402
+from host_scheduler import HostDeferred, HostScheduler, parse_retry_after  # noqa: E402
+
+URL_A = "https://feeds.example.test/a.ics"
+URL_B = "https://feeds.example.test/b.ics"
+OTHER = "https://other.example.test/c.ics"
+BODY = (
+    b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nBEGIN:VEVENT\r\nSUMMARY:Lesson\r\n"
+    b"DTSTART:20250102T090000Z\r\nDTEND:20250102T100000Z\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+)
+
+
+def _run_concurrently(scheduler, urls, hold=0.1):
+    peak = {}
+    active = {}
+    lock = threading.Lock()
+
+    def worker(url):
+        host = scheduler.host_key(url)
+        with scheduler.slot(url):
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(hold)
+            with lock:
+                active[host] -= 1
+
+    threads = [threading.Thread(target=worker, args=(u,)) for u in urls]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return peak
+
+
+def test_caps_concurrency_per_host_only():
+    scheduler = HostScheduler(max_per_host=2, min_interval=0)
+
+    peak = _run_concurrently(scheduler, [URL_A, URL_B] * 3 + [OTHER] * 3)
+
+    assert peak == {"feeds.example.test": 2, "other.example.test": 2}
+    assert scheduler.get_stats()["active"] == 0
+
+
+def test_async_slots_share_the_cap():
+    scheduler = HostScheduler(max_per_host=1, min_interval=0)
+    peak = active = 0
+
+    async def fetch():
+        nonlocal peak, active
+        async with scheduler.async_slot(URL_A):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+
+    async def main():
+        await asyncio.gather(*(fetch() for _ in range(4)))
+
+    asyncio.run(main())
+    assert peak == 1
+
+
+def test_spaces_request_starts():
+    scheduler = HostScheduler(max_per_host=5, min_interval=0.1)
+
+    started = time.monotonic()
+    for _ in range(3):
+        with scheduler.slot(URL_A):
+            pass
+    with scheduler.slot(OTHER):
+        pass
+
+    assert time.monotonic() - started >= 0.2
+    assert scheduler.get_stats()["waits"] == 2
+
+
+def test_parse_retry_after():
+    later = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+    assert parse_retry_after("30") == 30
+    assert 100 < parse_retry_after(format_datetime(later, usegmt=True)) <= 120
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_deferral_delays_only_that_host():
+    scheduler = HostScheduler(min_interval=0, max_wait=5)
+    scheduler.defer(URL_A, 0.2)
+
+    started = time.monotonic()
+    with scheduler.slot(OTHER):
+        assert time.monotonic() - started < 0.1
+    with scheduler.slot(URL_B):
+        assert time.monotonic() - started >= 0.19
+
+
+def test_long_deferral_is_refused_not_waited():
+    scheduler = HostScheduler(min_interval=0, max_wait=1)
+    scheduler.defer(URL_A, 600)
+
+    with pytest.raises(HostDeferred):
+        with scheduler.slot(URL_A):
+            pass
+    assert scheduler.get_stats()["refused"] == 1
+    assert scheduler.get_stats()["deferred_hosts"] == 1
+
+
+class _Resp:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}", response=self)
+
+    def iter_content(self, chunk_size=1):
+        yield self._body
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def feed_env(monkeypatch, tmp_path):
+    monkeypatch.setattr(events, "_feed_cache", FeedValidatorCache(str(tmp_path)))
+    monkeypatch.setattr(events, "_host_profiles", HostProfileStore(str(tmp_path / "hosts.json")))
+    monkeypatch.setattr(time, "sleep", lambda *a, **k: None)
+    events._calendar_breakers.record_success(URL_A)
+    yield
+    events._calendar_breakers.record_success(URL_A)
+
+
+def test_fetch_waits_out_short_retry_after(monkeypatch, feed_env):
+    scheduler = HostScheduler(min_interval=0, max_wait=5)
+    monkeypatch.setattr(events, "_host_scheduler", scheduler)
+    answers = [_Resp(429, headers={"Retry-After": "1"}), _Resp(200, BODY)]
+    seen = []
+
+    def fake_get(url, **kwargs):
+        seen.append(time.monotonic())
+        return answers.pop(0)
+
+    monkeypatch.setattr(http_pool, "get", fake_get)
+
+    assert events._fetch_ics_content(URL_A) == (BODY, "utf-8", False)
+    assert seen[1] - seen[0] >= 0.9
+    assert not events.is_calendar_circuit_open(URL_A)
+
+
+def test_fetch_skips_host_inside_long_retry_after(monkeypatch, feed_env):
+    monkeypatch.setattr(events, "_host_scheduler", HostScheduler(min_interval=0, max_wait=1))
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return _Resp(429, headers={"Retry-After": "3600"})
+
+    monkeypatch.setattr(http_pool, "get", fake_get)
+    before = events.get_metrics_summary()
+
+    assert events._fetch_ics_content(URL_A) is None
+    assert events._fetch_ics_content(URL_B) is None
+    after = events.get_metrics_summary()
+
+    assert calls == [URL_A], "the deferred host must not be contacted again"
+    assert after["requests_deferred"] == before["requests_deferred"] + 2
+    assert after["hosts_deferred_now"] == 1
+    assert not events.is_calendar_circuit_open(URL_A)
@@ -0,0 +1,98 @@
+"""
+Tests for the pooled keep-alive HTTP sessions in http_pool.py.
+
+Runs a local HTTP/1.1 server so connection reuse is measured for real:
+one session per host, default headers applied, per-call headers merged,
+and the reuse counters reflecting saved handshakes.
+
+Uses pytest and imports directly from the source modules.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from http_pool import DEFAULT_HEADERS, SessionPool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen_headers: list = []
+
+    def do_GET(self):
+        _Handler.seen_headers.append(dict(self.headers))
+        body = b"BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/calendar")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    _Handler.seen_headers = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_are_reused_for_same_host(server_url):
+    pool = SessionPool(pool_maxsize=2, default_headers=DEFAULT_HEADERS)
+    try:
+        for i in range(5):
+            assert pool.get(f"{server_url}/cal{i}.ics", timeout=5).status_code == 200
+
+        stats = pool.get_stats()
+        assert stats["hosts"] == 1
+        assert stats["requests_sent"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
+        assert stats["reuse_rate_percent"] == 80.0
+    finally:
+        pool.close()
+
+
+def test_one_session_per_host():
+    pool = SessionPool()
+    a = pool.session_for("https://Example.test/a.ics")
+    b = pool.session_for("https://example.test/b.ics?x=1")
+    c = pool.session_for("https://other.test/a.ics")
+    assert a is b
+    assert a is not c
+    assert len(pool) == 2
+    pool.close()
+    assert len(pool) == 0
+
+
+def test_default_headers_applied_and_merged(server_url):
+    pool = SessionPool(default_headers=DEFAULT_HEADERS)
+    try:
+        pool.get(f"{server_url}/a.ics", timeout=5)
+        pool.get(f"{server_url}/b.png", timeout=5, headers={"Accept": "image/*"})
+    finally:
+        pool.close()
+
+    first, second = _Handler.seen_headers
+    assert first["User-Agent"] == DEFAULT_HEADERS["User-Agent"]
+    assert first["Accept"] == DEFAULT_HEADERS["Accept"]
+    assert second["User-Agent"] == DEFAULT_HEADERS["User-Agent"]
+    assert second["Accept"] == "image/*"
+
+
+def test_stats_survive_close(server_url):
+    pool = SessionPool()
+    pool.get(f"{server_url}/a.ics", timeout=5)
+    pool.get(f"{server_url}/a.ics", timeout=5)
+    pool.close()
+
+    stats = pool.get_stats()
+    assert stats["hosts"] == 0
+    assert stats["requests_sent"] == 2
+    assert stats["connections_reused"] == 1
@@ -0,0 +1,230 @@
+"""
+Tests for the aiohttp-based ICS fetch path (events.get_events_async).
+
+Runs a local HTTP server and covers a normal fetch, a UTF-16 feed getting
+past the download sniffing and decoded, conditional GET on the async path
+(with the feed cache's disk I/O kept off the event loop), non-retryable
+HTTP errors, an HTML login page rejected by the
+bounded download, and a caller timeout cancelling the request itself rather
+than leaving a worker thread blocked on the socket.
+
+Uses pytest and imports directly from the source modules.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+import http_pool  # noqa: E402
+from feed_cache import FeedValidatorCache, ParsedFeedCache  # noqa: E402
+from host_profiles import HostProfileStore  # noqa: E402
+from host_scheduler import HostScheduler  # noqa: E402
+
+BODY = (
+    b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nBEGIN:VEVENT\r\nSUMMARY:Lesson\r\n"
+    b"DTSTART:20250102T090000Z\r\nDTEND:20250102T100000Z\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+)
+START, END = date(2025, 1, 1), date(2025, 1, 7)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen: list = []
+    delay = 0.0
+
+    def do_GET(self):
+        _Handler.seen.append((self.path, dict(self.headers)))
+        if _Handler.delay:
+            time.sleep(_Handler.delay)
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/login"):
+            page = b"<!DOCTYPE html><html><body>Sign in</body></html>" + b" " * 200_000
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+            return
+        if self.path.startswith("/utf16"):
+            feed = BODY.decode().encode("utf-16")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/calendar; charset=utf-16")
+            self.send_header("Content-Length", str(len(feed)))
+            self.end_headers()
+            self.wfile.write(feed)
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/calendar; charset=utf-8")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(monkeypatch, tmp_path):
+    _Handler.seen = []
+    _Handler.delay = 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    monkeypatch.setattr(events, "_feed_cache", FeedValidatorCache(str(tmp_path)))
+    monkeypatch.setattr(events, "_parsed_feed_cache", ParsedFeedCache())
+    monkeypatch.setattr(events, "_host_profiles", HostProfileStore(str(tmp_path / "hosts.json")))
+    monkeypatch.setattr(events, "_host_scheduler", HostScheduler(min_interval=0))
+    monkeypatch.setattr(events, "ICS_STREAM_PARSER", False)
+    monkeypatch.setattr(events, "_parse_ics_calendar", lambda content, url: object())
+    monkeypatch.setattr(events, "_extract_ics_events", lambda cal, url, s, e: [{
+        "summary": "Lesson",
+        "start": {"dateTime": "2025-01-02T09:00:00+00:00"},
+        "end": {"dateTime": "2025-01-02T10:00:00+00:00"},
+        "location": "",
+    }])
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+    events.invalidate_event_cache()
+
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _no_sleep(delay, *args, **kwargs):
+    await _real_sleep(0)
+
+
+def _run(coro):
+    async def wrapper():
+        try:
+            return await coro
+        finally:
+            await http_pool.close_async_session()
+    return asyncio.run(wrapper())
+
+
+def _meta(url):
+    return {"type": "ics", "id": url, "name": "Async Test"}
+
+
+def test_async_fetch_returns_events(base_url):
+    url = f"{base_url}/cal.ics"
+    events_list = _run(events.get_events_async(_meta(url), START, END))
+
+    assert [e["summary"] for e in events_list] == ["Lesson"]
+    assert _Handler.seen[0][1]["User-Agent"] == http_pool.DEFAULT_HEADERS["User-Agent"]
+
+
+def test_async_fetch_decodes_utf16_feed(base_url, monkeypatch):
+    parsed = []
+    monkeypatch.setattr(events, "_parse_ics_calendar", lambda content, url: parsed.append(content) or object())
+
+    events_list = _run(events.get_events_async(_meta(f"{base_url}/utf16.ics"), START, END))
+
+    assert [e["summary"] for e in events_list] == ["Lesson"]
+    assert parsed == [BODY.decode().replace("\r\n", "\n")]
+
+
+def test_async_fetch_uses_conditional_get(base_url, monkeypatch):
+    url = f"{base_url}/cal.ics"
+    cache = events._feed_cache
+    io_threads = []
+
+    def on_thread(method):
+        def wrapper(*args):
+            io_threads.append(threading.current_thread())
+            return method(*args)
+        return wrapper
+
+    for name in ("conditional_headers", "load_body", "store"):
+        monkeypatch.setattr(cache, name, on_thread(getattr(cache, name)))
+
+    async def twice():
+        first = await events._fetch_ics_events_async(START, END, url)
+        second = await events._fetch_ics_events_async(START, END, url)
+        return first, second
+
+    first, second = _run(twice())
+
+    assert second == first
+    assert "If-None-Match" not in _Handler.seen[0][1]
+    assert _Handler.seen[1][1]["If-None-Match"] == '"v1"'
+    # Feed-cache disk I/O (including reading the body back on a 304) stays off the loop
+    assert len(io_threads) == 4
+    assert threading.main_thread() not in io_threads
+
+
+def test_async_fetch_not_found_is_failure(base_url):
+    url = f"{base_url}/missing.ics"
+    before = events.get_metrics_summary()["requests_failed"]
+
+    assert _run(events._fetch_ics_events_async(START, END, url)) is None
+    assert len(_Handler.seen) == 1, "404 must not be retried"
+    assert events.get_metrics_summary()["requests_failed"] == before + 1
+    events._calendar_breakers.record_success(url)
+
+
+def test_async_fetch_rejects_html_page(base_url):
+    url = f"{base_url}/login.ics"
+    before = events.get_metrics_summary()["downloads_rejected"]
+
+    assert _run(events._fetch_ics_events_async(START, END, url)) is None
+    assert len(_Handler.seen) == 1, "a rejected body must not be retried"
+    assert events.get_metrics_summary()["downloads_rejected"] == before + 1
+
+
+def test_timeout_cancels_request(base_url):
+    _Handler.delay = 3.0
+    url = f"{base_url}/slow.ics"
+
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        _run(asyncio.wait_for(events.get_events_async(_meta(url), START, END), timeout=0.3))
+
+    assert time.monotonic() - started < 2.0
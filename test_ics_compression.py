@@ -0,0 +1,222 @@
+"""
+Tests for negotiated gzip/deflate ICS transfer (host_profiles.py + events.py).
+
+Runs a local HTTP server and covers a gzip feed decoded on both fetch paths
+with wire vs decoded bytes recorded, a host sending gzip without the
+Content-Encoding header and a host sending a corrupt gzip stream both being
+switched to identity and refetched (with the profile file I/O kept off
+the event loop), the per-host choice persisting across restarts and being
+re-probed later, and byte counters staying in memory until flushed.
+
+Uses pytest and imports directly from the source modules.
+"""
+import asyncio
+import gzip
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+import http_pool  # noqa: E402
+import host_profiles  # noqa: E402
+from feed_cache import FeedValidatorCache  # noqa: E402
+from host_profiles import COMPRESSED_ENCODING, IDENTITY_ENCODING, HostProfileStore  # noqa: E402
+from host_scheduler import HostScheduler  # noqa: E402
+
+BODY = (
+    b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\n"
+    + b"".join(
+        b"BEGIN:VEVENT\r\nUID:%d\r\nSUMMARY:Lesson\r\n"
+        b"DTSTART:20250102T090000Z\r\nDTEND:20250102T100000Z\r\nEND:VEVENT\r\n" % i
+        for i in range(200)
+    )
+    + b"END:VCALENDAR\r\n"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen: list = []
+
+    def do_GET(self):
+        accept = self.headers.get("Accept-Encoding", "")
+        _Handler.seen.append(accept)
+        payload, encoding = BODY, None
+        if "gzip" in accept:
+            if self.path.startswith("/gzip"):
+                payload, encoding = gzip.compress(BODY), "gzip"
+            elif self.path.startswith("/mislabelled"):
+                payload = gzip.compress(BODY)
+            elif self.path.startswith("/broken"):
+                payload, encoding = b"\x1f\x8b\x08\x00garbage" * 50, "gzip"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/calendar; charset=utf-8")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(monkeypatch, tmp_path):
+    _Handler.seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    monkeypatch.setattr(events, "_feed_cache", FeedValidatorCache(str(tmp_path / "cache")))
+    monkeypatch.setattr(events, "_host_profiles", HostProfileStore(str(tmp_path / "hosts.json")))
+    monkeypatch.setattr(events, "_host_scheduler", HostScheduler(min_interval=0))
+    monkeypatch.setattr(time, "sleep", lambda *a, **k: None)
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    http_pool.close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+def _fetch_async(url):
+    async def wrapper():
+        try:
+            return await events._fetch_ics_content_async(url)
+        finally:
+            await http_pool.close_async_session()
+    return asyncio.run(wrapper())
+
+
+def test_gzip_feed_is_decoded_and_bytes_recorded(base_url):
+    url = f"{base_url}/gzip.ics"
+
+    assert events._fetch_ics_content(url) == (BODY, "utf-8", False)
+    assert _Handler.seen == [COMPRESSED_ENCODING]
+
+    profile = events._host_profiles.get_profile(url)
+    assert profile["encoding"] == "compressed"
+    assert profile["compressed_transfers"] == 1
+    assert profile["decoded_bytes"] == len(BODY)
+    assert profile["wire_bytes"] == len(gzip.compress(BODY))
+    assert events.get_metrics_summary()["ics_transfer_savings_percent"] > 80
+
+
+def test_async_gzip_feed_is_decoded(base_url):
+    url = f"{base_url}/gzip.ics"
+
+    assert _fetch_async(url) == (BODY, "utf-8", False)
+    assert events._host_profiles.get_profile(url)["wire_bytes"] < len(BODY)
+
+
+def test_mislabelled_gzip_falls_back_to_identity(base_url):
+    url = f"{base_url}/mislabelled.ics"
+    before = events.get_metrics_summary()["compression_fallbacks"]
+
+    assert events._fetch_ics_content(url) == (BODY, "utf-8", False)
+    assert _Handler.seen == [COMPRESSED_ENCODING, IDENTITY_ENCODING]
+    assert events._host_profiles.get_profile(url)["encoding"] == "identity"
+    assert events.get_metrics_summary()["compression_fallbacks"] == before + 1
+
+    # The choice sticks for the next poll
+    assert events._fetch_ics_content(url) == (BODY, "utf-8", False)
+    assert _Handler.seen[-1] == IDENTITY_ENCODING
+
+
+def test_async_corrupt_gzip_falls_back_to_identity(base_url, monkeypatch):
+    url = f"{base_url}/broken.ics"
+    profiles = events._host_profiles
+    io_threads = []
+
+    def on_thread(method):
+        def wrapper(*args, **kwargs):
+            io_threads.append(threading.current_thread())
+            return method(*args, **kwargs)
+        return wrapper
+
+    for name in ("accept_encoding", "mark_identity"):
+        monkeypatch.setattr(profiles, name, on_thread(getattr(profiles, name)))
+
+    assert _fetch_async(url) == (BODY, "utf-8", False)
+    assert _Handler.seen == [COMPRESSED_ENCODING, IDENTITY_ENCODING]
+    assert profiles.get_profile(url)["encoding"] == "identity"
+    # Profile loads and saves hit disk, so the async path keeps them off the loop
+    assert len(io_threads) == 3
+    assert threading.main_thread() not in io_threads
+
+
+def test_sync_corrupt_gzip_falls_back_to_identity(base_url):
+    url = f"{base_url}/broken.ics"
+
+    assert events._fetch_ics_content(url) == (BODY, "utf-8", False)
+    assert _Handler.seen == [COMPRESSED_ENCODING, IDENTITY_ENCODING]
+
+
+def test_host_choice_persists_and_is_reprobed(tmp_path, monkeypatch):
+    path = str(tmp_path / "hosts.json")
+    url = "https://feeds.example.test/a.ics"
+    HostProfileStore(path).mark_identity(url, "decode error")
+
+    restarted = HostProfileStore(path)
+    assert restarted.accept_encoding(url) == IDENTITY_ENCODING
+    assert restarted.accept_encoding("https://other.example.test/b.ics") == COMPRESSED_ENCODING
+
+    later = time.time() + host_profiles.REPROBE_SECONDS + 1
+    monkeypatch.setattr(host_profiles.time, "time", lambda: later)
+    assert restarted.accept_encoding(url) == COMPRESSED_ENCODING
+    assert HostProfileStore(path).get_profile(url)["encoding"] == "compressed"
+
+
+def test_transfer_counters_written_only_on_flush(tmp_path):
+    path = tmp_path / "hosts.json"
+    url = "https://feeds.example.test/a.ics"
+    store = HostProfileStore(str(path))
+
+    for _ in range(3):
+        store.record_transfer(url, 400, 1000, "gzip")
+    assert not path.exists()
+    assert store.get_profile(url)["transfers"] == 3
+
+    assert store.flush() is True
+    assert HostProfileStore(str(path)).get_profile(url)["wire_bytes"] == 1200
+    assert store.flush() is False
+
+    # An encoding change is written at once, pending counters included
+    store.record_transfer(url, 400, 1000, "gzip")
+    store.mark_identity(url, "decode error")
+    assert HostProfileStore(str(path)).get_profile(url)["transfers"] == 4
+    assert store.flush() is False
+
+
+def test_disabled_store_always_requests_identity(tmp_path):
+    store = HostProfileStore(str(tmp_path / "hosts.json"), enabled=False)
+    assert store.accept_encoding("https://feeds.example.test/a.ics") == IDENTITY_ENCODING
@@ -0,0 +1,186 @@
+"""
+Tests for conditional GET of ICS feeds (feed_cache.py + events.py).
+
+Covers sending If-None-Match / If-Modified-Since once validators are known,
+serving the stored body on 304, skipping the parse when the window is
+unchanged, validators surviving a "restart" (fresh cache object on the same
+directory), recovering when a 304 arrives but the body is gone, and the
+body-hash keyed parsed-feed cache (identical 200s, LRU and memory cap).
+
+Uses pytest and imports directly from the source modules.
+"""
+import os
+import sys
+import time
+from datetime import date
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import requests  # noqa: E402
+import http_pool  # noqa: E402
+import events  # noqa: E402
+from feed_cache import FeedValidatorCache, ParsedFeedCache  # noqa: E402
+from host_profiles import HostProfileStore  # noqa: E402
+from host_scheduler import HostScheduler  # noqa: E402
+
+URL = "https://example.test/calendar.ics"
+BODY = (
+    "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nBEGIN:VEVENT\r\nSUMMARY:Lesson\r\n"
+    "DTSTART:20250102T090000Z\r\nDTEND:20250102T100000Z\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+)
+START, END = date(2025, 1, 1), date(2025, 1, 7)
+
+
+class FakeResp:
+    """Minimal stand-in for a requests.Response."""
+
+    def __init__(self, status_code, body="", headers=None):
+        self.status_code = status_code
+        self.content = body.encode("utf-8")
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}", response=self)
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+
+class FakeServer:
+    """Answers 304 when the request's If-None-Match matches the ETag."""
+
+    def __init__(self, etag='"v1"'):
+        self.etag = etag
+        self.requests = []
+
+    def __call__(self, url, **kwargs):
+        headers = kwargs.get("headers") or {}
+        self.requests.append(headers)
+        if self.etag and headers.get("If-None-Match") == self.etag:
+            return FakeResp(304)
+        return FakeResp(200, BODY, {"ETag": self.etag} if self.etag else {})
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    srv = FakeServer()
+    monkeypatch.setattr(http_pool, "get", srv)
+    monkeypatch.setattr(time, "sleep", lambda *a, **k: None)
+    monkeypatch.setattr(events, "_feed_cache", FeedValidatorCache(str(tmp_path)))
+    monkeypatch.setattr(events, "_parsed_feed_cache", ParsedFeedCache())
+    monkeypatch.setattr(events, "_host_profiles", HostProfileStore(str(tmp_path / "hosts.json")))
+    monkeypatch.setattr(events, "_host_scheduler", HostScheduler(min_interval=0))
+    monkeypatch.setattr(events, "ICS_STREAM_PARSER", False)
+    events._calendar_breakers.record_success(URL)
+    parsed = []
+
+    def fake_parse(content, url):
+        parsed.append(content)
+        return object()
+
+    monkeypatch.setattr(events, "_parse_ics_calendar", fake_parse)
+    monkeypatch.setattr(events, "_extract_ics_events", lambda cal, url, s, e: [{
+        "summary": "Lesson",
+        "start": {"dateTime": "2025-01-02T09:00:00+00:00"},
+        "end": {"dateTime": "2025-01-02T10:00:00+00:00"},
+        "location": "",
+    }])
+    srv.parsed = parsed
+    return srv
+
+
+def test_second_fetch_sends_validators_and_skips_parse(server):
+    first = events._fetch_ics_events(START, END, URL)
+    second = events._fetch_ics_events(START, END, URL)
+
+    assert "If-None-Match" not in server.requests[0]
+    assert server.requests[1]["If-None-Match"] == '"v1"'
+    assert len(server.parsed) == 1
+    assert second == first
+    assert second is not first
+
+
+def test_not_modified_with_new_window_reparses_cached_body(server):
+    events._fetch_ics_events(START, END, URL)
+    events._fetch_ics_events(START, date(2025, 1, 14), URL)
+
+    assert len(server.parsed) == 2
+    assert "BEGIN:VCALENDAR" in server.parsed[1]
+
+
+def test_validators_persist_across_restart(server, tmp_path):
+    events._fetch_ics_events(START, END, URL)
+
+    restarted = FeedValidatorCache(str(tmp_path))
+    assert restarted.conditional_headers(URL) == {"If-None-Match": '"v1"'}
+    body, encoding = restarted.load_body(URL)
+    assert body.decode(encoding) == BODY
+
+
+def test_missing_body_after_304_refetches_unconditionally(server, monkeypatch):
+    events._fetch_ics_events(START, END, URL)
+    # Body disappears between the header lookup and the 304
+    monkeypatch.setattr(events._feed_cache, "load_body", lambda url: None)
+
+    events._parsed_feed_cache.clear()
+    events._fetch_ics_events(START, END, URL)
+
+    assert server.requests[1].get("If-None-Match") == '"v1"'
+    assert "If-None-Match" not in server.requests[2]
+    assert len(server.parsed) == 2
+
+
+def test_feed_without_validators_is_not_stored(server, tmp_path):
+    server.etag = None
+    events._fetch_ics_events(START, END, URL)
+    events._fetch_ics_events(START, END, URL)
+
+    assert all("If-None-Match" not in h for h in server.requests)
+    assert URL not in events._feed_cache
+    # The identical body is still recognised by its hash and not reparsed
+    assert len(server.parsed) == 1
+    assert events.get_metrics_summary()["parse_cache_hits"] >= 1
+
+
+def test_parsed_feed_cache_evicts_lru_and_respects_memory_cap():
+    cache = ParsedFeedCache(max_entries=2, max_bytes=10_000)
+    keys = [ParsedFeedCache.content_key(f"body {i}", START, END) for i in range(3)]
+    for key in keys:
+        cache.put(key, [{"summary": "x"}])
+    assert cache.get(keys[0]) is None and cache.get(keys[2]) == [{"summary": "x"}]
+
+    cache.put(keys[0], [{"summary": "y" * 6000}])
+    cache.put(keys[1], [{"summary": "z" * 6000}])
+    assert len(cache) == 1 and cache.get_stats()["bytes"] <= 10_000
+    assert ParsedFeedCache.content_key(BODY, START, END) != ParsedFeedCache.content_key(BODY, START, date(2025, 1, 8))
@@ -0,0 +1,128 @@
+"""
+Tests for bounded, sniffed ICS downloads (ics_download.py).
+
+Covers rejecting HTML and non-calendar bodies after the first chunk,
+sniffing UTF-16/32 bodies by BOM or declared charset, rejecting on a
+declared Content-Length before reading, cutting off an endless stream at
+the byte cap, spooling large bodies to disk, and the async reader
+(reading a spooled body back in a worker thread).
+
+Uses pytest and imports directly from the source modules.
+"""
+import asyncio
+import itertools
+import threading
+
+import pytest
+
+import ics_download
+from ics_download import FeedRejected, read_feed_body, read_feed_body_async, sniff_ics_prefix
+
+ICS = b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\n" + b"X-FILLER:" + b"a" * 5000 + b"\r\nEND:VCALENDAR\r\n"
+
+
+class CountingChunks:
+    """Chunk iterator that records how many chunks were pulled."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.pulled = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = next(self._chunks)
+        self.pulled += 1
+        return chunk
+
+
+def test_sniff_prefix():
+    assert sniff_ics_prefix(b"BEGIN:VCALENDAR\r\n") is None
+    assert sniff_ics_prefix(b"\xef\xbb\xbfBEGIN:VCAL") is None
+    assert "HTML" in sniff_ics_prefix(b"<!DOCTYPE html><html>")
+    assert "HTML" in sniff_ics_prefix(b"\n  <html lang='en'>")
+    assert sniff_ics_prefix(b'{"error": "forbidden"}') == "missing BEGIN:VCALENDAR"
+    assert sniff_ics_prefix(b"") == "empty body"
+
+
+@pytest.mark.parametrize("codec", ["utf-16", "utf-32", "utf-16-be"])
+def test_sniff_wide_charset_prefix(codec):
+    # BOM-less encodings are only recognised through the declared charset
+    declared = None if codec in ("utf-16", "utf-32") else codec
+    feed = ICS.decode().encode(codec)
+
+    assert sniff_ics_prefix(feed[:ics_download.SNIFF_BYTES + 1], declared) is None
+    assert "HTML" in sniff_ics_prefix("<!DOCTYPE html><html>".encode(codec), declared)
+    assert read_feed_body([feed], max_bytes=50_000, spool_threshold=50_000, charset=declared) == (feed, False)
+    if declared:
+        assert sniff_ics_prefix(feed) == "missing BEGIN:VCALENDAR"
+
+
+def test_html_rejected_within_first_chunks():
+    page = b"<!DOCTYPE html><html>" + b"x" * 10_000_000
+    chunks = CountingChunks(page[i:i + 512] for i in range(0, len(page), 512))
+
+    with pytest.raises(FeedRejected, match="HTML"):
+        read_feed_body(chunks, max_bytes=50_000_000, spool_threshold=1_000_000)
+    assert chunks.pulled <= 2
+
+
+def test_declared_length_rejected_before_reading():
+    chunks = CountingChunks([ICS])
+
+    with pytest.raises(FeedRejected, match="Content-Length"):
+        read_feed_body(chunks, max_bytes=1000, spool_threshold=500, declared_length="60000000")
+    assert chunks.pulled == 0
+
+
+def test_endless_stream_cut_off_at_cap():
+    endless = itertools.chain([ICS[:1024]], itertools.repeat(b"y" * 4096))
+    chunks = CountingChunks(endless)
+
+    with pytest.raises(FeedRejected, match="byte limit"):
+        read_feed_body(chunks, max_bytes=100_000, spool_threshold=50_000)
+    assert chunks.pulled < 30
+
+
+def test_large_body_spooled_to_disk_and_returned_intact():
+    chunks = [ICS[i:i + 700] for i in range(0, len(ICS), 700)]
+
+    body, spooled = read_feed_body(chunks, max_bytes=1_000_000, spool_threshold=2000)
+    assert spooled and body == ICS
+
+    body, spooled = read_feed_body(chunks, max_bytes=1_000_000, spool_threshold=1_000_000)
+    assert not spooled and body == ICS
+
+
+def test_short_non_calendar_body_rejected_at_end():
+    with pytest.raises(FeedRejected):
+        read_feed_body([b"Not found"], max_bytes=1000, spool_threshold=500)
+
+
+def test_async_reader():
+    async def chunks():
+        for i in range(0, len(ICS), 1000):
+            yield ICS[i:i + 1000]
+
+    body, spooled = asyncio.run(read_feed_body_async(chunks(), 1_000_000, 1_000_000))
+    assert body == ICS and not spooled
+
+
+def test_async_reader_reads_spool_back_off_the_loop(monkeypatch):
+    readers = []
+    finish = ics_download.FeedBodyCollector.finish
+
+    def recording_finish(self):
+        readers.append(threading.current_thread())
+        return finish(self)
+
+    monkeypatch.setattr(ics_download.FeedBodyCollector, "finish", recording_finish)
+
+    async def chunks():
+        for i in range(0, len(ICS), 1000):
+            yield ICS[i:i + 1000]
+
+    body, spooled = asyncio.run(read_feed_body_async(chunks(), 1_000_000, 2000))
+    assert body == ICS and spooled
+    assert readers and threading.main_thread() not in readers
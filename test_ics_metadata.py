@@ -47,7 +47,9 @@ os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
 os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
 
 import requests  # noqa: E402
+import http_pool  # noqa: E402
 import events  # noqa: E402
+from metadata_cache import CalendarMetadataCache  # noqa: E402
 
 URL = "https://example.test/schedule/export/teachers/720/Wilma.ics?token=abc&p=1"
 CACHE_KEY = f"ics_{URL}"
@@ -71,12 +73,10 @@ class FakeResp:
 
 
 @pytest.fixture(autouse=True)
-def _clean(monkeypatch):
-    events._calendar_metadata_cache.clear()
+def _clean(monkeypatch, tmp_path):
+    monkeypatch.setattr(events, "_calendar_metadata_cache", CalendarMetadataCache(str(tmp_path / "meta.json")))
     # Make tenacity's exponential backoff instant so retry tests stay fast.
     monkeypatch.setattr(time, "sleep", lambda *a, **k: None)
-    yield
-    events._calendar_metadata_cache.clear()
 
 
 def test_validation_probe_sends_browser_headers(monkeypatch):
@@ -87,7 +87,7 @@ def test_validation_probe_sends_browser_headers(monkeypatch):
         captured["headers"] = kwargs.get("headers") or {}
         return FakeResp(200)
 
-    monkeypatch.setattr(requests, "head", fake_head)
+    monkeypatch.setattr(http_pool, "head", fake_head)
 
     events.fetch_ics_calendar_metadata(URL)
 
@@ -103,7 +103,7 @@ def test_validation_retries_transient_server_error(monkeypatch):
         calls.append(1)
         return FakeResp(503) if len(calls) == 1 else FakeResp(200)
 
-    monkeypatch.setattr(requests, "head", fake_head)
+    monkeypatch.setattr(http_pool, "head", fake_head)
 
     meta = events.fetch_ics_calendar_metadata(URL)
 
@@ -119,7 +119,7 @@ def test_persistent_transient_error_falls_back_to_url_name(monkeypatch):
     def fake_head(url, **kwargs):
         return FakeResp(500)
 
-    monkeypatch.setattr(requests, "head", fake_head)
+    monkeypatch.setattr(http_pool, "head", fake_head)
 
     meta = events.fetch_ics_calendar_metadata(URL)
 
@@ -136,7 +136,7 @@ def test_not_found_still_classified(monkeypatch):
     def fake_head(url, **kwargs):
         return FakeResp(404)
 
-    monkeypatch.setattr(requests, "head", fake_head)
+    monkeypatch.setattr(http_pool, "head", fake_head)
 
     meta = events.fetch_ics_calendar_metadata(URL)
 
@@ -155,8 +155,8 @@ def test_head_405_uses_ranged_get_with_browser_headers(monkeypatch):
         get_calls.append(kwargs.get("headers") or {})
         return FakeResp(200)
 
-    monkeypatch.setattr(requests, "head", fake_head)
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_pool, "head", fake_head)
+    monkeypatch.setattr(http_pool, "get", fake_get)
 
     meta = events.fetch_ics_calendar_metadata(URL)
 
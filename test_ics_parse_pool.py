@@ -0,0 +1,175 @@
+"""
+Tests for the optional ICS parse process pool (ics_parse_pool.py + events.py).
+
+Runs real worker processes: results match in-process parsing, small feeds
+stay in-process, a worker past its time budget is killed and the pool
+replaced, time queued behind other parses does not count against the
+budget, parses in flight on other workers are resubmitted rather than
+parsed in-process, parse errors cross the process boundary, and events.py
+only offloads feeds above the size threshold.
+
+Uses pytest and imports directly from the source modules.
+"""
+import os
+import sys
+import threading
+import time
+from datetime import date
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+import ics_parse_pool  # noqa: E402
+from ics_parse_pool import IcsParsePool, ParseBudgetExceeded  # noqa: E402
+from ics_stream import IcsStreamError, extract_window_occurrences  # noqa: E402
+
+START, END = date(2025, 1, 1), date(2025, 1, 31)
+
+
+def _feed(count):
+    body = "".join(
+        f"BEGIN:VEVENT\r\nUID:{i}\r\nSUMMARY:Lesson {i}\r\n"
+        f"DTSTART:202501{(i % 28) + 1:02d}T090000Z\r\nDTEND:202501{(i % 28) + 1:02d}T100000Z\r\nEND:VEVENT\r\n"
+        for i in range(count)
+    )
+    return f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\n{body}END:VCALENDAR\r\n"
+
+
+@pytest.fixture
+def pool():
+    parse_pool = IcsParsePool(workers=1, min_bytes=1000, timeout=30)
+    yield parse_pool
+    parse_pool.shutdown()
+
+
+def test_worker_results_match_in_process(pool):
+    feed = _feed(50)
+
+    assert pool.should_offload(feed) and not pool.should_offload(feed[:500])
+    assert pool.parse(feed, START, END, "test") == extract_window_occurrences(feed, START, END)
+    assert pool.get_stats()["offloaded"] == 1
+
+
+def test_parse_errors_cross_the_process_boundary(pool):
+    with pytest.raises(IcsStreamError):
+        pool.parse("BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nEND:VTODO\r\n" + "X" * 2000, START, END)
+
+
+def test_time_budget_kills_and_replaces_pool(pool):
+    pool.timeout = 0.001
+
+    with pytest.raises(ParseBudgetExceeded):
+        pool.parse(_feed(5000), START, END)
+    assert pool.get_stats()["timeouts"] == 1
+    assert pool.get_stats()["running"] is False
+
+    pool.timeout = 30
+    assert len(pool.parse(_feed(10), START, END)) == 10
+
+
+def _slow_extract(content, start_date, end_date, label="feed"):
+    # Runs in forked workers; the label says how long to take
+    time.sleep(float(label.split(":")[1]))
+    return extract_window_occurrences(content, start_date, end_date, label)
+
+
+def _parse_concurrently(pool, labels, stagger=0.0):
+    results = {}
+
+    def run(label):
+        try:
+            results[label] = pool.parse(_feed(3), START, END, label)
+        except Exception as e:
+            results[label] = e
+
+    threads = []
+    for label in labels:
+        threads.append(threading.Thread(target=run, args=(label,)))
+        threads[-1].start()
+        time.sleep(stagger)
+    for t in threads:
+        t.join(timeout=30)
+    return results
+
+
+def test_queue_time_does_not_count_against_budget(monkeypatch):
+    monkeypatch.setattr(ics_parse_pool, "extract_window_occurrences", _slow_extract)
+    parse_pool = IcsParsePool(workers=1, min_bytes=0, timeout=1.5)
+    try:
+        # The second parse waits ~0.9s for the only worker, then runs 0.9s
+        results = _parse_concurrently(parse_pool, ["a:0.9", "b:0.9"])
+    finally:
+        parse_pool.shutdown()
+
+    assert all(len(rows) == 3 for rows in results.values()), results
+    assert parse_pool.get_stats()["timeouts"] == 0
+
+
+def test_overrun_resubmits_parses_on_other_workers(monkeypatch):
+    monkeypatch.setattr(ics_parse_pool, "extract_window_occurrences", _slow_extract)
+    parse_pool = IcsParsePool(workers=2, min_bytes=0, timeout=2.0)
+    try:
+        # "stuck" is killed at ~2s while "sibling" (1s to 2.6s) is still running on the other worker
+        results = _parse_concurrently(parse_pool, ["stuck:20", "sibling:1.6"], stagger=1.0)
+    finally:
+        parse_pool.shutdown()
+
+    assert isinstance(results["stuck:20"], ParseBudgetExceeded)
+    assert len(results["sibling:1.6"]) == 3
+    stats = parse_pool.get_stats()
+    assert stats["timeouts"] == 1
+    assert stats["resubmitted"] == 1
+    assert stats["offloaded"] == 1
+
+
+def test_events_offloads_only_large_feeds(monkeypatch):
+    calls = []
+
+    class RecordingPool(IcsParsePool):
+        def parse(self, content, start_date, end_date, label="feed"):
+            calls.append(label)
+            return extract_window_occurrences(content, start_date, end_date, label)
+
+    monkeypatch.setattr(events, "_ics_parse_pool", RecordingPool(min_bytes=5000))
+    monkeypatch.setattr(events, "simplify_event_title", lambda title: title)
+
+    assert len(events._extract_streamed_events(_feed(2), "small", START, END)) == 2
+    assert len(events._extract_streamed_events(_feed(100), "large", START, END)) == 100
+    assert calls == ["large"]
+
+
+def test_events_treats_budget_overrun_as_parse_failure(monkeypatch):
+    class SlowPool(IcsParsePool):
+        def parse(self, *args, **kwargs):
+            raise ParseBudgetExceeded("no result after 60s")
+
+    monkeypatch.setattr(events, "_ics_parse_pool", SlowPool(min_bytes=0))
+    before = events.get_metrics_summary()["parsing_errors"]
+
+    assert events._parse_ics_events(_feed(2), "slow", START, END) is None
+    assert events.get_metrics_summary()["parsing_errors"] == before + 1
@@ -0,0 +1,158 @@
+"""
+Tests for the single-pass ICS preprocessor (ics_preprocess.py + events.py).
+
+Covers the DTSTART/DTEND fixes on every line-ending style, null-byte
+stripping, the missing VCALENDAR wrapper, lines with parameters left alone,
+identical output whatever the chunk size, parity with the old regex passes
+on LF feeds, and the events.preprocess_ics_content() wrapper. Also covers
+validation of raw bodies in events._validate_ics_content(): rejections
+without copying the body, a UTF-8 BOM, non-UTF-8 charsets decoded once,
+and peak memory for an accepted feed.
+
+Uses pytest and imports directly from the source modules.
+"""
+import os
+import sys
+import tracemalloc
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+from bench_ics_preprocess import legacy_preprocess, synthetic_feed  # noqa: E402
+from ics_preprocess import preprocess_ics_bytes  # noqa: E402
+
+EVENT = [
+    b"BEGIN:VEVENT",
+    b"SUMMARY:Lesson",
+    b"DTSTART:20250102T090000",
+    b"DTEND:",
+    b"END:VEVENT",
+]
+FIXED = (
+    b"BEGIN:VEVENT\nSUMMARY:Lesson\nDTSTART:20250102T090000Z\n"
+    b"DTEND:19700101T010000Z\nEND:VEVENT\n"
+)
+
+
+@pytest.mark.parametrize("newline", [b"\r\n", b"\n", b"\r"])
+def test_fixes_datetimes_and_normalizes_newlines(newline):
+    feed = newline.join([b"BEGIN:VCALENDAR", *EVENT, b"END:VCALENDAR", b""])
+
+    assert preprocess_ics_bytes(feed) == b"BEGIN:VCALENDAR\n" + FIXED + b"END:VCALENDAR\n"
+
+
+def test_first_line_of_a_chunk_is_fixed():
+    feed = b"\r\n".join(EVENT) + b"\r\n"
+
+    out = preprocess_ics_bytes(b"BEGIN:VCALENDAR\r\n" + feed + b"END:VCALENDAR\r\n", chunk_size=1)
+    assert out == b"BEGIN:VCALENDAR\n" + FIXED + b"END:VCALENDAR\n"
+
+
+def test_leaves_valid_and_parameterised_lines_alone():
+    feed = (
+        b"BEGIN:VCALENDAR\nBEGIN:VEVENT\nDTSTART;TZID=Europe/Helsinki:20250102T090000\n"
+        b"DTEND:20250102T100000Z\nX-DTSTART:20250102T090000\nDTSTART;VALUE=DATE:20250102\n"
+        b"END:VEVENT\nEND:VCALENDAR\n"
+    )
+
+    assert preprocess_ics_bytes(feed) == feed
+
+
+def test_strips_null_bytes_and_adds_missing_wrapper():
+    feed = b"\r\n".join(EVENT).replace(b"SUMMARY", b"SUM\x00MARY")
+
+    assert preprocess_ics_bytes(feed) == b"BEGIN:VCALENDAR\nVERSION:2.0\n" + FIXED + b"END:VCALENDAR\n"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 4096])
+def test_chunk_size_does_not_change_output(chunk_size):
+    feed = synthetic_feed(0.02).encode("utf-8")
+
+    assert preprocess_ics_bytes(feed, chunk_size=chunk_size) == preprocess_ics_bytes(feed)
+
+
+def test_matches_legacy_regex_passes_on_lf_feeds():
+    # The old MULTILINE patterns only saw naive datetimes before a bare LF
+    feed = synthetic_feed(0.2).replace("\r\n", "\n")
+
+    assert preprocess_ics_bytes(feed.encode("utf-8")).decode("utf-8") == legacy_preprocess(feed)
+
+
+def test_events_wrapper_accepts_text_and_bytes():
+    feed = b"\r\n".join([b"BEGIN:VCALENDAR", *EVENT, b"SUMMARY:P\xc3\xa4iv\xc3\xa4", b"END:VCALENDAR"])
+
+    from_bytes = events.preprocess_ics_content(feed, "test")
+    assert from_bytes == events.preprocess_ics_content(feed.decode("utf-8"), "test")
+    assert "DTSTART:20250102T090000Z\n" in from_bytes and "Päivä" in from_bytes
+
+
+def _feed_bytes(size_mb):
+    return synthetic_feed(size_mb).replace("\u2013", "-").encode("ascii")
+
+
+@pytest.mark.parametrize("body", [
+    b"<!DOCTYPE html><html><body>Sign in</body></html>" + b" " * 100,
+    b"BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nSUMMARY:Truncated" + b" " * 100,
+    b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nX-WR-CALNAME:Empty\r\nEND:VCALENDAR\r\n",
+])
+def test_validation_rejects_bad_bodies(body):
+    assert events._validate_ics_content(body, "utf-8", "test") is None
+
+
+def test_validation_rejects_without_copying_the_body():
+    body = _feed_bytes(5) + b"X-NOTE:\x00\r\n"
+
+    tracemalloc.start()
+    try:
+        assert events._validate_ics_content(body, "utf-8", "test") is None
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 100_000
+
+
+def test_accepted_feed_peaks_near_one_copy_per_stage():
+    body = _feed_bytes(5)
+
+    tracemalloc.start()
+    try:
+        content = events._validate_ics_content(body, "utf-8", "test")
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert content.startswith("BEGIN:VCALENDAR\n")
+    # Preprocessed bytes plus the decoded text, nothing else of feed size
+    assert peak < 2.5 * len(body)
+
+
+def test_validation_strips_bom_and_decodes_declared_charset():
+    feed = "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nSUMMARY:P\u00e4iv\u00e4kerho\r\nDTSTART:20250102T090000Z\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+
+    assert events._validate_ics_content(b"\xef\xbb\xbf" + feed.encode("utf-8"), "utf-8", "t") == feed.replace("\r\n", "\n")
+    assert events._validate_ics_content(feed.encode("latin-1"), "ISO-8859-1", "t") == feed.replace("\r\n", "\n")
+    assert events._validate_ics_content(feed.encode("utf-16"), "utf-16", "t") == feed.replace("\r\n", "\n")
@@ -0,0 +1,256 @@
+"""
+Tests for the streaming ICS tokenizer (ics_stream.py) and its use in events.py.
+
+Covers line unfolding and TEXT unescaping, quoted parameters, TZID
+resolution through dateutil and through the feed's own VTIMEZONE, the
+ics-compatible begin/end rules, nested VALARM properties being ignored,
+lazy yielding, the raw-text window pre-filter, lazy recurrence expansion
+with overrides and its cache, and the events.py path falling back to the
+ics library when the feed's structure is broken.
+
+Uses pytest and imports directly from the source modules.
+"""
+import hashlib
+import os
+import sys
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+from ics_stream import (  # noqa: E402
+    IcsStreamError,
+    IcsTimezones,
+    RecurrenceCache,
+    extract_window_occurrences,
+    iter_occurrences,
+    iter_unfolded_lines,
+    iter_vevents,
+    prefilter_ics_window,
+    split_content_line,
+)
+
+VTIMEZONE = (
+    "BEGIN:VTIMEZONE\r\nTZID:FLE Standard Time\r\n"
+    "BEGIN:STANDARD\r\nDTSTART:16010101T040000\r\nTZOFFSETFROM:+0300\r\nTZOFFSETTO:+0200\r\n"
+    "RRULE:FREQ=YEARLY;BYDAY=-1SU;BYMONTH=10\r\nEND:STANDARD\r\n"
+    "BEGIN:DAYLIGHT\r\nDTSTART:16010101T030000\r\nTZOFFSETFROM:+0200\r\nTZOFFSETTO:+0300\r\n"
+    "RRULE:FREQ=YEARLY;BYDAY=-1SU;BYMONTH=3\r\nEND:DAYLIGHT\r\nEND:VTIMEZONE\r\n"
+)
+
+
+def _feed(*vevents, prefix=""):
+    body = "".join(f"BEGIN:VEVENT\r\n{v}END:VEVENT\r\n" for v in vevents)
+    return f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\n{prefix}{body}END:VCALENDAR\r\n"
+
+
+def _only(feed):
+    timezones = IcsTimezones()
+    (event,) = list(iter_vevents(feed, timezones))
+    return event, event.span(timezones)
+
+
+def test_unfolds_continuation_lines():
+    text = "DESCRIPTION:long\r\n  folded\r\n\ttext\r\n\r\nSUMMARY:x\n"
+    assert list(iter_unfolded_lines(text)) == ["DESCRIPTION:long foldedtext", "SUMMARY:x"]
+
+
+def test_quoted_parameter_may_contain_colon():
+    name, params, value = split_content_line('ATTENDEE;CN="Doe: Jane";ROLE=CHAIR:mailto:j@x.org')
+    assert name == "ATTENDEE"
+    assert params == {"CN": "Doe: Jane", "ROLE": "CHAIR"}
+    assert value == "mailto:j@x.org"
+
+
+def test_text_fields_are_unescaped():
+    event, _ = _only(_feed(
+        "UID:1\r\nSUMMARY:Math\\, room 1\\nline2\r\nLOCATION:A\\;B\r\nDTSTART:20250602T090000Z\r\n"
+    ))
+    assert event.summary == "Math, room 1\nline2"
+    assert event.location == "A;B"
+
+
+def test_tzid_from_iana_and_from_vtimezone():
+    feed = _feed(
+        "UID:iana\r\nDTSTART;TZID=Europe/Helsinki:20250602T090000\r\n"
+        "DTEND;TZID=Europe/Helsinki:20250602T100000\r\n",
+        "UID:outlook\r\nDTSTART;TZID=FLE Standard Time:20250602T090000\r\n"
+        "DTEND;TZID=FLE Standard Time:20250602T100000\r\n",
+        prefix=VTIMEZONE,
+    )
+    timezones = IcsTimezones()
+    spans = [e.span(timezones) for e in iter_vevents(feed, timezones)]
+
+    assert "FLE Standard Time" in timezones
+    for begin, end in spans:
+        assert begin.isoformat() == "2025-06-02T09:00:00+03:00"
+        assert end - begin == timedelta(hours=1)
+
+
+@pytest.mark.parametrize("props, expected", [
+    ("DTSTART;VALUE=DATE:20250603\r\n", ("2025-06-03T00:00:00+00:00", "2025-06-04T00:00:00+00:00")),
+    ("DTSTART;VALUE=DATE:20250603\r\nDTEND;VALUE=DATE:20250605\r\n",
+     ("2025-06-03T00:00:00+00:00", "2025-06-05T00:00:00+00:00")),
+    ("DTSTART:20250603T100000Z\r\nDURATION:PT1H30M\r\n",
+     ("2025-06-03T10:00:00+00:00", "2025-06-03T11:30:00+00:00")),
+    ("DTSTART:20250603T100000Z\r\n", ("2025-06-03T10:00:00+00:00", "2025-06-03T10:00:00+00:00")),
+    ("DTSTART:20250603T100000\r\n", ("2025-06-03T10:00:00+00:00", "2025-06-03T10:00:00+00:00")),
+])
+def test_span_matches_ics_library_rules(props, expected):
+    _, (begin, end) = _only(_feed("UID:1\r\n" + props))
+    assert (begin.isoformat(), end.isoformat()) == expected
+
+
+def test_light_record_fields_and_nested_alarm_ignored():
+    event, _ = _only(_feed(
+        "UID:abc\r\nSEQUENCE:3\r\nSUMMARY:Lesson\r\nDTSTART:20250603T100000Z\r\n"
+        "LAST-MODIFIED:20250101T120000Z\r\n"
+        "BEGIN:VALARM\r\nDESCRIPTION:Reminder\r\nTRIGGER:-PT15M\r\nEND:VALARM\r\n"
+    ))
+    assert (event.uid, event.sequence, event.summary) == ("abc", 3, "Lesson")
+    assert event.description is None
+    assert event.last_modified.value == "20250101T120000Z"
+
+
+def test_events_are_yielded_before_the_feed_ends():
+    feed = _feed("UID:1\r\nDTSTART:20250603T100000Z\r\n") + "END:VEVENT\r\n"
+    stream = iter_vevents(feed)
+
+    assert next(stream).uid == "1"
+    with pytest.raises(IcsStreamError):
+        next(stream)
+
+
+def test_prefilter_drops_blocks_outside_window_and_keeps_vtimezone():
+    feed = _feed(
+        "UID:past\r\nDTSTART:20240102T090000Z\r\n",
+        "UID:in\r\nDTSTART;TZID=FLE Standard Time:20250103T090000\r\n",
+        "UID:future\r\nDTSTART;VALUE=DATE:20250301\r\n",
+        "UID:weekly\r\nDTSTART:20240102T090000Z\r\nRRULE:FREQ=WEEKLY;BYDAY=TU\r\n",
+        "UID:ended\r\nDTSTART:20240102T090000Z\r\nRRULE:FREQ=WEEKLY;UNTIL=20240601T000000Z\r\n",
+        "UID:moved\r\nDTSTART:20250220T090000Z\r\nRECURRENCE-ID:20250104T090000Z\r\n",
+        "UID:nostart\r\nSUMMARY:odd\r\n",
+        prefix=VTIMEZONE,
+    )
+
+    filtered = prefilter_ics_window(feed, date(2025, 1, 1), date(2025, 1, 7))
+
+    assert [e.uid for e in iter_vevents(filtered)] == ["in", "weekly", "moved", "nostart"]
+    assert "TZID:FLE Standard Time" in filtered and "END:VCALENDAR" in filtered
+
+
+WEEKLY = (
+    "UID:w\r\nSUMMARY:Weekly\r\nDTSTART;TZID=Europe/Helsinki:20250303T090000\r\n"
+    "DTEND;TZID=Europe/Helsinki:20250303T100000\r\nRRULE:FREQ=WEEKLY;UNTIL=20250420\r\n"
+    "EXDATE;TZID=Europe/Helsinki:20250317T090000\r\n"
+)
+
+
+def test_recurring_series_expanded_with_exdate_and_overrides():
+    feed = _feed(
+        WEEKLY,
+        "UID:w\r\nRECURRENCE-ID;TZID=Europe/Helsinki:20250324T090000\r\nSUMMARY:Weekly moved\r\n"
+        "DTSTART;TZID=Europe/Helsinki:20250325T120000\r\nDTEND;TZID=Europe/Helsinki:20250325T130000\r\n",
+        "UID:w\r\nRECURRENCE-ID;TZID=Europe/Helsinki:20250407T090000\r\nSTATUS:CANCELLED\r\n"
+        "DTSTART;TZID=Europe/Helsinki:20250407T090000\r\n",
+        "UID:r\r\nSUMMARY:Extra\r\nDTSTART:20250101T120000Z\r\nRDATE:20250312T120000Z,20250601T120000Z\r\n",
+    )
+
+    rows = extract_window_occurrences(feed, date(2025, 3, 10), date(2025, 4, 30))
+
+    assert [(r[0], r[1]) for r in rows] == [
+        ("Weekly moved", "2025-03-25T12:00:00+02:00"),
+        ("Weekly", "2025-03-10T09:00:00+02:00"),
+        ("Weekly", "2025-03-31T09:00:00+03:00"),  # wall time kept across DST
+        ("Weekly", "2025-04-14T09:00:00+03:00"),
+        ("Extra", "2025-03-12T12:00:00+00:00"),
+    ]
+
+
+def test_occurrences_are_lazy_and_cached_once_consumed():
+    event, _ = _only(_feed("UID:d\r\nDTSTART:20200101T080000Z\r\nRRULE:FREQ=DAILY\r\n"))
+    cache = RecurrenceCache()
+
+    partial = iter_occurrences(event, None, date(2025, 1, 1), date(2025, 1, 31), cache=cache)
+    assert next(partial)[0].isoformat() == "2025-01-01T08:00:00+00:00"
+    partial.close()
+    assert cache.get_stats()["entries"] == 0
+
+    assert len(list(iter_occurrences(event, None, date(2025, 1, 1), date(2025, 1, 31), cache=cache))) == 31
+    assert len(list(iter_occurrences(event, None, date(2025, 1, 1), date(2025, 1, 31), cache=cache))) == 31
+    assert cache.get_stats()["hits"] == 1
+
+    event.sequence = 1
+    list(iter_occurrences(event, None, date(2025, 1, 1), date(2025, 1, 31), cache=cache))
+    assert cache.get_stats()["entries"] == 2
+
+
+@pytest.fixture
+def plain_titles(monkeypatch):
+    monkeypatch.setattr(events, "simplify_event_title", lambda title: title)
+    monkeypatch.setattr(events, "ICS_STREAM_PARSER", True)
+
+
+def test_process_uses_stream_and_filters_window(plain_titles, monkeypatch):
+    monkeypatch.setattr(events, "_parse_ics_calendar", lambda *a: pytest.fail("ics library used"))
+    feed = _feed(
+        "UID:in\r\nSUMMARY:Lesson\r\nLOCATION:B12\r\nDTSTART:20250102T090000Z\r\nDTEND:20250102T100000Z\r\n",
+        "UID:out\r\nSUMMARY:Old\r\nDTSTART:20240102T090000Z\r\nDTEND:20240102T100000Z\r\n",
+    )
+
+    result = events._parse_ics_events(feed, "https://x/cal.ics", date(2025, 1, 1), date(2025, 1, 7))
+
+    assert [e["summary"] for e in result] == ["Lesson"]
+    expected_id = hashlib.md5(
+        "Lesson|2025-01-02T09:00:00+00:00|2025-01-02T10:00:00+00:00|B12".encode("utf-8")
+    ).hexdigest()
+    assert result[0]["id"] == expected_id
+    assert result[0]["start"] == {"dateTime": "2025-01-02T09:00:00+00:00"}
+
+
+def test_broken_structure_falls_back_to_ics_library(plain_titles, monkeypatch):
+    fake_event = MagicMock(
+        begin=datetime(2025, 1, 2, 9, tzinfo=timezone.utc),
+        end=datetime(2025, 1, 2, 10, tzinfo=timezone.utc),
+        location="", description="",
+    )
+    fake_event.name = "Fallback"
+    parsed = []
+    monkeypatch.setattr(events, "_parse_ics_calendar",
+                        lambda content, url: parsed.append(content) or MagicMock(events=[fake_event]))
+    before = events.get_metrics_summary()["ics_stream_fallbacks"]
+    feed = (
+        "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nUID:old\r\nDTSTART:20200102T090000Z\r\nEND:VEVENT\r\n"
+        "BEGIN:VEVENT\r\nDTSTART:20250102T090000Z\r\nEND:VTODO\r\nEND:VCALENDAR\r\n"
+    )
+
+    result = events._parse_ics_events(feed, "https://x/cal.ics", date(2025, 1, 1), date(2025, 1, 7))
+
+    assert [e["summary"] for e in result] == ["Fallback"]
+    assert events.get_metrics_summary()["ics_stream_fallbacks"] == before + 1
+    assert "UID:old" not in parsed[0], "the ics library only sees in-window blocks"
@@ -0,0 +1,171 @@
+"""
+Tests for the persisted calendar metadata cache (metadata_cache.py + events.py).
+
+Covers entries surviving a restart, per-entry TTLs for successes and each
+error type, refresh-ahead before expiry, and the background refresh pass
+renaming loaded calendars in place while never replacing good metadata
+with a failed probe.
+
+Uses pytest and imports directly from the source modules.
+"""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+from fetch_fanout import FetchFanout  # noqa: E402
+from metadata_cache import DEFAULT_ERROR_TTL, ERROR_TTLS, CalendarMetadataCache  # noqa: E402
+
+HOUR = 3600
+
+
+def _ago(seconds):
+    return time.time() - seconds
+
+
+def test_entries_survive_a_restart(tmp_path):
+    path = str(tmp_path / "meta.json")
+    CalendarMetadataCache(path)["ics_https://a.test/x.ics"] = {"type": "ics", "name": "x.ics"}
+
+    restarted = CalendarMetadataCache(path)
+
+    assert restarted["ics_https://a.test/x.ics"]["name"] == "x.ics"
+    assert "cached_at" in restarted["ics_https://a.test/x.ics"]
+
+
+def test_each_outcome_has_its_own_ttl(tmp_path):
+    cache = CalendarMetadataCache(str(tmp_path / "meta.json"), success_ttl=2 * HOUR)
+    cache["ok"] = {"name": "ok", "cached_at": _ago(HOUR)}
+    cache["stale"] = {"name": "stale", "cached_at": _ago(3 * HOUR)}
+    cache["gone"] = {"error": True, "error_type": "not_found", "cached_at": _ago(3 * HOUR)}
+    cache["blip"] = {"error": True, "error_type": "timeout", "cached_at": _ago(DEFAULT_ERROR_TTL + 1)}
+    cache["no_head"] = {"error": True, "error_type": "method_not_allowed", "cached_at": _ago(12 * HOUR)}
+
+    assert "ok" in cache
+    assert "stale" not in cache
+    assert cache.get("gone")["error_type"] == "not_found"
+    assert cache.get("blip") is None
+    assert "no_head" in cache
+    assert ERROR_TTLS["not_found"] < ERROR_TTLS["method_not_allowed"]
+
+
+def test_expired_entries_are_dropped_on_load(tmp_path):
+    path = str(tmp_path / "meta.json")
+    cache = CalendarMetadataCache(path, success_ttl=HOUR)
+    cache["old"] = {"name": "old", "cached_at": _ago(2 * HOUR)}
+    cache["new"] = {"name": "new"}
+
+    assert len(CalendarMetadataCache(path, success_ttl=HOUR)) == 1
+
+
+def test_needs_refresh_before_expiry(tmp_path):
+    cache = CalendarMetadataCache(str(tmp_path / "meta.json"), success_ttl=10 * HOUR)
+    cache["young"] = {"name": "young", "cached_at": _ago(HOUR)}
+    cache["due"] = {"name": "due", "cached_at": _ago(9 * HOUR)}
+
+    assert not cache.needs_refresh("young")
+    assert cache.needs_refresh("due")
+    assert cache.get("due") is not None  # still served while it's refreshed
+    assert cache.needs_refresh("missing")
+
+
+@pytest.fixture
+def loaded(monkeypatch, tmp_path):
+    cache = CalendarMetadataCache(str(tmp_path / "meta.json"), success_ttl=10 * HOUR)
+    monkeypatch.setattr(events, "_calendar_metadata_cache", cache)
+    monkeypatch.setattr(events, "_fetch_fanout", FetchFanout())
+    url = "https://a.test/team.ics"
+    cache[f"ics_{url}"] = {"type": "ics", "id": url, "name": "Old name", "cached_at": _ago(9 * HOUR)}
+    cache["google_fresh"] = {"type": "google", "id": "fresh", "name": "Fresh"}
+    grouped = {
+        "A": [{"type": "ics", "id": url, "name": "Old name", "tag": "A"}],
+        "B": [{"type": "ics", "id": url, "name": "Old name", "tag": "B"},
+              {"type": "google", "id": "fresh", "name": "Fresh", "tag": "B"}],
+    }
+    monkeypatch.setattr(events, "GROUPED_CALENDARS", grouped)
+    monkeypatch.setattr(events, "fetch_google_calendar_metadata",
+                        lambda *a, **k: pytest.fail("fresh entry re-probed"))
+    return cache, url, grouped
+
+
+def test_refresh_renames_loaded_calendars_in_place(loaded, monkeypatch):
+    cache, url, grouped = loaded
+    probes = []
+
+    def fake_ics_meta(u, refresh=False):
+        probes.append((u, refresh))
+        result = {"type": "ics", "id": u, "name": "New name"}
+        cache[f"ics_{u}"] = result
+        return result
+
+    monkeypatch.setattr(events, "fetch_ics_calendar_metadata", fake_ics_meta)
+
+    assert asyncio.run(events.refresh_calendar_metadata_async()) == 1
+
+    assert probes == [(url, True)]
+    assert grouped["A"][0]["name"] == "New name" and grouped["A"][0]["tag"] == "A"
+    assert grouped["B"][0]["name"] == "New name" and grouped["B"][0]["tag"] == "B"
+    assert not cache.needs_refresh(f"ics_{url}")
+
+
+def test_failed_refresh_keeps_good_metadata(loaded, monkeypatch):
+    cache, url, grouped = loaded
+
+    def failing_ics_meta(u, refresh=False):
+        result = {"type": "ics", "id": u, "name": "ICS Calendar (Timeout)", "error": True,
+                  "error_type": "timeout"}
+        cache[f"ics_{u}"] = result
+        return result
+
+    monkeypatch.setattr(events, "fetch_ics_calendar_metadata", failing_ics_meta)
+
+    assert asyncio.run(events.refresh_calendar_metadata_async()) == 0
+
+    assert grouped["A"][0]["name"] == "Old name"
+    assert cache[f"ics_{url}"]["name"] == "Old name"
+
+
+def test_refresh_counter_survives_metrics_reset(loaded, monkeypatch):
+    cache, url, _ = loaded
+    monkeypatch.setattr(events, "_calendar_metrics", events._new_metrics())
+
+    def fake_ics_meta(u, refresh=False):
+        result = {"type": "ics", "id": u, "name": "New name"}
+        cache[f"ics_{u}"] = result
+        return result
+
+    monkeypatch.setattr(events, "fetch_ics_calendar_metadata", fake_ics_meta)
+    events.reset_metrics()
+    assert events.get_metrics_summary()["metadata_refreshes"] == 0
+
+    asyncio.run(events.refresh_calendar_metadata_async())
+
+    assert events.get_metrics_summary()["metadata_refreshes"] == 1
@@ -0,0 +1,175 @@
+"""
+Tests for adaptive change-detection polling (poll_scheduler.py + events.py).
+
+Covers back-off on unchanged sources, tightening after a change, the
+floor/ceiling bounds, feed and HTTP refresh hints raising the lower bound,
+failed polls keeping their interval, and the ICS fetch path passing
+X-PUBLISHED-TTL / Cache-Control hints to the scheduler.
+
+Uses pytest and imports directly from the source modules.
+"""
+import os
+import sys
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import http_pool  # noqa: E402
+import events  # noqa: E402
+from feed_cache import FeedValidatorCache, ParsedFeedCache  # noqa: E402
+from host_profiles import HostProfileStore  # noqa: E402
+from host_scheduler import HostScheduler  # noqa: E402
+from poll_scheduler import (  # noqa: E402
+    PollScheduler,
+    cache_control_max_age,
+    feed_refresh_hint,
+    parse_ics_duration,
+)
+
+SRC = "https://example.test/calendar.ics"
+
+
+def test_parse_ics_duration():
+    assert parse_ics_duration("PT1H") == 3600
+    assert parse_ics_duration("P1D") == 86400
+    assert parse_ics_duration("P1W") == 7 * 86400
+    assert parse_ics_duration("pt1h30m") == 5400
+    assert parse_ics_duration("P") is None
+    assert parse_ics_duration("one hour") is None
+
+
+def test_feed_refresh_hint_reads_calendar_header_only():
+    body = (
+        b"BEGIN:VCALENDAR\r\nX-PUBLISHED-TTL:PT6H\r\nREFRESH-INTERVAL;VALUE=DURATION:PT2H\r\n"
+        b"BEGIN:VEVENT\r\nX-PUBLISHED-TTL:P7D\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+    )
+    assert feed_refresh_hint(body) == 6 * 3600
+    assert feed_refresh_hint(b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nEND:VCALENDAR\r\n") is None
+
+
+def test_cache_control_max_age():
+    assert cache_control_max_age("public, max-age=1800") == 1800
+    assert cache_control_max_age("max-age=0") is None
+    assert cache_control_max_age("no-store, max-age=600") is None
+    assert cache_control_max_age(None) is None
+
+
+def test_backs_off_on_stable_source_up_to_ceiling():
+    sched = PollScheduler(floor=300, ceiling=1000)
+    now = 0.0
+    intervals = []
+    for _ in range(5):
+        assert sched.is_due(SRC, now)
+        sched.record(SRC, "same", now)
+        intervals.append(sched.interval(SRC))
+        assert not sched.is_due(SRC, now + intervals[-1] - 1)
+        now += intervals[-1]
+
+    assert intervals == [300, 600, 1000, 1000, 1000]
+
+
+def test_change_tightens_to_floor():
+    sched = PollScheduler(floor=300, ceiling=3600)
+    for i in range(4):
+        sched.record(SRC, "v1", now=i * 10000)
+    assert sched.interval(SRC) == 2400
+
+    assert sched.record(SRC, "v2", now=50000) is True
+    assert sched.interval(SRC) == 300
+    assert sched.get_stats()["at_floor"] == 1
+
+
+def test_hints_raise_the_lower_bound_within_ceiling():
+    sched = PollScheduler(floor=300, ceiling=3600)
+    sched.note_feed_hint(SRC, 1200)
+    sched.record(SRC, "v1", now=0)
+    assert sched.interval(SRC) == 1200
+
+    sched.note_http_hint(SRC, 86400)
+    sched.record(SRC, "v2", now=10000)
+    assert sched.interval(SRC) == 3600
+
+
+def test_failure_keeps_interval():
+    sched = PollScheduler(floor=300, ceiling=3600)
+    sched.record(SRC, "v1", now=0)
+    sched.record(SRC, "v1", now=300)
+    sched.record_failure(SRC, now=1000)
+
+    assert sched.interval(SRC) == 600
+    assert not sched.is_due(SRC, 1500)
+    assert sched.is_due(SRC, 1600)
+
+
+def test_record_source_poll_detects_changes(monkeypatch):
+    monkeypatch.setattr(events, "_poll_scheduler", PollScheduler(floor=60, ceiling=600))
+    lesson = {"summary": "Lesson", "start": {"dateTime": "2025-01-02T09:00:00Z"},
+              "end": {"dateTime": "2025-01-02T10:00:00Z"}}
+    moved = {**lesson, "start": {"dateTime": "2025-01-02T11:00:00Z"}}
+
+    assert events.record_source_poll(SRC, [lesson]) is False
+    assert events.record_source_poll(SRC, [dict(lesson)]) is False
+    assert events.get_source_poll_interval(SRC) == 120
+    assert events.record_source_poll(SRC, [moved]) is True
+    assert events.get_source_poll_interval(SRC) == 60
+    assert events.is_source_poll_due(SRC) is False
+
+
+class FakeResp:
+    def __init__(self, body, headers):
+        self.status_code = 200
+        self.content = body
+        self.headers = headers
+        self.encoding = "utf-8"
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        yield self.content
+
+    def close(self):
+        pass
+
+
+def test_ics_fetch_passes_hints_to_scheduler(monkeypatch, tmp_path):
+    body = b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nX-PUBLISHED-TTL:PT1H\r\nEND:VCALENDAR\r\n"
+    sched = PollScheduler(floor=60, ceiling=86400)
+    monkeypatch.setattr(events, "_poll_scheduler", sched)
+    monkeypatch.setattr(http_pool, "get", lambda url, **kw: FakeResp(body, {"Cache-Control": "max-age=7200"}))
+    monkeypatch.setattr(time, "sleep", lambda *a, **k: None)
+    monkeypatch.setattr(events, "_feed_cache", FeedValidatorCache(str(tmp_path)))
+    monkeypatch.setattr(events, "_parsed_feed_cache", ParsedFeedCache())
+    monkeypatch.setattr(events, "_host_profiles", HostProfileStore(str(tmp_path / "hosts.json")))
+    monkeypatch.setattr(events, "_host_scheduler", HostScheduler(min_interval=0))
+    events._calendar_breakers.record_success(SRC)
+
+    assert events._fetch_ics_content(SRC) is not None
+    sched.record(SRC, "v1", now=0)
+
+    assert sched.interval(SRC) == 7200
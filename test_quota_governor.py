@@ -0,0 +1,164 @@
+"""
+Tests for the Google API quota governor (quota_governor.py + events.py).
+
+Covers token-bucket pacing (callers queue rather than fail), the reserve
+background calls leave for interactive ones, interactive callers jumping
+the queue, the context-variable priority reaching worker threads, and
+retry_api_call paying for every attempt and draining the buckets on a
+rate-limit response.
+
+Uses pytest and imports directly from the source modules.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+sys.modules.setdefault('googleapiclient.errors', MagicMock())
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+from quota_governor import (  # noqa: E402
+    BACKGROUND, INTERACTIVE, QuotaGovernor, api_priority, current_api_priority,
+)
+
+
+class _HttpError(Exception):
+    def __init__(self, status, message=""):
+        self.resp = MagicMock(status=status)
+        super().__init__(f"HTTP Error {status} {message}")
+
+
+def _governor(per_minute: float, reserve: float = 0.0) -> QuotaGovernor:
+    return QuotaGovernor(project_per_minute=per_minute * 10, user_per_minute=per_minute,
+                         background_reserve=reserve)
+
+
+def test_calls_queue_until_tokens_refill():
+    # 600/min = 10 tokens/s with a burst of 600; drain it, then one more call waits ~0.1s
+    governor = _governor(600)
+    for _ in range(600):
+        assert governor.acquire(priority=INTERACTIVE) == 0.0
+    waited = governor.acquire(priority=INTERACTIVE)
+    assert 0.05 <= waited < 1.0
+    stats = governor.get_stats()
+    assert stats["waits"] == 1
+    assert stats["granted_interactive"] == 601
+    assert stats["tokens"]["user"] < 1
+
+
+def test_background_leaves_reserve_for_interactive():
+    governor = _governor(60, reserve=0.5)
+    for _ in range(30):
+        assert governor.acquire(priority=BACKGROUND) == 0.0
+    # Background is now at the reserve; interactive can still use it at once
+    for _ in range(30):
+        assert governor.acquire(priority=INTERACTIVE) == 0.0
+
+    blocked = threading.Thread(target=governor.acquire, kwargs={"priority": BACKGROUND}, daemon=True)
+    blocked.start()
+    blocked.join(timeout=0.2)
+    assert blocked.is_alive()
+    assert governor.get_stats()["waiting_background"] == 1
+
+
+def test_interactive_served_before_queued_background():
+    governor = _governor(600)
+    for _ in range(600):
+        governor.acquire(priority=INTERACTIVE)
+
+    order = []
+
+    def call(priority, label):
+        governor.acquire(priority=priority)
+        order.append(label)
+
+    background = [threading.Thread(target=call, args=(BACKGROUND, f"bg{i}")) for i in range(3)]
+    for t in background:
+        t.start()
+    time.sleep(0.02)
+    interactive = threading.Thread(target=call, args=(INTERACTIVE, "cmd"))
+    interactive.start()
+    for t in background + [interactive]:
+        t.join(timeout=5)
+    assert order[0] == "cmd"
+    assert sorted(order[1:]) == ["bg0", "bg1", "bg2"]
+
+
+def test_priority_follows_context_into_threads():
+    assert current_api_priority() == BACKGROUND
+
+    async def run():
+        with api_priority(INTERACTIVE):
+            return await asyncio.to_thread(current_api_priority)
+
+    assert asyncio.run(run()) == INTERACTIVE
+    assert current_api_priority() == BACKGROUND
+
+
+def test_batch_cost_is_capped_at_capacity():
+    governor = _governor(5)
+    assert governor.acquire(cost=50, priority=INTERACTIVE) == 0.0
+    assert governor.get_stats()["tokens"]["user"] < 1
+
+
+@pytest.fixture
+def quota(monkeypatch):
+    governor = _governor(6000)
+    monkeypatch.setattr(events, "_google_quota", governor)
+    monkeypatch.setattr(events, "HttpError", _HttpError)
+    monkeypatch.setattr(events.time, "sleep", lambda s: None)
+    return governor
+
+
+def test_retry_api_call_pays_per_attempt(quota):
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise _HttpError(503)
+        return "ok"
+
+    assert events.retry_api_call(flaky, max_retries=3, quota_cost=4) == "ok"
+    assert quota.get_stats()["granted_background"] == 3
+    assert quota.get_stats()["tokens"]["user"] == pytest.approx(6000 - 12, abs=1)
+
+
+def test_rate_limit_drains_buckets_and_retries(quota):
+    calls = []
+
+    def limited():
+        calls.append(1)
+        if len(calls) == 1:
+            raise _HttpError(403, "userRateLimitExceeded")
+        return "ok"
+
+    assert events.retry_api_call(limited) == "ok"
+    assert quota.get_stats()["throttles"] == 1
+
+
+def test_client_errors_are_not_retried(quota):
+    def forbidden():
+        raise _HttpError(404)
+
+    with pytest.raises(_HttpError):
+        events.retry_api_call(forbidden)
+    assert quota.get_stats()["granted_background"] == 1
+    assert quota.get_stats()["throttles"] == 0
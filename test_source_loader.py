@@ -0,0 +1,161 @@
+"""
+Tests for the background calendar source loader (events.py).
+
+Covers probing every source concurrently instead of one by one, each tag
+becoming available as soon as its own sources resolve, config order being
+restored once the load finishes, the warm-up flag, reusing a load already
+in progress, and reloads keeping old metadata until the new load lands.
+
+Uses pytest and imports directly from the source modules.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+from fetch_fanout import FetchFanout  # noqa: E402
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    """Fresh loader state with fake probes; returns (sources, delays, probed)."""
+    sources = [
+        ("ics", "https://a.test/slow.ics", "SLOW"),
+        ("ics", "https://b.test/fast.ics", "FAST"),
+        ("google", "cal@group.calendar.google.com", "FAST"),
+    ]
+    delays = {"https://a.test/slow.ics": 0.3}
+    probed = []
+    lock = threading.Lock()
+
+    def fake_ics_meta(url):
+        with lock:
+            probed.append(url)
+        time.sleep(delays.get(url, 0.05))
+        return {"type": "ics", "id": url, "name": url.rsplit("/", 1)[-1]}
+
+    def fake_google_batch(ids):
+        return {cid: {"type": "google", "id": cid, "name": "Team"} for cid in ids}
+
+    monkeypatch.setattr(events, "parse_calendar_sources", lambda: list(sources))
+    monkeypatch.setattr(events, "fetch_ics_calendar_metadata", fake_ics_meta)
+    monkeypatch.setattr(events, "fetch_google_calendar_metadata_batch", fake_google_batch)
+    monkeypatch.setattr(events, "_fetch_fanout", FetchFanout(concurrency=8, per_host=4))
+    monkeypatch.setattr(events, "GROUPED_CALENDARS", {})
+    monkeypatch.setattr(events, "_pending_source_tags", set())
+    monkeypatch.setattr(events, "_sources_loaded", False)
+    monkeypatch.setattr(events, "_source_load_task", None)
+    return sources, delays, probed
+
+
+def test_probes_sources_concurrently(loader):
+    _, delays, _ = loader
+    delays["https://b.test/fast.ics"] = 0.3
+
+    started = time.monotonic()
+    grouped = asyncio.run(events.load_calendar_sources_async())
+
+    assert time.monotonic() - started < 0.55
+    assert grouped is events.GROUPED_CALENDARS
+    assert [m["name"] for m in grouped["FAST"]] == ["fast.ics", "Team"]
+    assert all(m["tag"] == "FAST" for m in grouped["FAST"])
+
+
+def test_tags_become_ready_as_they_resolve(loader):
+    async def main():
+        task = events.start_calendar_source_loading()
+        await asyncio.sleep(0.15)
+        midway = (events.sources_warming_up(), dict(events.GROUPED_CALENDARS),
+                  events.get_source_load_status())
+        await task
+        return midway
+
+    warming, grouped, status = asyncio.run(main())
+
+    assert warming is True
+    assert list(grouped) == ["FAST"]
+    assert status["pending_tags"] == ["SLOW"]
+    assert events.sources_warming_up() is False
+    # Config order is restored once every tag has resolved
+    assert list(events.GROUPED_CALENDARS) == ["SLOW", "FAST"]
+    assert events.get_source_load_status()["pending_tags"] == []
+
+
+def test_failed_probe_only_drops_that_source(loader, monkeypatch):
+    real_probe = events.fetch_ics_calendar_metadata
+
+    def flaky(url):
+        if "fast" in url:
+            raise RuntimeError("boom")
+        return real_probe(url)
+
+    monkeypatch.setattr(events, "fetch_ics_calendar_metadata", flaky)
+    asyncio.run(events.load_calendar_sources_async())
+
+    assert [m["name"] for m in events.GROUPED_CALENDARS["FAST"]] == ["Team"]
+    assert [m["name"] for m in events.GROUPED_CALENDARS["SLOW"]] == ["slow.ics"]
+
+
+def test_start_reuses_a_load_in_progress(loader):
+    _, _, probed = loader
+
+    async def main():
+        first = events.start_calendar_source_loading()
+        second = events.start_calendar_source_loading(reload=True)
+        await first
+        third = events.start_calendar_source_loading()
+        return first, second, third
+
+    first, second, third = asyncio.run(main())
+
+    assert first is second is third
+    assert len(probed) == 2
+
+
+def test_reload_keeps_old_metadata_until_resolved(loader):
+    events.GROUPED_CALENDARS.update({"SLOW": [{"id": "old", "name": "Old"}], "GONE": [{"id": "x"}]})
+    events._sources_loaded = True
+
+    async def main():
+        await asyncio.sleep(0)
+        task = events.start_calendar_source_loading(reload=True)
+        await asyncio.sleep(0.15)
+        midway = dict(events.GROUPED_CALENDARS)
+        await task
+        return midway
+
+    midway = asyncio.run(main())
+
+    assert midway["SLOW"] == [{"id": "old", "name": "Old"}]
+    assert events.sources_warming_up() is False
+    assert list(events.GROUPED_CALENDARS) == ["SLOW", "FAST"]
+    assert events.GROUPED_CALENDARS["SLOW"][0]["name"] == "slow.ics"
@@ -0,0 +1,180 @@
+"""
+Tests for fair tag scheduling in change detection (tasks.py).
+
+Covers tags being checked least-recently-checked first, the per-cycle fetch
+budget replacing the old three-tag cap so every tag is reached within a
+bounded number of cycles, the time budget stopping further waves, and a
+failed fetch not counting as a check, including through the real
+get_events_async path, where a failed source keeps its previous events.
+
+Uses pytest and imports directly from the source modules.
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock heavy dependencies before importing events
+sys.modules.setdefault('ics', MagicMock())
+sys.modules.setdefault('google.oauth2', MagicMock())
+sys.modules.setdefault('google.oauth2.service_account', MagicMock())
+sys.modules.setdefault('googleapiclient', MagicMock())
+sys.modules.setdefault('googleapiclient.discovery', MagicMock())
+
+
+class _HttpError(Exception):
+    def __init__(self, resp, content):
+        self.resp = resp
+        self.content = content
+        super().__init__(f"HTTP Error {resp.status}")
+
+
+sys.modules.setdefault('googleapiclient.errors', MagicMock(HttpError=_HttpError))
+
+# Minimal env vars needed by events.py at import time
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test_token')
+os.environ.setdefault('ANNOUNCEMENT_CHANNEL_ID', '123456789')
+os.environ.setdefault('CALENDAR_SOURCES', 'google:test@test.com:TEST')
+os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', '/tmp/test_creds.json')
+os.environ.setdefault('USER_TAG_MAPPING', '123:TEST')
+
+import events  # noqa: E402
+import tasks  # noqa: E402
+from poll_scheduler import PollScheduler  # noqa: E402
+
+
+def _grouped(tag_count, sources_per_tag=2):
+    return {
+        f"T{t}": [{"type": "ics", "id": f"https://h{t}.test/{s}.ics", "name": f"T{t}-{s}"}
+                  for s in range(sources_per_tag)]
+        for t in range(tag_count)
+    }
+
+
+@pytest.fixture
+def watcher(monkeypatch):
+    grouped = _grouped(6)
+    fetched = []
+    failing = set()
+
+    async def fake_fetch_sources(calendars, start, end, context="", skip_ids=frozenset()):
+        fetched.append([m["id"] for m in calendars])
+        return [None if m["id"] in failing else [{"summary": m["name"]}] for m in calendars]
+
+    async def no_prefetch(calendars, start, end, context=""):
+        return set()
+
+    monkeypatch.setattr(tasks, "GROUPED_CALENDARS", grouped)
+    monkeypatch.setattr(tasks, "_fetch_sources", fake_fetch_sources)
+    monkeypatch.setattr(tasks, "_prefetch_google_safe", no_prefetch)
+    monkeypatch.setattr(tasks, "_last_source_events", {})
+    monkeypatch.setattr(tasks, "_tag_last_checked", {})
+    monkeypatch.setattr(tasks, "WATCH_CYCLE_FETCHES", 4)
+    monkeypatch.setattr(tasks, "WATCH_CYCLE_SECONDS", 60)
+    monkeypatch.setattr(tasks, "FETCH_CONCURRENCY", 4)
+    monkeypatch.setattr(events, "_poll_scheduler", PollScheduler(floor=300, ceiling=3600))
+    return grouped, fetched, failing
+
+
+def _cycle():
+    return [tag for tag, _ in asyncio.run(tasks._poll_stalest_tags("start", "end"))]
+
+
+def test_every_tag_is_reached_within_bounded_cycles(watcher):
+    seen = [_cycle() for _ in range(3)]
+
+    assert seen == [["T0", "T1"], ["T2", "T3"], ["T4", "T5"]]
+
+
+def test_stalest_tag_goes_first(watcher):
+    tasks._tag_last_checked.update({"T0": 50.0, "T1": 40.0, "T3": 10.0})
+
+    # Never-checked tags first in config order, then by last check
+    assert _cycle() == ["T2", "T4"]
+    assert _cycle() == ["T5", "T3"]
+    assert _cycle() == ["T1", "T0"]
+
+
+def test_fetch_budget_splits_into_waves(watcher, monkeypatch):
+    _, fetched, _ = watcher
+    monkeypatch.setattr(tasks, "WATCH_CYCLE_FETCHES", 8)
+    monkeypatch.setattr(tasks, "FETCH_CONCURRENCY", 4)
+
+    assert _cycle() == ["T0", "T1", "T2", "T3"]
+    assert [len(wave) for wave in fetched] == [4, 4]
+
+
+def test_time_budget_stops_further_waves(watcher, monkeypatch):
+    _, fetched, _ = watcher
+    monkeypatch.setattr(tasks, "WATCH_CYCLE_FETCHES", 100)
+    monkeypatch.setattr(tasks, "WATCH_CYCLE_SECONDS", 0)
+
+    assert _cycle() == []
+    assert fetched == []
+
+
+def test_failed_fetch_is_not_a_check(watcher):
+    grouped, _, failing = watcher
+    failing.update(m["id"] for m in grouped["T0"])
+
+    _cycle()
+
+    assert "T0" not in tasks._tag_last_checked
+    assert "T1" in tasks._tag_last_checked
+
+
+@pytest.fixture
+def real_fetch(monkeypatch):
+    """Change detection over the real get_events_async, with ICS downloads stubbed."""
+    grouped = _grouped(2, sources_per_tag=1)
+    failing = set()
+
+    async def fake_ics_fetch(start_date, end_date, url):
+        if url in failing:
+            return None
+        return [{"id": url, "summary": url, "start": {"dateTime": "2026-03-02T09:00:00Z"},
+                 "end": {"dateTime": "2026-03-02T10:00:00Z"}}]
+
+    monkeypatch.setattr(events, "_fetch_ics_events_async", fake_ics_fetch)
+    monkeypatch.setattr(events, "_event_cache", events.EventCache(ttl=0))
+    monkeypatch.setattr(tasks, "GROUPED_CALENDARS", grouped)
+    monkeypatch.setattr(tasks, "is_source_poll_due", lambda source_id: True)
+    monkeypatch.setattr(tasks, "_last_source_events", {})
+    monkeypatch.setattr(tasks, "_tag_last_checked", {})
+    monkeypatch.setattr(tasks, "WATCH_CYCLE_FETCHES", 4)
+    monkeypatch.setattr(tasks, "WATCH_CYCLE_SECONDS", 60)
+    monkeypatch.setattr(events, "_poll_scheduler", PollScheduler(floor=300, ceiling=3600))
+    return grouped, failing
+
+
+def test_failed_real_fetch_keeps_previous_events(real_fetch):
+    grouped, failing = real_fetch
+    src = grouped["T0"][0]["id"]
+    _cycle()
+    _cycle()  # unchanged, so the interval backs off from the floor
+    previous = tasks._last_source_events[src]
+    checked = tasks._tag_last_checked["T0"]
+    interval = events.get_source_poll_interval(src)
+
+    failing.add(src)
+    _cycle()
+
+    assert tasks._last_source_events[src] is previous
+    assert tasks._tag_last_checked["T0"] == checked
+    assert tasks._tag_last_checked["T1"] > checked
+    # A failure is not a change: the interval is not reset to the floor
+    assert interval > 300
+    assert events.get_source_poll_interval(src) == interval
+
+
+def test_tag_with_only_failed_real_fetches_is_not_checked(real_fetch):
+    grouped, failing = real_fetch
+    failing.add(grouped["T0"][0]["id"])
+
+    _cycle()
+
+    assert "T0" not in tasks._tag_last_checked
+    assert grouped["T0"][0]["id"] not in tasks._last_source_events
+    assert "T1" in tasks._tag_last_checked
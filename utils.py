@@ -1,5 +1,7 @@
+from collections.abc import Mapping
 from datetime import datetime, timedelta, date
 from dateutil import tz
+from event_model import Event
 from log import logger  # Import logger from log.py
 import functools
 import re
@@ -133,6 +135,32 @@ def parse_date_string(date_str: str, default_timezone=None):
         return None
 
 
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║ 🕰️ event_start / event_end                                         ║
+# ║ Event times as parse_date_string reads them                        ║
+# ╚════════════════════════════════════════════════════════════════════╝
+def event_start(event, default_timezone=None):
+    """Start of an event (Event or dict) as a datetime, or None."""
+    return _event_time(event, "start", default_timezone)
+
+
+def event_end(event, default_timezone=None):
+    """End of an event (Event or dict) as a datetime, or None."""
+    return _event_time(event, "end", default_timezone)
+
+
+def _event_time(event, key: str, default_timezone):
+    if default_timezone is None:
+        default_timezone = get_local_timezone()
+    if isinstance(event, Event):
+        if key == "start":
+            return event.start_datetime(default_timezone)
+        return event.end_datetime(default_timezone)
+    when = event.get(key, {})
+    raw = when.get("dateTime", when.get("date", "")) if isinstance(when, Mapping) else ""
+    return parse_date_string(raw, default_timezone) if raw else None
+
+
 # ╔════════════════════════════════════════════════════════════════════╗
 # ║ 📝 format_event                                                    ║
 # ║ Converts an event dictionary into a stylized, readable string     ║
@@ -140,7 +168,7 @@ def parse_date_string(date_str: str, default_timezone=None):
 def format_event(event: dict) -> str:
     try:
         # Validate event data
-        if not event or not isinstance(event, dict):
+        if not event or not isinstance(event, Mapping):
             logger.warning(f"Invalid event data: {event}")
             return "⚠️ **Invalid event data**"
             
@@ -148,7 +176,7 @@ def format_event(event: dict) -> str:
         start_data = event.get("start", {})
         end_data = event.get("end", {})
         
-        if not isinstance(start_data, dict) or not isinstance(end_data, dict):
+        if not isinstance(start_data, Mapping) or not isinstance(end_data, Mapping):
             logger.warning(f"Invalid start/end data format in event: {event}")
             return "⚠️ **Invalid event format**"
             
@@ -180,15 +208,18 @@ def format_event(event: dict) -> str:
         local_timezone = get_local_timezone()
         start_str = "All Day"
         
+        # Normalized events carry their parsed times
+        parsed = isinstance(event, Event)
+
         if start and "T" in start:
-            start_dt = parse_date_string(start, local_timezone)
+            start_dt = event.start_datetime(local_timezone) if parsed else parse_date_string(start, local_timezone)
             if start_dt:
                 start_str = start_dt.strftime("%H:%M")
 
         # Parse end time
         end_str = ""
         if end and "T" in end:
-            end_dt = parse_date_string(end, local_timezone)
+            end_dt = event.end_datetime(local_timezone) if parsed else parse_date_string(end, local_timezone)
             if end_dt:
                 end_str = end_dt.strftime("%H:%M")
 
@@ -209,16 +240,20 @@ def format_event(event: dict) -> str:
 def is_in_current_week(event: dict, reference: date = None) -> bool:
     try:
         # Validate inputs
-        if not event or not isinstance(event, dict):
+        if not event or not isinstance(event, Mapping):
             return False
             
         reference = reference or get_today()
         monday = get_monday_of_week(reference)
         week_range = {monday + timedelta(days=i) for i in range(7)}
+
+        if isinstance(event, Event) and event.start_ts is not None:
+            dt = event.start_datetime(get_local_timezone())
+            return dt.date() in week_range
         
         # Get and validate start date
         start_data = event.get("start", {})
-        if not isinstance(start_data, dict):
+        if not isinstance(start_data, Mapping):
             return False
             
         start_str = start_data.get("dateTime", start_data.get("date", ""))
@@ -5,8 +5,9 @@ from datetime import timedelta
 
 import discord  # type: ignore
 
+from event_model import event_start_key
 from log import logger
-from utils import format_event, parse_date_string, get_local_timezone
+from utils import event_end, event_start, format_event, get_local_timezone
 
 # ---------------------------------------------------------------------------
 # Video-call link extraction
@@ -61,7 +62,7 @@ def build_event_pages(
             continue
         sorted_evts = sorted(
             events,
-            key=lambda e: e["start"].get("dateTime", e["start"].get("date", "")),
+            key=event_start_key,
         )
 
         # Split into chunks that fit one embed field each
@@ -124,7 +125,7 @@ def build_week_pages(
             continue
         sorted_evts = sorted(
             day_events,
-            key=lambda e: e["start"].get("dateTime", e["start"].get("date", "")),
+            key=event_start_key,
         )
 
         if field_n >= _MAX_FIELDS:
@@ -273,13 +274,9 @@ def _build_detail_embed(events: list[dict], color) -> discord.Embed:
         parts: list[str] = []
 
         # Time
-        start_data = event.get("start", {})
-        end_data = event.get("end", {})
         tz = get_local_timezone()
-        start_str = start_data.get("dateTime", start_data.get("date", ""))
-        end_str = end_data.get("dateTime", end_data.get("date", ""))
-        start_dt = parse_date_string(start_str, tz) if start_str else None
-        end_dt = parse_date_string(end_str, tz) if end_str else None
+        start_dt = event_start(event, tz)
+        end_dt = event_end(event, tz)
         if start_dt:
             time_text = start_dt.strftime("%A %B %d, %H:%M")
             if end_dt:
@@ -354,10 +351,7 @@ def format_change_lines(
             if len(title) > 47:
                 title = title[:44] + "..."
             # Time info
-            start_data = ev.get("start", {})
-            start_raw = start_data.get("dateTime", start_data.get("date", ""))
-            tz = get_local_timezone()
-            dt = parse_date_string(start_raw, tz) if start_raw else None
+            dt = event_start(ev, get_local_timezone())
             time_str = dt.strftime("%a %H:%M") if dt else ""
             lines.append(f"➖ ~~{title}~~ `{time_str}`")
             shown += 1
@@ -402,12 +396,8 @@ def _format_change_diff(old: dict, new: dict) -> str:
 
     # Time change
     tz = get_local_timezone()
-    old_start = parse_date_string(
-        old.get("start", {}).get("dateTime", old.get("start", {}).get("date", "")), tz
-    )
-    new_start = parse_date_string(
-        new.get("start", {}).get("dateTime", new.get("start", {}).get("date", "")), tz
-    )
+    old_start = event_start(old, tz)
+    new_start = event_start(new, tz)
     if old_start and new_start and old_start != new_start:
         diffs.append(f"was {old_start.strftime('%a %H:%M')}")
 